@@ -0,0 +1,217 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program defines the "BatchBoard" class, a batch of checkers positions held in one NumPy array so
+#              that thousands of positions can be scored at once. Each position is a row of six uint32 bitboards, one
+#              per piece type in PIECE_NAMES order, using the same 32 dark square layout as the "Bitboard" class.
+#              Piece counts, material, mobility and promotion checks are computed for the whole batch with array
+#              operations. Batches convert to and from "GameLogic" objects and to an (N, 8, 8) int8 grid.
+
+import numpy as np
+
+from CheckerBitboard import PIECES, PIECE_NAMES, square_location
+from CheckerGameLogic import GameLogic, KING_VALUE, PAWN_VALUE, TRIPLE_KING_VALUE
+
+# Column of each piece type in the batch array
+BLACK_PAWN, BLACK_KING, BLACK_TRIPLE_KING, WHITE_PAWN, WHITE_KING, WHITE_TRIPLE_KING = range(6)
+
+# Grid codes, positive for "Black" and negative for "White"
+GRID_CODES = (1, 2, 3, -1, -2, -3)
+
+# Square masks used to shift a whole bitboard one diagonal step. Even rows hold columns 1, 3, 5, 7 and odd rows hold
+# columns 0, 2, 4, 6, so the index change of a step depends on the row parity.
+_EVEN_ROWS = np.uint32(0x0F0F0F0F)
+_ODD_ROWS = np.uint32(0xF0F0F0F0)
+_EVEN_ROWS_NOT_RIGHT = np.uint32(0x07070707)
+_ODD_ROWS_NOT_LEFT = np.uint32(0xE0E0E0E0)
+
+# Row 0 and row 7, where "Black" and "White" pawns promote
+_ROW_0 = np.uint32(0x0000000F)
+_ROW_1 = np.uint32(0x000000F0)
+_ROW_6 = np.uint32(0x0F000000)
+_ROW_7 = np.uint32(0xF0000000)
+
+# Bits set in every byte value, for popcounts
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+# Grid coordinates of the 32 dark squares
+_SQUARE_ROWS = np.array([square_location(index)[0] for index in range(32)])
+_SQUARE_COLUMNS = np.array([square_location(index)[1] for index in range(32)])
+
+
+def popcount(bitboards):
+    """
+    Function that takes one parameter:
+    bitboards   = uint32 NumPy array of any shape
+
+    Returns an int32 array of the same shape holding the count of set bits of every bitboard.
+    """
+    bitboards = np.ascontiguousarray(bitboards, dtype=np.uint32)
+    counts = _BYTE_POPCOUNT[bitboards.view(np.uint8)].reshape(bitboards.shape + (4,))
+    return counts.sum(axis=-1, dtype=np.int32)
+
+
+def up_left(bitboards):
+    """Function that returns the bitboards with every piece moved one square up-left, pieces leaving the board lost."""
+    return ((bitboards & _EVEN_ROWS) >> 4) | ((bitboards & _ODD_ROWS_NOT_LEFT) >> 5)
+
+
+def up_right(bitboards):
+    """Function that returns the bitboards with every piece moved one square up-right."""
+    return ((bitboards & _EVEN_ROWS_NOT_RIGHT) >> 3) | ((bitboards & _ODD_ROWS) >> 4)
+
+
+def down_left(bitboards):
+    """Function that returns the bitboards with every piece moved one square down-left."""
+    return ((bitboards & _EVEN_ROWS) << 4) | ((bitboards & _ODD_ROWS_NOT_LEFT) << 3)
+
+
+def down_right(bitboards):
+    """Function that returns the bitboards with every piece moved one square down-right."""
+    return ((bitboards & _EVEN_ROWS_NOT_RIGHT) << 5) | ((bitboards & _ODD_ROWS) << 4)
+
+
+class BatchBoard:
+    """Represents a batch of checkers positions stored as an (N, 6) uint32 NumPy array of bitboards."""
+
+    def __init__(self, bitboards):
+        """
+        Constructor method that takes one parameter:
+        bitboards       = array-like of shape (N, 6), the piece masks of each position in PIECE_NAMES order
+
+        The following private data member is initialized:
+
+        bitboards       = the (N, 6) uint32 array
+        """
+        bitboards = np.asarray(bitboards, dtype=np.uint32)
+        if bitboards.ndim != 2 or bitboards.shape[1] != len(PIECE_NAMES):
+            raise ValueError(f"expected an (N, {len(PIECE_NAMES)}) array, got shape {bitboards.shape}")
+        self._bitboards = bitboards
+
+    @classmethod
+    def from_games(cls, games):
+        """
+        Class method that takes one parameter:
+        games       = an iterable of GameLogic (or Checkers) objects
+
+        Returns a BatchBoard holding the current position of every game, read straight from the board masks.
+        """
+        return cls([[game._board.get_mask(piece) for piece in PIECES] for game in games])
+
+    @classmethod
+    def from_grid(cls, grid):
+        """
+        Class method that takes one parameter:
+        grid        = array-like of shape (N, 8, 8) holding GRID_CODES, 0 for an empty square
+
+        Returns a BatchBoard holding the positions of the grid. Codes on light squares are ignored.
+        """
+        squares = np.asarray(grid, dtype=np.int8)[:, _SQUARE_ROWS, _SQUARE_COLUMNS]
+        weights = np.uint32(1) << np.arange(32, dtype=np.uint32)
+        bitboards = np.stack([((squares == code) * weights).sum(axis=1, dtype=np.uint32) for code in GRID_CODES],
+                             axis=1)
+        return cls(bitboards)
+
+    def get_bitboards(self):
+        """Class method that returns the (N, 6) uint32 array of the batch."""
+        return self._bitboards
+
+    def __len__(self):
+        return self._bitboards.shape[0]
+
+    def to_game(self, position):
+        """
+        Class method that takes one parameter:
+        position    = integer index of a position within the batch
+
+        Returns a new GameLogic object set up with that position. Player data members are not set.
+        """
+        game = GameLogic()
+        game._board.clear()
+        for column, piece in enumerate(PIECES):
+            game._board.set_mask(piece, int(self._bitboards[position, column]))
+        return game
+
+    def to_grid(self):
+        """Class method that returns the batch as an (N, 8, 8) int8 array of GRID_CODES, 0 for an empty square."""
+        grid = np.zeros((len(self), 8, 8), dtype=np.int8)
+        bits = (self._bitboards[:, :, None] >> np.arange(32, dtype=np.uint32)) & np.uint32(1)
+        for column, code in enumerate(GRID_CODES):
+            # Cast the bits before multiplying, a uint32 array cannot take the negative "White" codes
+            grid[:, _SQUARE_ROWS, _SQUARE_COLUMNS] += bits[:, column, :].astype(np.int8) * np.int8(code)
+        return grid
+
+    def color_masks(self):
+        """Class method that returns a (black, white) tuple of (N,) uint32 arrays of each color's pieces."""
+        bitboards = self._bitboards
+        black = bitboards[:, BLACK_PAWN] | bitboards[:, BLACK_KING] | bitboards[:, BLACK_TRIPLE_KING]
+        white = bitboards[:, WHITE_PAWN] | bitboards[:, WHITE_KING] | bitboards[:, WHITE_TRIPLE_KING]
+        return black, white
+
+    def piece_counts(self):
+        """Class method that returns an (N, 6) int32 array of the count of each piece type, in PIECE_NAMES order."""
+        return popcount(self._bitboards)
+
+    def material(self):
+        """
+        Class method that returns an (N,) int32 array of material scores from "Black"'s point of view, using the
+        same piece values as GameLogic.get_material.
+        """
+        values = np.array([PAWN_VALUE, KING_VALUE, TRIPLE_KING_VALUE,
+                           -PAWN_VALUE, -KING_VALUE, -TRIPLE_KING_VALUE], dtype=np.int32)
+        return self.piece_counts() @ values
+
+    def mobility(self):
+        """
+        Class method that returns a (black, white) tuple of (N,) int32 arrays approximating each color's count of
+        legal moves: single steps onto empty squares (pawns forwards only, kings and triple kings in all four
+        directions) plus jumps over an adjacent enemy onto an empty square. Long king moves, friendly jumps and the
+        mandatory capture rule are not taken into account.
+        """
+        bitboards = self._bitboards
+        black, white = self.color_masks()
+        empty = ~(black | white)
+
+        black_kings = bitboards[:, BLACK_KING] | bitboards[:, BLACK_TRIPLE_KING]
+        white_kings = bitboards[:, WHITE_KING] | bitboards[:, WHITE_TRIPLE_KING]
+        black_up, black_down = bitboards[:, BLACK_PAWN] | black_kings, black_kings
+        white_up, white_down = white_kings, bitboards[:, WHITE_PAWN] | white_kings
+
+        results = []
+        for up_pieces, down_pieces, enemy in ((black_up, black_down, white), (white_up, white_down, black)):
+            moves = np.zeros(len(self), dtype=np.int32)
+            for pieces, steps in ((up_pieces, (up_left, up_right)), (down_pieces, (down_left, down_right))):
+                for step in steps:
+                    moves += popcount(step(pieces) & empty)
+                    moves += popcount(step(step(pieces) & enemy) & empty)
+            results.append(moves)
+        return results[0], results[1]
+
+    def promotion_candidates(self):
+        """
+        Class method that returns a (black, white) tuple of (N,) int32 arrays counting the pawns one step from
+        promotion with an empty promotion square in front of them: "Black" pawns in row 1 and "White" pawns in
+        row 6.
+        """
+        bitboards = self._bitboards
+        black, white = self.color_masks()
+        empty = ~(black | white)
+
+        black_pawns = bitboards[:, BLACK_PAWN] & _ROW_1
+        white_pawns = bitboards[:, WHITE_PAWN] & _ROW_6
+        black_ready = ((up_left(black_pawns) | up_right(black_pawns)) & empty & _ROW_0)
+        white_ready = ((down_left(white_pawns) | down_right(white_pawns)) & empty & _ROW_7)
+        # Count pawns rather than landing squares, two pawns may share one
+        black_count = popcount(black_pawns & (down_left(black_ready) | down_right(black_ready)))
+        white_count = popcount(white_pawns & (up_left(white_ready) | up_right(white_ready)))
+        return black_count, white_count
+
+    def promoted_on_arrival(self):
+        """
+        Class method that returns a (black, white) tuple of (N,) boolean arrays, True where a pawn of that color
+        already stands on its promotion row or a king on its triple king row, i.e. a promotion is pending.
+        """
+        bitboards = self._bitboards
+        black = ((bitboards[:, BLACK_PAWN] & _ROW_0) | (bitboards[:, BLACK_KING] & _ROW_7)) != 0
+        white = ((bitboards[:, WHITE_PAWN] & _ROW_7) | (bitboards[:, WHITE_KING] & _ROW_0)) != 0
+        return black, white
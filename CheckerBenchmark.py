@@ -0,0 +1,275 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program times the core "GameLogic" operations, get_checker_details, can_capture, make_move,
+#              upgrade_piece and play_game, over a fixed corpus of positions covering pawns, kings and triple kings.
+#              Each benchmark is timed with timeit, best of several repeats, and reported as nanoseconds per call in
+#              JSON, so results can be saved and compared between releases. In comparison mode the results are
+#              checked against a saved baseline and any benchmark slower by more than the threshold, and by more than
+#              the spread of its repeats, is reported as a regression, with an exit status of 1.
+#              Run from the command line as: python CheckerBenchmark.py [--output FILE] [--compare BASELINE]
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import timeit
+
+from CheckerPerft import REFERENCE_POSITIONS, parse_diagram
+from CheckersGame import Checkers
+
+# Corpus: the perft reference positions, which cover pawn, king and triple king captures and promotions, and one
+# crowded position mixing every piece type
+CORPUS = {name: (rows, color) for name, (rows, color, _) in REFERENCE_POSITIONS.items()}
+CORPUS["mixed"] = ((". . . w . . . w",
+                    "w . . . w . . .",
+                    ". w . . . b . .",
+                    ". . w . . . . .",
+                    ". bk . . . w . .",
+                    "b . . . wt . b .",
+                    ". . . b . . . b",
+                    "bt . . . . . . ."),
+                   "Black")
+
+BENCHMARKS = ("get_checker_details", "can_capture", "make_move", "upgrade_piece", "play_game")
+
+DEFAULT_REPEAT = 5
+
+# A benchmark slower than its baseline by more than this fraction is a regression, provided the slowdown is also
+# more than NOISE_STDEVS standard deviations of the repeats. Timings of the same build vary by up to about 16% from run
+# to run, so a smaller threshold reports noise.
+DEFAULT_THRESHOLD = 0.25
+NOISE_STDEVS = 3
+
+# Each upgrade_piece pass upgrades this many copies of every corpus move's position
+UPGRADE_COPIES = 100
+
+# The play_game benchmark replays a fixed game of at most this many hops from the initial layout, chosen with this seed
+PLAY_GAME_HOPS = 80
+PLAY_GAME_SEED = 162
+
+_SQUARES = tuple((row, column) for row in range(8) for column in range(8))
+
+
+def _corpus_game(rows, color):
+    """Function that returns a Checkers object set up on a corpus diagram, its players named after their colors."""
+    game = Checkers()
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    game.load_board(parse_diagram(rows))
+    game._turn = color
+    return game
+
+
+def _load_corpus():
+    """
+    Function that takes no parameters and returns a list of (Checkers object, name of the player to move) tuples,
+    one per corpus position. The players are named after their colors.
+    """
+    return [(_corpus_game(rows, color), color) for rows, color in CORPUS.values()]
+
+
+def _fixed_game():
+    """
+    Function that takes no parameters and returns the moves of the play_game benchmark as a list of (player name,
+    starting_square_location, destination_square_location) tuples. Moves are picked by a seeded random choice among
+    the sorted legal moves, so the game is the same in every release that plays by the same rules.
+    """
+    generator = random.Random(PLAY_GAME_SEED)
+    game = Checkers()
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    moves = []
+    while len(moves) < PLAY_GAME_HOPS and game._game_won is False:
+        name = game.get_turn()
+        starting_square_location, destination_square_location = generator.choice(sorted(game.legal_moves(name)))
+        game.play_game(name, starting_square_location, destination_square_location)
+        moves.append((name, starting_square_location, destination_square_location))
+    return moves
+
+
+def _bench_get_checker_details():
+    """Function that returns the get_checker_details benchmark: every square of every corpus position."""
+    games = [game for game, _ in _load_corpus()]
+
+    def run():
+        for game in games:
+            for square_location in _SQUARES:
+                game.get_checker_details(square_location)
+
+    return run, len(games) * len(_SQUARES), None
+
+
+def _bench_can_capture():
+    """Function that returns the can_capture benchmark: every occupied square of every corpus position."""
+    cases = [(game, [square for square in _SQUARES if game.get_checker_details(square) is not None])
+             for game, _ in _load_corpus()]
+
+    def run():
+        for game, squares in cases:
+            for square_location in squares:
+                game.can_capture(square_location)
+
+    return run, sum(len(squares) for _, squares in cases), None
+
+
+def _corpus_moves():
+    """Function that returns a list of (Checkers object, player name, legal moves) tuples of the corpus positions."""
+    return [(game, name, game.legal_moves(name)) for game, name in _load_corpus()]
+
+
+def _bench_make_move():
+    """Function that returns the make_move benchmark: every legal move of every corpus position, made and unmade."""
+    cases = _corpus_moves()
+
+    def run():
+        for game, name, moves in cases:
+            for starting_square_location, destination_square_location in moves:
+                game.make_move(name, starting_square_location, destination_square_location)
+                game.unmake_move()
+
+    return run, sum(len(moves) for _, _, moves in cases), None
+
+
+def _bench_upgrade_piece():
+    """
+    Function that returns the upgrade_piece benchmark: upgrade_piece alone, called on the position left by every legal
+    move of every corpus position, UPGRADE_COPIES times over. Each corpus move gets its own games, so the positions of
+    a pass can all be prepared at once. Upgrading is undone only by unmaking the move, so the setup unmakes the moves
+    of the last pass and makes them again, and every timed pass upgrades fresh positions.
+    """
+    cases = []
+    for _ in range(UPGRADE_COPIES):
+        for rows, color in CORPUS.values():
+            moves = _corpus_game(rows, color).legal_moves(color)
+            cases.extend((_corpus_game(rows, color), color, start, destination) for start, destination in moves)
+    made = [False]
+
+    def setup():
+        for game, name, starting_square_location, destination_square_location in cases:
+            if made[0]:
+                game.unmake_move()
+            game.make_move(name, starting_square_location, destination_square_location)
+        made[0] = True
+
+    def run():
+        for game, name, _, destination_square_location in cases:
+            game.upgrade_piece(name, destination_square_location)
+
+    return run, len(cases), setup
+
+
+def _bench_play_game():
+    """Function that returns the play_game benchmark: a fixed game replayed through play_game from a new game."""
+    moves = _fixed_game()
+
+    def run():
+        game = Checkers()
+        game.create_player("Black", "Black")
+        game.create_player("White", "White")
+        for name, starting_square_location, destination_square_location in moves:
+            game.play_game(name, starting_square_location, destination_square_location)
+
+    return run, len(moves), None
+
+
+_SETUPS = {"get_checker_details": _bench_get_checker_details, "can_capture": _bench_can_capture,
+           "make_move": _bench_make_move, "upgrade_piece": _bench_upgrade_piece, "play_game": _bench_play_game}
+
+
+def run_benchmarks(names=BENCHMARKS, repeat=DEFAULT_REPEAT):
+    """
+    Function that takes two parameters:
+    names       = the names of the benchmarks to run, defaulted to all of BENCHMARKS
+    repeat      = count of timed runs of each benchmark, defaulted to 5. The best run is the reported time.
+
+    Returns the results as a dictionary ready to be written as JSON: the Python version and machine, and per
+    benchmark the calls per run, the runs per repeat chosen by timeit's autorange, and the best, mean and standard
+    deviation of the time per call in nanoseconds. A benchmark with a setup is run once per repeat, straight after
+    its untimed setup.
+    """
+    results = {"python": platform.python_version(), "implementation": platform.python_implementation(),
+               "machine": platform.machine(), "repeat": repeat, "benchmarks": {}}
+    for name in names:
+        function, calls, setup = _SETUPS[name]()
+        if setup is None:
+            timer = timeit.Timer(function)
+            loops, _ = timer.autorange()
+        else:
+            timer = timeit.Timer(function, setup)
+            loops = 1
+        per_call = [seconds / loops / calls * 1e9 for seconds in timer.repeat(repeat, loops)]
+        results["benchmarks"][name] = {"calls": calls, "loops": loops, "best_ns": min(per_call),
+                                       "mean_ns": statistics.mean(per_call),
+                                       "stdev_ns": statistics.stdev(per_call) if repeat > 1 else 0.0}
+    return results
+
+
+def compare_results(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Function that takes three parameters:
+    results     = a dictionary returned by run_benchmarks
+    baseline    = a dictionary returned by run_benchmarks in an earlier release, usually loaded from its JSON file
+    threshold   = fraction a benchmark may be slower than its baseline before it is a regression, defaulted to 0.25
+
+    Returns a dictionary keyed by the name of every benchmark found in both, of the baseline and current best times
+    per call in nanoseconds, their ratio and whether the benchmark regressed. A benchmark regressed if its best time
+    is slower than the baseline's by more than the threshold, and also by more than NOISE_STDEVS times the larger
+    standard deviation of the two runs' repeats.
+    """
+    comparison = {}
+    for name, result in results["benchmarks"].items():
+        old = baseline.get("benchmarks", {}).get(name)
+        if old is None:
+            continue
+        ratio = result["best_ns"] / old["best_ns"]
+        noise = NOISE_STDEVS * max(result["stdev_ns"], old["stdev_ns"])
+        comparison[name] = {"baseline_ns": old["best_ns"], "best_ns": result["best_ns"], "ratio": ratio,
+                            "regression": ratio > 1 + threshold and result["best_ns"] - old["best_ns"] > noise}
+    return comparison
+
+
+def format_comparison(comparison):
+    """Function that returns a comparison from compare_results as lines of text, one per benchmark."""
+    lines = [f"{'benchmark':<22}{'baseline ns':>14}{'current ns':>14}{'change':>10}"]
+    for name, entry in comparison.items():
+        change = f"{(entry['ratio'] - 1) * 100:+.1f}%"
+        flag = "  REGRESSION" if entry["regression"] else ""
+        lines.append(f"{name:<22}{entry['baseline_ns']:>14.1f}{entry['best_ns']:>14.1f}{change:>10}{flag}")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the core GameLogic operations and write the results as JSON.")
+    parser.add_argument("--output", default=None, help="path of the JSON file to write, defaulted to standard output")
+    parser.add_argument("--compare", default=None, help="path of a saved baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fraction slower than the baseline that counts as a regression")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs of each benchmark")
+    parser.add_argument("--benchmark", action="append", choices=BENCHMARKS, default=None,
+                        help="benchmark to run, may be given more than once, defaulted to all")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.benchmark or BENCHMARKS, arguments.repeat)
+    regressed = False
+    if arguments.compare is not None:
+        with open(arguments.compare, encoding="utf-8") as file:
+            comparison = compare_results(results, json.load(file), arguments.threshold)
+        results["comparison"] = comparison
+        regressed = any(entry["regression"] for entry in comparison.values())
+        # The table goes to standard error so standard output stays valid JSON
+        print("\n".join(format_comparison(comparison)), file=sys.stderr)
+
+    text = json.dumps(results, indent=2)
+    if arguments.output is None:
+        print(text)
+    else:
+        with open(arguments.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program defines the "Bitboard" class, the board storage used by the "GameLogic" class. Only the
+#              32 dark squares of a checkers board can ever hold a piece, so each square is given an index from 0 to
+#              31 and every piece type is stored as a 32-bit integer mask with one bit per square. Square 0 is
+#              (0, 1), square 3 is (0, 7), square 4 is (1, 0) and so on down to square 31 at (7, 6). Pieces are
+#              small integer codes whose color and rank can be read with bit masks. The string view used by
+#              get_checker_details and print_board ("Black", "White_king", None, ...) is rebuilt from the masks on
+#              demand. The board also keeps a 64-bit Zobrist hash of its pieces, updated on every write.
+
+import random
+
+# Piece codes: bits 0 - 1 hold the rank and bit 2 the color, clear for "Black" and set for "White"
+PAWN, KING, TRIPLE_KING = 0, 1, 2
+RANK_MASK = 3
+BLACK, WHITE = 0, 4
+COLOR_MASK = 4
+
+BLACK_PAWN, BLACK_KING, BLACK_TRIPLE_KING = BLACK | PAWN, BLACK | KING, BLACK | TRIPLE_KING
+WHITE_PAWN, WHITE_KING, WHITE_TRIPLE_KING = WHITE | PAWN, WHITE | KING, WHITE | TRIPLE_KING
+
+# Every piece code, and its string name in the same order
+PIECES = (BLACK_PAWN, BLACK_KING, BLACK_TRIPLE_KING, WHITE_PAWN, WHITE_KING, WHITE_TRIPLE_KING)
+PIECE_NAMES = ("Black", "Black_king", "Black_Triple_King", "White", "White_king", "White_Triple_King")
+
+BLACK_PIECES = (BLACK_PAWN, BLACK_KING, BLACK_TRIPLE_KING)
+WHITE_PIECES = (WHITE_PAWN, WHITE_KING, WHITE_TRIPLE_KING)
+COLOR_PIECES = {"Black": BLACK_PIECES, "White": WHITE_PIECES}
+
+# Lookups between codes and strings, the tuples are indexed by piece code and hold None for the unused code 3
+PIECE_CODES = dict(zip(PIECE_NAMES, PIECES))
+CODE_NAMES = tuple(PIECE_NAMES[PIECES.index(code)] if code in PIECES else None
+                   for code in range(WHITE_TRIPLE_KING + 1))
+PIECE_COLORS = tuple(None if name is None else "White" if code & COLOR_MASK else "Black"
+                     for code, name in enumerate(CODE_NAMES))
+
+FULL_MASK = 0xFFFFFFFF
+
+# Starting layout: "White" fills squares 0 - 11 (rows 0 - 2), "Black" fills squares 20 - 31 (rows 5 - 7)
+WHITE_START_MASK = 0x00000FFF
+BLACK_START_MASK = 0xFFF00000
+
+
+def _build_zobrist_keys():
+    """
+    Function that takes no parameters and returns the Zobrist keys as a tuple of (piece keys, side key, capture square
+    keys). Piece keys is a tuple indexed by piece code of 32 random 64-bit keys, one per square. The side key marks
+    "White" to move, and the capture square keys mark the square of a piece that must keep capturing. The generator
+    is seeded so hashes are the same in every run and can be stored on disk.
+    """
+    generator = random.Random(0x5EED_C4EC)
+    piece_keys = [None] * len(CODE_NAMES)
+    for piece in PIECES:
+        piece_keys[piece] = tuple(generator.getrandbits(64) for _ in range(32))
+    piece_keys = tuple(piece_keys)
+    side_key = generator.getrandbits(64)
+    capture_square_keys = tuple(generator.getrandbits(64) for _ in range(32))
+    return piece_keys, side_key, capture_square_keys
+
+
+ZOBRIST_PIECE_KEYS, ZOBRIST_SIDE_KEY, ZOBRIST_CAPTURE_SQUARE_KEYS = _build_zobrist_keys()
+
+
+def hash_masks(masks):
+    """
+    Function that takes one parameter:
+    masks       = a sequence of integer masks indexed by piece code
+
+    Returns the 64-bit Zobrist hash of the pieces in the masks, computed from scratch.
+    """
+    board_hash = 0
+    for piece, mask in enumerate(masks):
+        keys = ZOBRIST_PIECE_KEYS[piece]
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            board_hash ^= keys[bit.bit_length() - 1]
+    return board_hash
+
+
+def square_index(row, column):
+    """
+    Function that takes two parameters:
+    row         = integer row of the square, 0 - 7
+    column      = integer column of the square, 0 - 7
+
+    Returns the 0 - 31 index of a dark square, or None if (row, column) is a light square.
+    """
+    if (row + column) % 2 == 0:
+        return None
+    return row * 4 + column // 2
+
+
+def square_location(index):
+    """
+    Function that takes one parameter:
+    index       = integer index of a dark square, 0 - 31
+
+    Returns the (row, column) tuple of the square.
+    """
+    row = index // 4
+    return row, (index % 4) * 2 + (1 if row % 2 == 0 else 0)
+
+
+class Bitboard:
+    """Represents a checkers board stored as one 32-bit integer mask per piece code."""
+
+    def __init__(self):
+        """
+        Constructor method that takes no parameters.
+
+        The following private data members are initialized:
+
+        masks           = a list indexed by piece code (BLACK_PAWN, BLACK_KING, ...). Each value is an integer
+                          whose bit n is set when square n holds that piece. "White" starts on squares 0 - 11 and
+                          "Black" starts on squares 20 - 31, the same layout as the original list-of-lists board.
+        color_masks     = a dictionary keyed by color, the union of that color's piece masks, kept up to date by every
+                          write so color and occupancy tests never have to combine the piece masks
+        hash            = the 64-bit Zobrist hash of the pieces on the board, XOR-ed with the key of every piece
+                          placed or removed so it never has to be recomputed from the masks
+        counts          = a list indexed by piece code of the count of that piece on the board
+        color_counts    = a dictionary keyed by color of the count of that color's pieces on the board. Both count
+                          dictionaries are adjusted by every write, like the hash.
+        """
+        self._masks = [0] * len(CODE_NAMES)
+        self._masks[WHITE_PAWN] = WHITE_START_MASK
+        self._masks[BLACK_PAWN] = BLACK_START_MASK
+        self._color_masks = {"Black": BLACK_START_MASK, "White": WHITE_START_MASK}
+        self._hash = hash_masks(self._masks)
+        self._counts = [0] * len(CODE_NAMES)
+        self._counts[WHITE_PAWN] = self._counts[BLACK_PAWN] = 12
+        self._color_counts = {"Black": 12, "White": 12}
+
+    def get_mask(self, piece):
+        """Class method that returns the integer mask of the given piece code."""
+        return self._masks[piece]
+
+    def set_mask(self, piece, mask):
+        """Class method that replaces the integer mask of the given piece code."""
+        mask &= FULL_MASK
+        self.toggle_piece(piece, self._masks[piece] ^ mask)
+
+    def get_hash(self):
+        """Class method that returns the 64-bit Zobrist hash of the pieces on the board."""
+        return self._hash
+
+    def get_count(self, piece):
+        """Class method that returns the count of the given piece code on the board."""
+        return self._counts[piece]
+
+    def get_color_count(self, color):
+        """Class method that returns the count of every piece belonging to the string color on the board."""
+        return self._color_counts[color]
+
+    def get_color_mask(self, color):
+        """Class method that returns the integer mask of every piece belonging to the string color."""
+        return self._color_masks[color]
+
+    def get_color_masks(self):
+        """Class method that returns the dictionary of color masks, keyed by "Black" and "White". Do not modify it."""
+        return self._color_masks
+
+    def get_piece_at_index(self, index):
+        """Class method that returns the piece code on the square with the given 0 - 31 index, or None."""
+        bit = 1 << index
+        if self._color_masks["Black"] & bit:
+            color = BLACK
+        elif self._color_masks["White"] & bit:
+            color = WHITE
+        else:
+            return None
+        masks = self._masks
+        if masks[color | PAWN] & bit:
+            return color | PAWN
+        if masks[color | KING] & bit:
+            return color | KING
+        return color | TRIPLE_KING
+
+    def set_piece_at_index(self, index, piece):
+        """Class method that places the piece code (or None to clear) on the square with the given 0 - 31 index."""
+        bit = 1 << index
+        old_piece = self.get_piece_at_index(index)
+        if old_piece is not None:
+            self._masks[old_piece] ^= bit
+            self._color_masks[PIECE_COLORS[old_piece]] ^= bit
+            self._hash ^= ZOBRIST_PIECE_KEYS[old_piece][index]
+            self._counts[old_piece] -= 1
+            self._color_counts[PIECE_COLORS[old_piece]] -= 1
+        if piece is not None:
+            self._masks[piece] |= bit
+            self._color_masks[PIECE_COLORS[piece]] |= bit
+            self._hash ^= ZOBRIST_PIECE_KEYS[piece][index]
+            self._counts[piece] += 1
+            self._color_counts[PIECE_COLORS[piece]] += 1
+
+    def toggle_piece(self, piece, mask):
+        """
+        Class method that flips the bits of mask in the given piece code's mask. This is the fast path used to make
+        and unmake moves: the caller must know the squares are empty (to place) or hold that piece (to remove).
+        """
+        color = PIECE_COLORS[piece]
+        masks = self._masks
+        masks[piece] ^= mask
+        self._color_masks[color] ^= mask
+        keys, change = ZOBRIST_PIECE_KEYS[piece], 0
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            self._hash ^= keys[bit.bit_length() - 1]
+            change += 1 if masks[piece] & bit else -1
+        self._counts[piece] += change
+        self._color_counts[color] += change
+
+    def set_piece(self, row, column, piece):
+        """
+        Class method that places the piece code (or None to clear) at (row, column). Pieces can only be placed on
+        dark squares, placing one on a light square raises a ValueError.
+        """
+        index = square_index(row, column)
+        if index is None:
+            if piece is not None:
+                raise ValueError(f"({row}, {column}) is not a playable square")
+            return
+        self.set_piece_at_index(index, piece)
+
+    def clear(self):
+        """Class method that removes every piece from the board."""
+        for piece in PIECES:
+            self._masks[piece] = self._counts[piece] = 0
+        self._color_masks["Black"] = self._color_masks["White"] = 0
+        self._hash = 0
+        self._color_counts["Black"] = self._color_counts["White"] = 0
+
+    def load_lists(self, board):
+        """
+        Class method that takes one parameter:
+        board       = a list of 8 lists of 8 string pieces or None, the same view returned by to_lists
+
+        Replaces every piece on the board with the pieces of the list view. A piece on a light square raises a
+        ValueError.
+        """
+        self.clear()
+        for row in range(8):
+            for column in range(8):
+                if board[row][column] is not None:
+                    self.set_piece(row, column, PIECE_CODES[board[row][column]])
+
+    def to_lists(self):
+        """Class method that returns the board as a list of 8 lists of 8 string pieces or None."""
+        board = [[None] * 8 for _ in range(8)]
+        for piece in PIECES:
+            mask, name = self._masks[piece], CODE_NAMES[piece]
+            while mask:
+                bit = mask & -mask
+                row, column = square_location(bit.bit_length() - 1)
+                board[row][column] = name
+                mask ^= bit
+        return board
@@ -1,11 +1,169 @@
+from CheckerBitboard import (BLACK_TRIPLE_KING, Bitboard, CODE_NAMES, COLOR_PIECES, FULL_MASK, KING, PAWN,
+                             PIECE_COLORS, PIECES, RANK_MASK, TRIPLE_KING, WHITE_TRIPLE_KING,
+                             ZOBRIST_CAPTURE_SQUARE_KEYS, ZOBRIST_SIDE_KEY)
+from CheckerTables import (DOUBLE_JUMP_LANDINGS, DOWN_LEFT, FORWARD_NEIGHBOUR_MASKS, KING_STEPS, NEIGHBOUR_MASKS,
+                           PAWN_JUMPS, PAWN_STEPS, PROMOTED_PIECES, PROMOTION_MASKS, RAY_MASKS, RAY_STEPS,
+                           SQUARE_INDEX, SQUARE_LOCATION)
+
+OPPONENT = {"Black": "White", "White": "Black"}
+
+# Material values in hundredths of a pawn
+PAWN_VALUE = 100
+KING_VALUE = 250
+TRIPLE_KING_VALUE = 400
+TRIPLE_KINGS = {"Black": BLACK_TRIPLE_KING, "White": WHITE_TRIPLE_KING}
+
+# Fields of a move record, see GameLogic._make_hop
+START_SQUARE, DESTINATION_SQUARE, MOVED_PIECE, CAPTURED_PIECES, PROMOTED_PIECE = 0, 1, 2, 3, 4
+
+# Packed Position layout, lowest bits first: the six piece masks in PIECES order (32 bits each), the side to
+# move (1 bit, set for "White") and the capture square plus one (6 bits, 0 when no capture is in progress)
+_SIDE_SHIFT = 32 * len(PIECES)
+_CAPTURE_SHIFT = _SIDE_SHIFT + 1
+POSITION_BYTES = (_CAPTURE_SHIFT + 6 + 7) // 8
+
+
+def _nearest_square(mask, direction):
+    """
+    Function that returns the single-bit mask of the square of a non-empty ray mask nearest the ray's start: the
+    lowest set bit walking down the board, the highest walking up.
+    """
+    if direction >= DOWN_LEFT:
+        return mask & -mask
+    return 1 << (mask.bit_length() - 1)
+
+
+def _squares_before(mask, square, direction):
+    """
+    Function that returns the squares of a ray mask that lie before the given square walking in the direction, that
+    is the squares a piece sliding along the ray passes through before reaching it.
+    """
+    if direction >= DOWN_LEFT:
+        return mask & (square - 1)
+    return mask & -(square << 1)
+
+
 class InvalidSquare(IndexError):
     """
-     This exception is raised within the GameLogic object when a player makes an out-of-bounds move.
-     Used by the following methods: get_checker_details
+     This exception is raised within the GameLogic object when a player makes an out-of-bounds or illegal move.
+     Used by the following methods: get_checker_details, can_capture, analyse_move, make_move. The Checkers class
+     raises the same exception from play_game and play_sequence.
     """
     pass
 
 
+class PlyAnalysis:
+    """
+    Represents everything play_game needs to know about one hop, worked out once and shared by make_move,
+    upgrade_piece and the turn switch so none of them has to search the board again.
+    """
+
+    __slots__ = ("_hop", "_promotion", "_continues_capture")
+
+    def __init__(self, hop, promotion):
+        """
+        Constructor method that takes two parameters:
+        hop                 = the (starting square index, destination square index, captured mask) tuple of the move
+        promotion           = piece code the mover is upgraded to on landing, or None
+
+        The following private data member is also initialized:
+
+        continues_capture   = None until the move is played, then boolean True if the piece must keep capturing
+        """
+        self._hop = hop
+        self._promotion = promotion
+        self._continues_capture = None
+
+    def get_hop(self):
+        """Class method that returns the hop tuple of the move."""
+        return self._hop
+
+    def get_promotion(self):
+        """Class method that returns the piece code the mover is upgraded to, or None."""
+        return self._promotion
+
+    def get_continues_capture(self):
+        """Class method that returns whether the piece must keep capturing, None if the move has not been played."""
+        return self._continues_capture
+
+    def set_continues_capture(self, continues_capture):
+        """Class method that records whether the piece must keep capturing after the move."""
+        self._continues_capture = continues_capture
+
+
+class Position:
+    """
+    Represents an immutable snapshot of a game position: the six piece masks, the side to move and the square of a
+    piece that must keep capturing. Everything is packed into one integer, so a Position costs tens of bytes and can
+    be hashed, compared and used as a dictionary key.
+    """
+
+    __slots__ = ("_packed",)
+
+    def __init__(self, masks, turn, capture_square=None):
+        """
+        Constructor method that takes three parameters:
+        masks           = the six integer piece masks in PIECES order
+        turn            = string color of the side to move, either "Black" or "White"
+        capture_square  = the 0 - 31 index of the piece that must keep capturing, defaulted to None
+
+        The following private data member is initialized:
+
+        packed          = the integer holding every field, see _SIDE_SHIFT and _CAPTURE_SHIFT
+        """
+        packed = 0
+        for shift, mask in enumerate(masks):
+            packed |= (mask & FULL_MASK) << (32 * shift)
+        if turn == "White":
+            packed |= 1 << _SIDE_SHIFT
+        if capture_square is not None:
+            packed |= (capture_square + 1) << _CAPTURE_SHIFT
+        object.__setattr__(self, "_packed", packed)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Class method that returns the Position packed into POSITION_BYTES bytes by to_bytes."""
+        position = cls.__new__(cls)
+        object.__setattr__(position, "_packed", int.from_bytes(data, "little"))
+        return position
+
+    def to_bytes(self):
+        """Class method that returns the Position packed into POSITION_BYTES bytes, for storing it in a file."""
+        return self._packed.to_bytes(POSITION_BYTES, "little")
+
+    def get_masks(self):
+        """Class method that returns the six integer piece masks in PIECES order."""
+        packed = self._packed
+        return tuple(packed >> (32 * shift) & FULL_MASK for shift in range(len(PIECES)))
+
+    def get_turn(self):
+        """Class method that returns the string color of the side to move."""
+        return "White" if self._packed >> _SIDE_SHIFT & 1 else "Black"
+
+    def get_capture_square(self):
+        """Class method that returns the 0 - 31 index of the piece that must keep capturing, or None."""
+        square = self._packed >> _CAPTURE_SHIFT
+        return None if square == 0 else square - 1
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Position objects are immutable")
+
+    def __reduce__(self):
+        # Pickling and copying rebuild the Position from its bytes, as __setattr__ refuses to restore the slot
+        return Position.from_bytes, (self.to_bytes(),)
+
+    def __eq__(self, other):
+        if not isinstance(other, Position):
+            return NotImplemented
+        return self._packed == other._packed
+
+    def __hash__(self):
+        return hash(self._packed)
+
+    def __repr__(self):
+        return f"Position({self.get_masks()}, {self.get_turn()!r}, {self.get_capture_square()})"
+
+
 class GameLogic:
     """Represents the movement and capture logic for a game of checkers."""
 
@@ -16,68 +174,155 @@ class GameLogic:
         The following private data members are initialized:
 
         game_won        = if any player captures 12 pieces, the game is won. Defaults to boolean False
+        capture_square  = the 0 - 31 index of the piece that must keep capturing this turn, defaults to None
         players         = initialized as an empty dictionary
-        board           = creates a list of lists that represents the board. 12 squares on the top have the string
-                          "White", on the bottom 12 squares have the string "Black". These are the pieces used by the
-                          players. The remaining spaces are element positions containing noneType None.
+        move_history    = the undo stack, a list of move records pushed by make_move and popped by unmake_move
+        board           = a Bitboard object that represents the board. 12 squares on the top hold "White" pieces,
+                          on the bottom 12 squares hold "Black" pieces. These are the pieces used by the players.
         """
         self._capture_state = False
+        self._capture_square = None
         self._players = {}
-        self._board = [[None, "White", None, "White", None, "White", None, "White"],
-                       ["White", None, "White", None, "White", None, "White", None],
-                       [None, "White", None, "White", None, "White", None, "White"],
-                       [None, None, None, None, None, None, None, None],
-                       [None, None, None, None, None, None, None, None],
-                       ["Black", None, "Black", None, "Black", None, "Black", None],
-                       [None, "Black", None, "Black", None, "Black", None, "Black"],
-                       ["Black", None, "Black", None, "Black", None, "Black", None]]
+        self._board = Bitboard()
+        self._move_history = []
 
     def get_checker_details(self, square_location):
         """
         This class method takes one parameter:
         square_location      = a tuple in (x, y), representing a position on the board
 
-        This method accesses the board data member and returns the element accessed by the tuple.
-        If a position outside the board is chosen, an InvalidSquare Exception is raised.
+        This method accesses the board data member and returns the string piece on the square ("Black",
+        "White_king", ...), or None if it is empty. If a position outside the board is chosen, an InvalidSquare
+        Exception is raised.
         """
-        row, column = square_location[0], square_location[1]
+        piece = self._piece_at(square_location)
+        return None if piece is None else CODE_NAMES[piece]
 
+    def _piece_at(self, square_location):
+        """
+        Class method that returns the piece code on the square of an (x, y) tuple, or None if it is empty or light.
+        Positions outside the board are treated as in get_checker_details.
+        """
+        row, column = square_location[0], square_location[1]
         if row > 7 or column > 7:
             raise InvalidSquare
+        index = SQUARE_INDEX[row][column]
+        return None if index is None else self._board.get_piece_at_index(index)
 
-        return self._board[row][column]
-
-    def upgrade_piece(self, player_name, destination_square_location):
+    def load_board(self, board, capture_square_location=None):
         """
         This class method takes two parameters:
+        board                       = a list of 8 lists of 8 string pieces or None, in the format printed by
+                                      print_board
+        capture_square_location     = a tuple in (x, y) of a piece that is in the middle of a capture sequence and
+                                      must keep capturing, defaulted to None
+
+        This method replaces the position on the board and clears the move history. Player data members are not
+        changed.
+        """
+        self._board.load_lists(board)
+        self._move_history = []
+        if capture_square_location is None:
+            self._capture_state, self._capture_square = False, None
+        else:
+            self._capture_state = True
+            self._capture_square = SQUARE_INDEX[capture_square_location[0]][capture_square_location[1]]
+
+    def get_position(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move
+
+        Returns a Position snapshot of the pieces on the board, the side to move and the square of a piece that must
+        keep capturing.
+        """
+        capture_square = self._capture_square if self._capture_state is True else None
+        return Position([self._board.get_mask(piece) for piece in PIECES], color, capture_square)
+
+    def load_position(self, position):
+        """
+        This class method takes one parameter:
+        position    = a Position object
+
+        This method replaces the position on the board and the capture state with the snapshot's and clears the move
+        history. Player data members are not changed. Returns the string color of the side to move.
+        """
+        board = self._board
+        board.clear()
+        for piece, mask in zip(PIECES, position.get_masks()):
+            board.set_mask(piece, mask)
+        self._move_history = []
+        self._capture_square = position.get_capture_square()
+        self._capture_state = self._capture_square is not None
+        return position.get_turn()
+
+    def get_piece_counts(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color, either "Black" or "White"
+
+        Returns a (pawns, kings, triple kings) tuple of the color's pieces on the board. The counts are kept up to
+        date by every move and upgrade, so no board scan is needed.
+        """
+        pawn, king, triple_king = COLOR_PIECES[color]
+        board = self._board
+        return board.get_count(pawn), board.get_count(king), board.get_count(triple_king)
+
+    def get_piece_total(self, color):
+        """Class method that returns the count of every piece of the string color on the board."""
+        return self._board.get_color_count(color)
+
+    def get_material(self, color):
+        """Class method that returns the material of the string color: its pieces weighted by PAWN_VALUE etc."""
+        pawns, kings, triple_kings = self.get_piece_counts(color)
+        return pawns * PAWN_VALUE + kings * KING_VALUE + triple_kings * TRIPLE_KING_VALUE
+
+    def get_material_balance(self, color):
+        """Class method that returns the material of the string color minus the material of its opponent."""
+        return self.get_material(color) - self.get_material(OPPONENT[color])
+
+    def upgrade_piece(self, player_name, destination_square_location, analysis=None):
+        """
+        This class method takes three parameters:
         player_name                     = a string containing the player's name
         destination_square_location     = a tuple in (x, y), representing a destination square on the board
+        analysis                        = the PlyAnalysis of the move just made, defaulted to None. If given and
+                                          the move earns no promotion, the board is not read at all.
 
-        This class method upgrades a pawn piece into a king, and a king into a triple king if the piece is in the
-        appropriate position:
+        This class method upgrades the piece on the destination square, the piece that just moved, from a pawn into a
+        king or from a king into a triple king if the square is on its promotion row:
 
         'Black' pawns upgrade when in row 0 and 'Black_kings' upgrade in row 7.
         'White' pawns upgrade when in row 7 and 'White_kings' upgrade in row 0.
 
+        Only the destination square is looked at, against the precomputed promotion row mask of the piece's code.
+        A piece is never on its promotion row right after being upgraded, so calling this method again for the same
+        move changes nothing and the Player data members are updated once. The upgrade is added to the last move
+        record so unmake_move reverts it with the move.
         """
-
+        if analysis is not None and analysis.get_promotion() is None:
+            return
         destination_row, destination_column = destination_square_location[0], destination_square_location[1]
+        destination = SQUARE_INDEX[destination_row][destination_column]
+        if destination is None:
+            return
+
+        piece = self._board.get_piece_at_index(destination)
+        if piece is None or not PROMOTION_MASKS[piece] >> destination & 1:
+            return
+        promoted = PROMOTED_PIECES[piece]
 
         # Upgrade piece
-        if "Black" in self._board[0]:
-            self._players[player_name].add_king()
-            self._board[destination_row][destination_column] = "Black_king"
-        elif "Black_king" in self._board[7]:
-            self._players[player_name].remove_king()
-            self._players[player_name].add_triple_king()
-            self._board[destination_row][destination_column] = "Black_Triple_King"
-        elif "White" in self._board[7]:
-            self._players[player_name].add_king()
-            self._board[destination_row][destination_column] = "White_king"
-        elif "White_king" in self._board[0]:
-            self._players[player_name].remove_king()
-            self._players[player_name].add_triple_king()
-            self._board[destination_row][destination_column] = "White_Triple_King"
+        self._board.toggle_piece(piece, 1 << destination)
+        self._board.toggle_piece(promoted, 1 << destination)
+        record = self._move_history[-1] if self._move_history else None
+        if record is not None and record[DESTINATION_SQUARE] == destination and record[PROMOTED_PIECE] is None:
+            self._move_history[-1] = record[:PROMOTED_PIECE] + (promoted,) + record[PROMOTED_PIECE + 1:]
+
+        player = self._players.get(player_name)
+        if player is not None:
+            _apply_rank_change(player, piece, 1)
+            _apply_rank_change(player, promoted, -1)
 
     def can_capture(self, square_location):
         """
@@ -93,8530 +338,523 @@ class GameLogic:
         piece to capture, as long as they are on the same diagonal.
 
         Triple kings can do everything a king can, as well as double capture.
+
+        Every check is a walk over the square's precomputed tables in CheckerTables: pawn jumps are looked up
+        directly, and along each diagonal the nearest piece is found from the ray mask and the occupied mask.
         """
-        start = self.get_checker_details(square_location)
         row, column = square_location[0], square_location[1]
-        white_list, black_list = ["White", "White_king", "White_Triple_King"], ["Black", "Black_king",
-                                                                                "Black_Triple_King"]
-        # Black pawn capture logic
-        if start == "Black":
-            if column == 0 and row != 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-            elif column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif column == 6 and row != 1:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-            elif row != 1:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-            else:
-                return False
-        # White pawn capture logic
-        elif start == "White":
-            if column == 7 and row != 6:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif column == 0:
-                # Down-right
-                if self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif column == 1 and row != 6:
-                # Down-right
-                if self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif column == 6 and row != 6:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif row != 6:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                if self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            else:
-                return False
-        # Black king's capture logic
-        elif start == "Black_king":
-            if row == 7 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in white_list and self._board[row - 6][column + 6] is None:
-                    return True
-                elif self._board[row - 6][column + 6] in white_list and self._board[row - 7][column + 7] is None:
-                    return True
-            elif row == 7 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-            elif row == 7 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-            elif row == 7 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in white_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 6 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in white_list and self._board[row - 6][column + 6] is None:
-                    return True
-            elif row == 6 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-            elif row == 6 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif row == 6 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in white_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 5 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif row == 4 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 4 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-            elif row == 3 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 3 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-            elif row == 2 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 2 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 2 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 2 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-            elif row == 1 and column == 0:
-                # Down-right
-                if self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in white_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 1 and column == 2:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 1 and column == 4:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 1 and column == 6:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in white_list and self._board[row + 6][column - 6] is None:
-                    return True
-            elif row == 0 and column == 1:
-                # Down-right
-                if self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in white_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 0 and column == 3:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
+        if row > 7 or column > 7:
+            raise InvalidSquare
+
+        index = SQUARE_INDEX[row][column]
+        if index is None:
+            return False
+        bit = 1 << index
+        color_masks = self._board.get_color_masks()
+        black, white = color_masks["Black"], color_masks["White"]
+        if black & bit:
+            color, enemy = "Black", white
+        elif white & bit:
+            color, enemy = "White", black
+        else:
+            return False
+        occupied = black | white
+
+        # Pawn capture logic, adjacent enemy with an empty square behind it
+        if self._board.get_mask(COLOR_PIECES[color][PAWN]) & bit:
+            for jumped, landing in PAWN_JUMPS[color][index]:
+                if jumped & enemy and not landing & occupied:
                     return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 0 and column == 5:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 0 and column == 7:
-                # Down-left
-                if self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in white_list and self._board[row + 6][column - 6] is None:
-                    return True
-                elif self._board[row + 6][column - 6] in white_list and self._board[row + 7][column - 7] is None:
-                    return True
-        elif start == "Black_Triple_King":
-            if row == 7 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] in
-                      white_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] in
-                      white_list and self._board[row - 6][column + 6] is None):
-                    return True
-                elif (self._board[row - 5][column + 5] in white_list and self._board[row - 6][column + 6] in
-                      white_list and self._board[row - 7][column + 7]) is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in white_list and self._board[row - 6][column + 6] is None:
-                    return True
-                elif self._board[row - 6][column + 6] in white_list and self._board[row - 7][column + 7] is None:
-                    return True
-            elif row == 7 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] in
-                      white_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] in
-                      white_list and self._board[row - 6][column + 6] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-            elif row == 7 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                      white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-            elif row == 7 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] in
-                      white_list and self._board[row - 5][column - 5] is None):
-                    return True
-                elif (self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] in
-                      white_list and self._board[row - 6][column - 6] is None):
-                    return True
-                    # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in white_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 6 and column == 1:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] in
-                      white_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] in
-                      white_list and self._board[row - 6][column + 6] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in white_list and self._board[row - 6][column + 6] is None:
-                    return True
-            elif row == 6 and column == 3:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                      white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-            elif row == 6 and column == 5:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] in
-                      white_list and self._board[row - 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif row == 6 and column == 7:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] in
-                      white_list and self._board[row - 5][column - 5] is None):
-                    return True
-                elif (self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] in
-                      white_list and self._board[row - 6][column - 6] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in white_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 5 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] in
-                      white_list and self._board[row - 5][column + 5] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] in
-                      white_list and self._board[row - 5][column + 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in white_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                      white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Up-left
-                if self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] in
-                      white_list and self._board[row - 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in white_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif row == 4 and column == 1:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 3:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                      white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] in
-                      white_list and self._board[row - 4][column + 4] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                      white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in white_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 5:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                      white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 4 and column == 7:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] in
-                      white_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Down-left
-                elif (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                      white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in white_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-            elif row == 3 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                        white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] in
-                      white_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                      white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in white_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 3 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] in
-                        white_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                      white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in white_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-            elif row == 2 and column == 1:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                        white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] in
-                      white_list and self._board[row + 5][column + 5] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 2 and column == 3:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                    # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 2 and column == 5:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] in
-                      white_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in white_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 2 and column == 7:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] in
-                      white_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in white_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-            elif row == 1 and column == 0:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                        white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] in
-                      white_list and self._board[row + 5][column + 5] is None):
-                    return True
-                elif (self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] in
-                      white_list and self._board[row + 6][column + 6] is None):
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in white_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 1 and column == 2:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                        white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] in
-                      white_list and self._board[row + 5][column + 5] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 1 and column == 4:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 1 and column == 6:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] in
-                      white_list and self._board[row + 5][column - 5] is None):
-                    return True
-                elif (self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] in
-                      white_list and self._board[row + 6][column - 6] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in white_list and self._board[row + 6][column - 6] is None:
-                    return True
-            elif row == 0 and column == 1:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                        white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] in
-                      white_list and self._board[row + 5][column + 5] is None):
-                    return True
-                elif (self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] in
-                      white_list and self._board[row + 6][column + 6] is None):
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in white_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in white_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 0 and column == 3:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] in
-                      white_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] in
-                      white_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in white_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in white_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 0 and column == 5:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] in
-                      white_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in white_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 0 and column == 7:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] in
-                        white_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] in
-                      white_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] in
-                      white_list and self._board[row + 5][column - 5] is None):
-                    return True
-                elif (self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] in
-                      white_list and self._board[row + 6][column - 6] is None):
-                    return True
-                elif (self._board[row + 5][column - 5] in white_list and self._board[row + 6][column - 6] in
-                      white_list and self._board[row + 7][column - 7] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in white_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in white_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in white_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in white_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in white_list and self._board[row + 6][column - 6] is None:
-                    return True
-                elif self._board[row + 6][column - 6] in white_list and self._board[row + 7][column - 7] is None:
-                    return True
-        # White Kings' Capture Logic
-        elif start == "White_king":
-            if row == 7 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in black_list and self._board[row - 6][column + 6] is None:
-                    return True
-                elif self._board[row - 6][column + 6] in black_list and self._board[row - 7][column + 7] is None:
-                    return True
-            elif row == 7 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-            elif row == 7 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-            elif row == 7 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in black_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 6 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in black_list and self._board[row - 6][column + 6] is None:
-                    return True
-            elif row == 6 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-            elif row == 6 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif row == 6 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in black_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 5 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif row == 4 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 4 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-            elif row == 3 and column == 0:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 2:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 4:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 3 and column == 6:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-            elif row == 2 and column == 1:
-                # Up-right
-                if self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 2 and column == 3:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 2 and column == 5:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 2 and column == 7:
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-            elif row == 1 and column == 0:
-                # Down-right
-                if self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in black_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 1 and column == 2:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 1 and column == 4:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 1 and column == 6:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in black_list and self._board[row + 6][column - 6] is None:
-                    return True
-            elif row == 0 and column == 1:
-                # Down-right
-                if self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in black_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 0 and column == 3:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 0 and column == 5:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 0 and column == 7:
-                # Down-left
-                if self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in black_list and self._board[row + 6][column - 6] is None:
-                    return True
-                elif self._board[row + 6][column - 6] in black_list and self._board[row + 7][column - 7] is None:
-                    return True
-        elif start == "White_Triple_King":
-            if row == 7 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] in
-                      black_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] in
-                      black_list and self._board[row - 6][column + 6] is None):
-                    return True
-                elif (self._board[row - 5][column + 5] in black_list and self._board[row - 6][column + 6] in
-                      black_list and self._board[row - 7][column + 7]) is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in black_list and self._board[row - 6][column + 6] is None:
-                    return True
-                elif self._board[row - 6][column + 6] in black_list and self._board[row - 7][column + 7] is None:
-                    return True
-            elif row == 7 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] in
-                      black_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] in
-                      black_list and self._board[row - 6][column + 6] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-            elif row == 7 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                      black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-            elif row == 7 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] in
-                      black_list and self._board[row - 5][column - 5] is None):
-                    return True
-                elif (self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] in
-                      black_list and self._board[row - 6][column - 6] is None):
-                    return True
-                    # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in black_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 6 and column == 1:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] in
-                      black_list and self._board[row - 5][column + 5] is None):
-                    return True
-                elif (self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] in
-                      black_list and self._board[row - 6][column + 6] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                elif self._board[row - 5][column + 5] in black_list and self._board[row - 6][column + 6] is None:
-                    return True
-            elif row == 6 and column == 3:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                      black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-            elif row == 6 and column == 5:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] in
-                      black_list and self._board[row - 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-            elif row == 6 and column == 7:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] in
-                      black_list and self._board[row - 5][column - 5] is None):
-                    return True
-                elif (self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] in
-                      black_list and self._board[row - 6][column - 6] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                elif self._board[row - 5][column - 5] in black_list and self._board[row - 6][column - 6] is None:
-                    return True
-            elif row == 5 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] in
-                      black_list and self._board[row - 5][column + 5] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                elif (self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] in
-                      black_list and self._board[row - 5][column + 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                elif self._board[row - 4][column + 4] in black_list and self._board[row - 5][column + 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                      black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Up-left
-                if self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 5 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                elif (self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] in
-                      black_list and self._board[row - 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                elif self._board[row - 4][column - 4] in black_list and self._board[row - 5][column - 5] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-            elif row == 4 and column == 1:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 3:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                      black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                elif (self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] in
-                      black_list and self._board[row - 4][column + 4] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                      black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                elif self._board[row - 3][column + 3] in black_list and self._board[row - 4][column + 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 4 and column == 5:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                      black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 4 and column == 7:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                elif (self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] in
-                      black_list and self._board[row - 4][column - 4] is None):
-                    return True
-                # Down-left
-                elif (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                      black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                elif self._board[row - 3][column - 3] in black_list and self._board[row - 4][column - 4] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-            elif row == 3 and column == 0:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 2:
-                # Up-right double
-                if (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                        black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 3 and column == 4:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Up-right double
-                elif (self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] in
-                      black_list and self._board[row - 3][column + 3] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                      black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                elif self._board[row - 2][column + 2] in black_list and self._board[row - 3][column + 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 3 and column == 6:
-                # Up-left double
-                if (self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] in
-                        black_list and self._board[row - 3][column - 3] is None):
-                    return True
-                # Down-left double
-                elif (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                      black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                elif self._board[row - 2][column - 2] in black_list and self._board[row - 3][column - 3] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-            elif row == 2 and column == 1:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                        black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] in
-                      black_list and self._board[row + 5][column + 5] is None):
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 2 and column == 3:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                    # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 2 and column == 5:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] in
-                      black_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Up-right
-                elif self._board[row - 1][column + 1] in black_list and self._board[row - 2][column + 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 2 and column == 7:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] in
-                      black_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Up-left
-                elif self._board[row - 1][column - 1] in black_list and self._board[row - 2][column - 2] is None:
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-            elif row == 1 and column == 0:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                        black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] in
-                      black_list and self._board[row + 5][column + 5] is None):
-                    return True
-                elif (self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] in
-                      black_list and self._board[row + 6][column + 6] is None):
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in black_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 1 and column == 2:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                        black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] in
-                      black_list and self._board[row + 5][column + 5] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-            elif row == 1 and column == 4:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-            elif row == 1 and column == 6:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] in
-                      black_list and self._board[row + 5][column - 5] is None):
-                    return True
-                elif (self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] in
-                      black_list and self._board[row + 6][column - 6] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in black_list and self._board[row + 6][column - 6] is None:
-                    return True
-            elif row == 0 and column == 1:
-                # Down-right double
-                if (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                        black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                elif (self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] in
-                      black_list and self._board[row + 5][column + 5] is None):
-                    return True
-                elif (self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] in
-                      black_list and self._board[row + 6][column + 6] is None):
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-                elif self._board[row + 4][column + 4] in black_list and self._board[row + 5][column + 5] is None:
-                    return True
-                elif self._board[row + 5][column + 5] in black_list and self._board[row + 6][column + 6] is None:
-                    return True
-            elif row == 0 and column == 3:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                # Down-right double
-                elif (self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] in
-                      black_list and self._board[row + 3][column + 3] is None):
-                    return True
-                elif (self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] in
-                      black_list and self._board[row + 4][column + 4] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-                elif self._board[row + 2][column + 2] in black_list and self._board[row + 3][column + 3] is None:
-                    return True
-                elif self._board[row + 3][column + 3] in black_list and self._board[row + 4][column + 4] is None:
-                    return True
-            elif row == 0 and column == 5:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] in
-                      black_list and self._board[row + 5][column - 5] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                # Down-right
-                elif self._board[row + 1][column + 1] in black_list and self._board[row + 2][column + 2] is None:
-                    return True
-            elif row == 0 and column == 7:
-                # Down-left double
-                if (self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] in
-                        black_list and self._board[row + 3][column - 3] is None):
-                    return True
-                elif (self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] in
-                      black_list and self._board[row + 4][column - 4] is None):
-                    return True
-                elif (self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] in
-                      black_list and self._board[row + 5][column - 5] is None):
-                    return True
-                elif (self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] in
-                      black_list and self._board[row + 6][column - 6] is None):
-                    return True
-                elif (self._board[row + 5][column - 5] in black_list and self._board[row + 6][column - 6] in
-                      black_list and self._board[row + 7][column - 7] is None):
-                    return True
-                # Down-left
-                elif self._board[row + 1][column - 1] in black_list and self._board[row + 2][column - 2] is None:
-                    return True
-                elif self._board[row + 2][column - 2] in black_list and self._board[row + 3][column - 3] is None:
-                    return True
-                elif self._board[row + 3][column - 3] in black_list and self._board[row + 4][column - 4] is None:
-                    return True
-                elif self._board[row + 4][column - 4] in black_list and self._board[row + 5][column - 5] is None:
-                    return True
-                elif self._board[row + 5][column - 5] in black_list and self._board[row + 6][column - 6] is None:
-                    return True
-                elif self._board[row + 6][column - 6] in black_list and self._board[row + 7][column - 7] is None:
-                    return True
-        else:
             return False
+        triple_king = self._board.get_mask(TRIPLE_KINGS[color]) & bit
+
+        # King & triple king capture logic, any distance along the diagonal
+        for direction, ray in enumerate(RAY_MASKS[index]):
+            blockers = ray & occupied
+            if not blockers:
+                continue
+            jumped = _nearest_square(blockers, direction)
+            if not jumped & enemy:
+                continue
+            jumped_index = jumped.bit_length() - 1
+            behind = RAY_STEPS[jumped_index][direction]
+            if behind and not behind & occupied:
+                return True
+            # Triple king double capture, two adjacent enemies with an empty square behind them
+            if triple_king and behind & enemy:
+                landing = RAY_STEPS[behind.bit_length() - 1][direction]
+                if landing and not landing & occupied:
+                    return True
+        return False
+
+    def generate_moves(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move, either "Black" or "White"
+
+        This method is a generator that yields every legal move for the given color as a pair of tuples,
+        (starting_square_location, destination_square_location), in the same (x, y) format used by play_game. Each
+        move is a single hop, a capture sequence is played one hop at a time.
 
-    def make_move(self, player_name, starting_square_location, destination_square_location):
+        Captures are mandatory: if any piece of the color can capture, only captures are yielded. If a piece is in the
+        middle of a capture sequence, only that piece's captures are yielded. The board is never copied, moves are
+        read straight from the bitboard masks.
         """
-        Class method that takes three parameters:
-        player_name                  = string containing the moving player's name.
+        for start, destination, captured in self._generate_hops(color):
+            yield SQUARE_LOCATION[start], SQUARE_LOCATION[destination]
+
+    def capture_sequences(self, square_location):
+        """
+        This class method takes one parameter:
+        square_location     = a tuple in (x, y), the square of the piece to capture with
+
+        Returns a list of every complete capture sequence the piece can make, each a list of squares starting with
+        square_location followed by the square landed on by every hop, in the format taken by play_sequence. The list
+        is empty if the square is empty or the piece cannot capture. The sequences are found in one depth-first pass
+        that plays each hop on the board and takes it back, so the board is unchanged afterwards. If a position
+        outside the board is chosen, an InvalidSquare Exception is raised.
+        """
+        row, column = square_location[0], square_location[1]
+        if row > 7 or column > 7:
+            raise InvalidSquare
+
+        index = SQUARE_INDEX[row][column]
+        piece = self._board.get_piece_at_index(index) if index is not None else None
+        if piece is None or (self._capture_state is True and self._capture_square not in (None, index)):
+            return []
+
+        return [[square_location] + [SQUARE_LOCATION[hop[1]] for hop in sequence]
+                for sequence in self._generate_capture_sequences(PIECE_COLORS[piece], index)]
+
+    def has_legal_move(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move, either "Black" or "White"
+
+        Returns boolean True if the color has at least one legal move, False if it has no pieces left or every piece
+        is blocked. The check stops at the first piece found with an empty neighbouring square it may step to, using
+        the precomputed per-square neighbour masks, and only falls back to the move generator when every piece is
+        boxed in.
+        """
+        board = self._board
+        color_masks = board.get_color_masks()
+        own = color_masks[color]
+
+        # Only the capturing piece may move while a capture sequence is in progress
+        if self._capture_state is True and self._capture_square is not None:
+            for _ in self._generate_captures(color, own & 1 << self._capture_square):
+                return True
+            return False
+
+        # A step onto an empty square is legal unless a capture is mandatory, and then the capture is legal
+        empty = ~(color_masks["Black"] | color_masks["White"])
+        pawns = board.get_mask(COLOR_PIECES[color][PAWN])
+        forward_neighbours = FORWARD_NEIGHBOUR_MASKS[color]
+        pieces = pawns
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            if forward_neighbours[bit.bit_length() - 1] & empty:
+                return True
+        pieces = own ^ pawns
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            if NEIGHBOUR_MASKS[bit.bit_length() - 1] & empty:
+                return True
+
+        # Every piece is boxed in, only a capture or a triple king's friendly jump can still move
+        for _ in self._generate_hops(color):
+            return True
+        return False
+
+    def _generate_hops(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move, either "Black" or "White"
+
+        This method is a generator that yields every legal hop for the given color as a tuple of
+        (starting square index, destination square index, mask of the captured squares). Captures are yielded first,
+        quiet moves are only yielded when no capture was found.
+        """
+        board = self._board
+        color_masks = board.get_color_masks()
+        own = color_masks[color]
+
+        # Only the capturing piece may move while a capture sequence is in progress
+        if self._capture_state is True and self._capture_square is not None:
+            if own >> self._capture_square & 1:
+                yield from self._generate_captures(color, 1 << self._capture_square)
+            return
+
+        found_capture = False
+        for hop in self._generate_captures(color, own):
+            found_capture = True
+            yield hop
+        if found_capture is False:
+            yield from self._generate_quiet_moves(color)
+
+    def _generate_captures(self, color, movers):
+        """
+        This class method takes two parameters:
+        color       = string color of the side to move, either "Black" or "White"
+        movers      = mask of the squares whose pieces may capture
+
+        This method is a generator that yields every capture hop available to the given pieces as a tuple of
+        (starting square index, destination square index, mask of the captured squares).
+
+        Pawns jump an adjacent enemy forwards. Kings capture the first piece along any diagonal if it is an enemy,
+        landing on any empty square behind it. Triple kings may also capture two adjacent enemies in one jump.
+        """
+        board = self._board
+        color_masks = board.get_color_masks()
+        enemy = color_masks[OPPONENT[color]]
+        occupied = color_masks["Black"] | color_masks["White"]
+        pawn, king, triple_king = COLOR_PIECES[color]
+
+        # Pawn captures
+        pieces = board.get_mask(pawn) & movers
+        jump_table = PAWN_JUMPS[color]
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            index = bit.bit_length() - 1
+            for jumped, landing in jump_table[index]:
+                if jumped & enemy and not landing & occupied:
+                    yield index, landing.bit_length() - 1, jumped
+
+        # King & triple king captures
+        triple_kings = board.get_mask(triple_king)
+        pieces = (board.get_mask(king) | triple_kings) & movers
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            index = bit.bit_length() - 1
+            for direction, ray in enumerate(RAY_MASKS[index]):
+                blockers = ray & occupied
+                if not blockers:
+                    continue
+                captured = _nearest_square(blockers, direction)
+                if not captured & enemy:
+                    continue
+                captured_index = captured.bit_length() - 1
+                landings = RAY_MASKS[captured_index][direction]
+                # Triple king double capture
+                behind = RAY_STEPS[captured_index][direction]
+                if behind & enemy and bit & triple_kings:
+                    captured |= behind
+                    landings = DOUBLE_JUMP_LANDINGS[captured_index][direction]
+                blockers = landings & occupied
+                if blockers:
+                    landings = _squares_before(landings, _nearest_square(blockers, direction), direction)
+                while landings:
+                    landing = landings & -landings
+                    landings ^= landing
+                    yield index, landing.bit_length() - 1, captured
+
+    def _generate_capture_sequences(self, color, index, path=()):
+        """
+        This class method takes three parameters:
+        color       = string color of the capturing piece
+        index       = 0 - 31 index of the square the piece captures from
+        path        = tuple of the hops already played to reach the square, defaulted to an empty tuple
+
+        This method is a generator that yields every complete capture sequence from the square as a tuple of hops,
+        path first. Each hop is played in place with promotion, the piece keeps capturing from its landing square for
+        as long as it can, and the hop is taken back before the next one is tried. The board holds the end position
+        of a sequence while it is being yielded and is restored once the generator finishes or is closed.
+        """
+        for hop in list(self._generate_captures(color, 1 << index)):
+            self._make_hop(hop, promote=True)
+            try:
+                if self._update_capture_state(color, hop) is True:
+                    yield from self._generate_capture_sequences(color, hop[1], path + (hop,))
+                else:
+                    yield path + (hop,)
+            finally:
+                self._unmake_hop()
+
+    def _generate_quiet_moves(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move, either "Black" or "White"
+
+        This method is a generator that yields every non-capture hop for the given color as a tuple of
+        (starting square index, destination square index, 0). Pawns step one square forwards, kings and triple kings
+        step one square in any direction, and triple kings may also jump a friendly piece to any empty square behind
+        it.
+        """
+        board = self._board
+        color_masks = board.get_color_masks()
+        own = color_masks[color]
+        occupied = color_masks["Black"] | color_masks["White"]
+        pawn, king, triple_king = COLOR_PIECES[color]
+
+        # Pawn steps
+        pieces = board.get_mask(pawn)
+        step_table = PAWN_STEPS[color]
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            index = bit.bit_length() - 1
+            for destination in step_table[index]:
+                if not destination & occupied:
+                    yield index, destination.bit_length() - 1, 0
+
+        # King & triple king steps
+        triple_kings = board.get_mask(triple_king)
+        pieces = board.get_mask(king) | triple_kings
+        while pieces:
+            bit = pieces & -pieces
+            pieces ^= bit
+            index = bit.bit_length() - 1
+            for destination in KING_STEPS[index]:
+                if not destination & occupied:
+                    yield index, destination.bit_length() - 1, 0
+
+            # Triple king friendly jumps
+            if bit & triple_kings:
+                for direction, ray in enumerate(RAY_MASKS[index]):
+                    blockers = ray & occupied
+                    if not blockers:
+                        continue
+                    jumped = _nearest_square(blockers, direction)
+                    if not jumped & own:
+                        continue
+                    landings = RAY_MASKS[jumped.bit_length() - 1][direction]
+                    blockers = landings & occupied
+                    if blockers:
+                        landings = _squares_before(landings, _nearest_square(blockers, direction), direction)
+                    while landings:
+                        landing = landings & -landings
+                        landings ^= landing
+                        yield index, landing.bit_length() - 1, 0
+
+    def analyse_move(self, starting_square_location, destination_square_location):
+        """
+        Class method that takes two parameters:
         starting_square_location     = tuple in (x,y) format representing the starting square a piece is moving from
         destination_square_location  = tuple in (x,y) format representing the square a piece is moving to
 
-        This method evaluates a piece starting location by calling class method 'can_capture' to determine if a piece
-        can capture. If true, the board is changed to reflect the move, including removing the capture piece(s) and
-        updating the data members of the Player objects. If false, simple non-capture movement is made e.x. moving a
-        pawn onto an empty space. The board is changed to reflect the move.
+        This method looks the move up among the legal moves of the piece's color in a single pass and returns a
+        PlyAnalysis holding the hop, whose captured mask is non-zero exactly when capturing was mandatory, and the
+        promotion it earns. If the move is not legal, an InvalidSquare Exception is raised.
         """
-
         starting_row, starting_column = starting_square_location[0], starting_square_location[1]
         destination_row, destination_column = destination_square_location[0], destination_square_location[1]
-        start, player_one, player_two = self.get_checker_details(starting_square_location), None, None
-        white_list, black_list = ["White", "White_king", "White_Triple_King"], ["Black", "Black_king",
-                                                                                "Black_Triple_King"]
-
-        for players in self._players:
-            player_object = self._players[players]
-            if player_object.get_checker_color() == "Black":
-                player_one = player_object
-            else:
-                player_two = player_object
-
-        if self.can_capture(starting_square_location) is True:
-            self._capture_state = True
+
+        if starting_row > 7 or starting_column > 7 or destination_row > 7 or destination_column > 7:
+            raise InvalidSquare
+
+        start, destination = SQUARE_INDEX[starting_row][starting_column], \
+            SQUARE_INDEX[destination_row][destination_column]
+        piece = self._piece_at(starting_square_location)
+        if piece is None or start is None or destination is None:
+            raise InvalidSquare
+
+        # Captures are generated first and quiet moves only when the color has no capture, so the hop found is a
+        # capture exactly when capturing was mandatory
+        for hop in self._generate_hops(PIECE_COLORS[piece]):
+            if hop[0] == start and hop[1] == destination:
+                return PlyAnalysis(hop, self._promotion_for(piece, destination))
+        raise InvalidSquare
+
+    def make_move(self, player_name, starting_square_location, destination_square_location, analysis=None):
+        """
+        Class method that takes four parameters:
+        player_name                  = string containing the moving player's name.
+        starting_square_location     = tuple in (x,y) format representing the starting square a piece is moving from
+        destination_square_location  = tuple in (x,y) format representing the square a piece is moving to
+        analysis                     = the PlyAnalysis of the move from analyse_move, defaulted to None in which case
+                                       the move is analysed here
+
+        This method plays the move described by the analysis. If it is a capture, the board is changed to reflect the
+        move, including removing the captured piece(s) and updating the data members of the Player objects. If it is
+        not, simple non-capture movement is made e.x. moving a pawn onto an empty space. If the move is not legal, an
+        InvalidSquare Exception is raised.
+
+        A move record is pushed onto the move history so the move can be reverted with unmake_move. The record is
+        returned. The capture state is left to the caller: whether the piece must keep capturing depends on its rank
+        after upgrade_piece, so play_game sets the capture state and capture square together once the piece has
+        been upgraded.
+        """
+        if analysis is None:
+            analysis = self.analyse_move(starting_square_location, destination_square_location)
+
+        record = self._make_hop(analysis.get_hop())
+        self._apply_counters(self._players.get(player_name), record, 1)
+        return record
+
+    def unmake_move(self):
+        """
+        Class method that takes no parameters.
+
+        This method reverts the most recent move made with make_move: the moving piece returns to its starting square
+        with the rank it had before the move, captured pieces are put back, the Player data members are restored and
+        the capture state is set back to what it was before the move. The reverted move record is returned, or None if
+        there is no move to revert.
+        """
+        if not self._move_history:
+            return None
+
+        record = self._unmake_hop()
+        self._apply_counters(self._player_for_color(PIECE_COLORS[record[MOVED_PIECE]]), record, -1)
+        return record
+
+    def get_move_history(self):
+        """Class method that returns the list of move records, oldest first."""
+        return self._move_history
+
+    def _make_hop(self, hop, promote=False):
+        """
+        This class method takes two parameters:
+        hop         = a (starting square index, destination square index, captured mask) tuple from _generate_hops
+        promote     = if boolean True, a piece landing on its promotion row is upgraded as part of the same move
+
+        This method moves the piece, removes the captured pieces and pushes a move record onto the move history.
+        Player data members are not touched, this is the in-place step used by make_move and by search. The move
+        record is a tuple of:
+
+        (starting square index, destination square index, moved piece, ((captured square index, captured piece), ...),
+         promoted piece or None, capture state before the move, capture square before the move)
+        """
+        start, destination, captured_mask = hop
+        board = self._board
+        piece = board.get_piece_at_index(start)
+
+        # Remove captured pieces
+        captured = ()
+        while captured_mask:
+            bit = captured_mask & -captured_mask
+            captured_mask ^= bit
+            index = bit.bit_length() - 1
+            captured_piece = board.get_piece_at_index(index)
+            board.toggle_piece(captured_piece, bit)
+            captured += ((index, captured_piece),)
+
+        # Move & promote piece
+        promoted = self._promotion_for(piece, destination) if promote is True else None
+        board.toggle_piece(piece, 1 << start)
+        board.toggle_piece(piece if promoted is None else promoted, 1 << destination)
+
+        record = (start, destination, piece, captured, promoted, self._capture_state, self._capture_square)
+        self._move_history.append(record)
+        return record
+
+    def _unmake_hop(self):
+        """
+        Class method that takes no parameters. Pops the most recent move record from the move history, restores the
+        board and capture state it describes and returns the record. Player data members are not touched.
+        """
+        record = self._move_history.pop()
+        start, destination, piece, captured, promoted, capture_state, capture_square = record
+        board = self._board
+
+        board.toggle_piece(piece if promoted is None else promoted, 1 << destination)
+        board.toggle_piece(piece, 1 << start)
+        for index, captured_piece in captured:
+            board.toggle_piece(captured_piece, 1 << index)
+
+        self._capture_state, self._capture_square = capture_state, capture_square
+        return record
+
+    def _position_hash(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the side to move
+
+        Returns the 64-bit Zobrist hash of the position: the board's incrementally kept piece hash, the side to move,
+        and the square of a piece that must keep capturing, if any.
+        """
+        position_hash = self._board.get_hash()
+        if color == "White":
+            position_hash ^= ZOBRIST_SIDE_KEY
+        if self._capture_state is True and self._capture_square is not None:
+            position_hash ^= ZOBRIST_CAPTURE_SQUARE_KEYS[self._capture_square]
+        return position_hash
+
+    def _update_capture_state(self, color, hop):
+        """
+        This class method takes two parameters:
+        color       = string color of the piece that just made the hop
+        hop         = the hop tuple that was just made
+
+        This method sets the capture state after a hop: if the hop captured and the piece can capture again from its
+        destination, the capture state stays True with the capture square set to the destination and boolean True is
+        returned, meaning the same side moves again. Otherwise the capture state is cleared and False is returned.
+        """
+        if hop[2]:
+            for _ in self._generate_captures(color, 1 << hop[1]):
+                self._capture_state, self._capture_square = True, hop[1]
+                return True
+        self._capture_state, self._capture_square = False, None
+        return False
+
+    def _promotion_for(self, piece, destination):
+        """
+        This class method takes two parameters:
+        piece           = piece code that is moving
+        destination     = 0 - 31 index of the square it lands on
+
+        Returns the piece code it is upgraded to, or None if it is not upgraded. 'Black' pawns upgrade in row 0 and
+        'Black_kings' upgrade in row 7. 'White' pawns upgrade in row 7 and 'White_kings' upgrade in row 0.
+        """
+        if PROMOTION_MASKS[piece] >> destination & 1:
+            return PROMOTED_PIECES[piece]
+        return None
+
+    def _player_for_color(self, color):
+        """Class method that returns the Player object playing the string color, or None if there is none yet."""
+        for player_object in self._players.values():
+            if player_object.get_checker_color() == color:
+                return player_object
+        return None
+
+    def _apply_counters(self, mover, record, direction):
+        """
+        This class method takes three parameters:
+        mover           = the Player object that made the move, or None
+        record          = a move record from the move history
+        direction       = 1 to apply the record's counter changes, -1 to revert them
+
+        This method updates the Player data members for a move: the mover's captured pieces, the opponent's kings
+        and triple kings that were captured, and the mover's kings and triple kings if the piece was promoted.
+        """
+        piece, captured, promoted = record[MOVED_PIECE], record[CAPTURED_PIECES], record[PROMOTED_PIECE]
+        opponent = self._player_for_color(OPPONENT[PIECE_COLORS[piece]])
+
+        if mover is not None:
+            for _ in captured:
+                if direction == 1:
+                    mover.add_captured_pieces()
+                else:
+                    mover.remove_captured_pieces()
+            if promoted is not None:
+                _apply_rank_change(mover, piece, direction)
+                _apply_rank_change(mover, promoted, -direction)
+
+        if opponent is not None:
+            for index, captured_piece in captured:
+                _apply_rank_change(opponent, captured_piece, direction)
+
+
+def _apply_rank_change(player, piece, direction):
+    """
+    Function that takes three parameters:
+    player      = a Player object
+    piece       = piece code leaving the board (direction 1) or returning to it (direction -1)
+    direction   = 1 or -1
+
+    Updates the Player's king and triple king counts for the piece. Pawns are not counted.
+    """
+    rank = piece & RANK_MASK
+    if rank == KING:
+        if direction == 1:
+            player.remove_king()
+        else:
+            player.add_king()
+    elif rank == TRIPLE_KING:
+        if direction == 1:
+            player.remove_triple_king()
         else:
-            self._capture_state = False
-
-        # Basic non capture movement for all pieces
-        if self._capture_state is False:
-            if start == "Black":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "Black"
-            elif start == "Black_king":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "Black_king"
-            elif start == "Black_Triple_King":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "Black_Triple_King"
-            elif start == "White":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "White"
-            elif start == "White_king":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "White_king"
-            elif start == "White_Triple_King":
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "White_Triple_King"
-
-        # Capture movement
-        if self._capture_state is True:
-            # Capture logic for Black Pawn
-            if start == "Black":
-                self._players[player_name].add_captured_pieces()
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "Black"
-                if starting_row != 1 and starting_column == 0:
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                elif starting_column == 7:
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                elif starting_column == 1:
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                elif starting_row != 1 and starting_column == 6:
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                elif starting_row != 1:
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-            # Capture logic for White Pawn
-            elif start == "White":
-                self._players[player_name].add_captured_pieces()
-                self._board[starting_row][starting_column] = None
-                self._board[destination_row][destination_column] = "White"
-                if starting_row != 6 and starting_column == 7:
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                elif starting_column == 0:
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row != 6 and starting_column == 1:
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_column == 6:
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                elif starting_row != 6:
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-            # Capture logic for Black Kings
-            elif start == "Black_king" or start == "Black_Triple_King":
-                self._board[starting_row][starting_column] = None
-                self._players[player_name].add_captured_pieces()
-                if start == "Black_king":
-                    self._board[destination_row][destination_column] = "Black_king"
-                if start == "Black_Triple_King":
-                    self._board[destination_row][destination_column] = "Black_Triple_King"
-                if starting_row == 7 and starting_column == 0:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] in white_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "White_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "White_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 5][starting_column + 5] in white_list and \
-                                self._board[starting_row - 6][starting_column + 6] in white_list and \
-                                self._board[starting_row - 7][starting_column + 7] is not None:
-                            if self._board[starting_row - 5][starting_column + 5] == "White_king" or \
-                                    self._board[starting_row - 6][starting_column + 6] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 5][starting_column + 5] == "White_Triple_King" or \
-                                    self._board[starting_row - 6][starting_column + 6] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._board[starting_row - 6][starting_column + 6] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    elif self._board[starting_row - 5][starting_column + 5] in white_list and \
-                            self._board[starting_row - 6][starting_column + 6] is not None:
-                        if self._board[starting_row - 5][starting_column + 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 5][starting_column + 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 5][starting_column + 5] = None
-                    elif self._board[starting_row - 6][starting_column + 6] in white_list and \
-                            self._board[starting_row - 7][starting_column + 7] is not None:
-                        if self._board[starting_row - 6][starting_column + 6] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 6][starting_column + 6] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 6][starting_column + 6] = None
-                elif starting_row == 7 and starting_column == 2:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] in white_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "White_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "White_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                elif starting_row == 7 and starting_column == 4:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                elif starting_row == 7 and starting_column == 6:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] in white_list and \
-                                self._board[starting_row - 6][starting_column - 6] is not None:
-                            if self._board[starting_row - 4][starting_column - 4] == "White_king" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 4][starting_column - 4] == "White_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._board[starting_row - 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in white_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                elif starting_row == 6 and starting_column == 1:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] in white_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "White_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "White_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    elif self._board[starting_row - 5][starting_column + 5] in white_list and \
-                            self._board[starting_row - 6][starting_column + 6] is not None:
-                        if self._board[starting_row - 5][starting_column + 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 5][starting_column + 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 5][starting_column + 5] = None
-                elif starting_row == 6 and starting_column == 3:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                elif starting_row == 6 and starting_column == 5:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                        self._board[starting_row - 2][starting_column - 2] is not None:
-                    if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                        player_two.remove_king()
-                    elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                        player_two.remove_triple_king()
-                    self._board[starting_row - 1][starting_column - 1] = None
-                elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                        self._board[starting_row - 3][starting_column - 3] is not None:
-                    if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                        player_two.remove_king()
-                    elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                        player_two.remove_triple_king()
-                    self._board[starting_row - 2][starting_column - 2] = None
-                elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                        self._board[starting_row - 4][starting_column - 4] is not None:
-                    if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                        player_two.remove_king()
-                    elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                        player_two.remove_triple_king()
-                    self._board[starting_row - 3][starting_column - 3] = None
-                elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                        self._board[starting_row - 5][starting_column - 5] is not None:
-                    if self._board[starting_row - 4][starting_column - 4] == "White_king":
-                        player_two.remove_king()
-                    elif self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                        player_two.remove_triple_king()
-                    self._board[starting_row - 4][starting_column - 4] = None
-                    # Capture up-right
-                elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                        self._board[starting_row - 2][starting_column + 2] is not None:
-                    if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                        player_two.remove_king()
-                    elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                        player_two.remove_triple_king()
-                    self._board[starting_row - 1][starting_column + 1] = None
-                elif starting_row == 6 and starting_column == 7:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] in white_list and \
-                                self._board[starting_row - 6][starting_column - 6] is not None:
-                            if self._board[starting_row - 4][starting_column - 4] == "White_king" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 4][starting_column - 4] == "White_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._board[starting_row - 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in white_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                elif starting_row == 5 and starting_column == 0:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 2:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] in white_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in white_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 4:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                        # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                        # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 6:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] in white_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                                self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in white_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in white_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                elif starting_row == 4 and starting_column == 1:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 4 and starting_column == 3:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] in white_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in white_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 4 and starting_column == 5:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                        # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 4 and starting_column == 7:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] in white_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in white_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                elif starting_row == 3 and starting_column == 0:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 3 and starting_column == 2:
-                    if start == "Black_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 3 and starting_column == 4:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                                self._board[starting_row - 2][starting_column + 2] in white_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in white_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 3 and starting_column == 6:
-                    if start == "Black_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                                self._board[starting_row - 2][starting_column - 2] in white_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in white_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                elif starting_row == 2 and starting_column == 1:
-                    if start == "Black_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                elif starting_row == 2 and starting_column == 3:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 2 and starting_column == 5:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in white_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 2 and starting_column == 7:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in white_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                elif starting_row == 1 and starting_column == 0:
-                    if start == "Black_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] in white_list and \
-                                self._board[starting_row + 6][starting_column + 6] is not None:
-                            if self._board[starting_row + 4][starting_column + 4] == "White_king" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 4][starting_column + 4] == "White_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._board[starting_row + 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                    elif self._board[starting_row + 5][starting_column + 5] in white_list and \
-                            self._board[starting_row + 6][starting_column + 6] is not None:
-                        if self._board[starting_row + 5][starting_column + 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 5][starting_column + 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 5][starting_column + 5] = None
-                elif starting_row == 1 and starting_column == 2:
-                    if start == "Black_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                elif starting_row == 1 and starting_column == 4:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 1 and starting_column == 6:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] in white_list and \
-                                self._board[starting_row + 6][starting_column - 6] is not None:
-                            if self._board[starting_row + 4][starting_column - 4] == "White_king" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 4][starting_column - 4] == "White_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    elif self._board[starting_row + 5][starting_column - 5] in white_list and \
-                            self._board[starting_row + 6][starting_column - 6] is not None:
-                        if self._board[starting_row + 5][starting_column - 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 5][starting_column - 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 5][starting_column - 5] = None
-                elif starting_row == 0 and starting_column == 1:
-                    if start == "Black_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                                self._board[starting_row + 5][starting_column + 5] in white_list and \
-                                self._board[starting_row + 6][starting_column + 6] is not None:
-                            if self._board[starting_row + 4][starting_column + 4] == "White_king" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 4][starting_column + 4] == "White_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._board[starting_row + 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in white_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                    elif self._board[starting_row + 5][starting_column + 5] in white_list and \
-                            self._board[starting_row + 6][starting_column + 6] is not None:
-                        if self._board[starting_row + 5][starting_column + 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 5][starting_column + 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 5][starting_column + 5] = None
-                elif starting_row == 0 and starting_column == 3:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                                self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                                self._board[starting_row + 3][starting_column + 3] in white_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in white_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in white_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 0 and starting_column == 5:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in white_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 0 and starting_column == 7:
-                    if start == "Black_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                                self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "White_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "White_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                                self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "White_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "White_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                                self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "White_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "White_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                                self._board[starting_row + 5][starting_column - 5] in white_list and \
-                                self._board[starting_row + 6][starting_column - 6] is not None:
-                            if self._board[starting_row + 4][starting_column - 4] == "White_king" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 4][starting_column - 4] == "White_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 5][starting_column - 5] in white_list and \
-                                self._board[starting_row + 6][starting_column - 6] in white_list and \
-                                self._board[starting_row + 7][starting_column - 7] is not None:
-                            if self._board[starting_row + 5][starting_column - 5] == "White_king" or \
-                                    self._board[starting_row + 6][starting_column - 6] == "White_king":
-                                player_two.remove_king()
-                            if self._board[starting_row + 5][starting_column - 5] == "White_Triple_King" or \
-                                    self._board[starting_row + 6][starting_column - 6] == "White_Triple_King":
-                                player_two.remove_triple_king()
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._board[starting_row + 6][starting_column - 6] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in white_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in white_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in white_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in white_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    elif self._board[starting_row + 5][starting_column - 5] in white_list and \
-                            self._board[starting_row + 6][starting_column - 6] is not None:
-                        if self._board[starting_row + 5][starting_column - 5] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 5][starting_column - 5] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 5][starting_column - 5] = None
-                    elif self._board[starting_row + 6][starting_column - 6] in white_list and \
-                            self._board[starting_row + 7][starting_column - 7] is not None:
-                        if self._board[starting_row + 6][starting_column - 6] == "White_king":
-                            player_two.remove_king()
-                        elif self._board[starting_row + 6][starting_column - 6] == "White_Triple_King":
-                            player_two.remove_triple_king()
-                        self._board[starting_row + 6][starting_column - 6] = None
-
-            # Capture logic for White Kings
-            elif start == "White_king" or start == "White_Triple_King":
-                self._board[starting_row][starting_column] = None
-                self._players[player_name].add_captured_pieces()
-                if start == "White_king":
-                    self._board[destination_row][destination_column] = "White_king"
-                if start == "White_Triple_King":
-                    self._board[destination_row][destination_column] = "White_Triple_King"
-                if starting_row == 7 and starting_column == 0:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] in black_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 5][starting_column + 5] in black_list and \
-                                self._board[starting_row - 6][starting_column + 6] in black_list and \
-                                self._board[starting_row - 7][starting_column + 7] is not None:
-                            if self._board[starting_row - 5][starting_column + 5] == "Black_king" or \
-                                    self._board[starting_row - 6][starting_column + 6] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King" or \
-                                    self._board[starting_row - 6][starting_column + 6] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._board[starting_row - 6][starting_column + 6] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    elif self._board[starting_row - 5][starting_column + 5] in black_list and \
-                            self._board[starting_row - 6][starting_column + 6] is not None:
-                        if self._board[starting_row - 5][starting_column + 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 5][starting_column + 5] = None
-                    elif self._board[starting_row - 6][starting_column + 6] in black_list and \
-                            self._board[starting_row - 7][starting_column + 7] is not None:
-                        if self._board[starting_row - 6][starting_column + 6] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 6][starting_column + 6] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 6][starting_column + 6] = None
-                elif starting_row == 7 and starting_column == 2:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] in black_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                elif starting_row == 7 and starting_column == 4:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                elif starting_row == 7 and starting_column == 6:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] in black_list and \
-                                self._board[starting_row - 6][starting_column - 6] is not None:
-                            if self._board[starting_row - 4][starting_column - 4] == "Black_king" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._board[starting_row - 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in black_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                elif starting_row == 6 and starting_column == 1:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] in black_list and \
-                                self._board[starting_row - 6][starting_column + 6] is not None:
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_king" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._board[starting_row - 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    elif self._board[starting_row - 5][starting_column + 5] in black_list and \
-                            self._board[starting_row - 6][starting_column + 6] is not None:
-                        if self._board[starting_row - 5][starting_column + 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 5][starting_column + 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 5][starting_column + 5] = None
-                elif starting_row == 6 and starting_column == 3:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                elif starting_row == 6 and starting_column == 5:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                        self._board[starting_row - 2][starting_column - 2] is not None:
-                    if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                        player_one.remove_king()
-                    elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                        player_one.remove_triple_king()
-                    self._board[starting_row - 1][starting_column - 1] = None
-                elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                        self._board[starting_row - 3][starting_column - 3] is not None:
-                    if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                        player_one.remove_king()
-                    elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                        player_one.remove_triple_king()
-                    self._board[starting_row - 2][starting_column - 2] = None
-                elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                        self._board[starting_row - 4][starting_column - 4] is not None:
-                    if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                        player_one.remove_king()
-                    elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                        player_one.remove_triple_king()
-                    self._board[starting_row - 3][starting_column - 3] = None
-                elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                        self._board[starting_row - 5][starting_column - 5] is not None:
-                    if self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                        player_one.remove_king()
-                    elif self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                        player_one.remove_triple_king()
-                    self._board[starting_row - 4][starting_column - 4] = None
-                    # Capture up-right
-                elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                        self._board[starting_row - 2][starting_column + 2] is not None:
-                    if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                        player_one.remove_king()
-                    elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                        player_one.remove_triple_king()
-                    self._board[starting_row - 1][starting_column + 1] = None
-                elif starting_row == 6 and starting_column == 7:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] in black_list and \
-                                self._board[starting_row - 6][starting_column - 6] is not None:
-                            if self._board[starting_row - 4][starting_column - 4] == "Black_king" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King" or \
-                                    self._board[starting_row - 5][starting_column - 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 4][starting_column - 4] = None
-                            self._board[starting_row - 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in black_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                elif starting_row == 5 and starting_column == 0:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 2:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] in black_list and \
-                                self._board[starting_row - 5][starting_column + 5] is not None:
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._board[starting_row - 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    elif self._board[starting_row - 4][starting_column + 4] in black_list and \
-                            self._board[starting_row - 5][starting_column + 5] is not None:
-                        if self._board[starting_row - 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column + 4] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 4:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                        # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                        # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 5 and starting_column == 6:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] in black_list and \
-                                self._board[starting_row - 5][starting_column - 5] is not None:
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                                self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    elif self._board[starting_row - 4][starting_column - 4] in black_list and \
-                            self._board[starting_row - 5][starting_column - 5] is not None:
-                        if self._board[starting_row - 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 4][starting_column - 4] = None
-                    elif self._board[starting_row - 5][starting_column - 5] in black_list and \
-                            self._board[starting_row - 6][starting_column - 6] is not None:
-                        if self._board[starting_row - 5][starting_column - 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 5][starting_column - 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 5][starting_column - 5] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                elif starting_row == 4 and starting_column == 1:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 4 and starting_column == 3:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] in black_list and \
-                                self._board[starting_row - 4][starting_column + 4] is not None:
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._board[starting_row - 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    elif self._board[starting_row - 3][starting_column + 3] in black_list and \
-                            self._board[starting_row - 4][starting_column + 4] is not None:
-                        if self._board[starting_row - 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column + 3] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 4 and starting_column == 5:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                        # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 4 and starting_column == 7:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] in black_list and \
-                                self._board[starting_row - 4][starting_column - 4] is not None:
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._board[starting_row - 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    elif self._board[starting_row - 3][starting_column - 3] in black_list and \
-                            self._board[starting_row - 4][starting_column - 4] is not None:
-                        if self._board[starting_row - 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 3][starting_column - 3] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                elif starting_row == 3 and starting_column == 0:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 3 and starting_column == 2:
-                    if start == "White_Triple_King":
-                        # Capture up-right double
-                        if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 3 and starting_column == 4:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture up-right double
-                        elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                                self._board[starting_row - 2][starting_column + 2] in black_list and \
-                                self._board[starting_row - 3][starting_column + 3] is not None:
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column + 1] = None
-                            self._board[starting_row - 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    elif self._board[starting_row - 2][starting_column + 2] in black_list and \
-                            self._board[starting_row - 3][starting_column + 3] is not None:
-                        if self._board[starting_row - 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column + 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 3 and starting_column == 6:
-                    if start == "White_Triple_King":
-                        # Capture up-left double
-                        if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                                self._board[starting_row - 2][starting_column - 2] in black_list and \
-                                self._board[starting_row - 3][starting_column - 3] is not None:
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row - 1][starting_column - 1] = None
-                            self._board[starting_row - 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-left double
-                        elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    elif self._board[starting_row - 2][starting_column - 2] in black_list and \
-                            self._board[starting_row - 3][starting_column - 3] is not None:
-                        if self._board[starting_row - 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 2][starting_column - 2] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                elif starting_row == 2 and starting_column == 1:
-                    if start == "White_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-right
-                    if self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                elif starting_row == 2 and starting_column == 3:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 2 and starting_column == 5:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture up-right
-                    elif self._board[starting_row - 1][starting_column + 1] in black_list and \
-                            self._board[starting_row - 2][starting_column + 2] is not None:
-                        if self._board[starting_row - 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column + 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 2 and starting_column == 7:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture up-left
-                    if self._board[starting_row - 1][starting_column - 1] in black_list and \
-                            self._board[starting_row - 2][starting_column - 2] is not None:
-                        if self._board[starting_row - 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row - 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row - 1][starting_column - 1] = None
-                    # Capture down-left
-                    elif self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                elif starting_row == 1 and starting_column == 0:
-                    if start == "White_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] in black_list and \
-                                self._board[starting_row + 6][starting_column + 6] is not None:
-                            if self._board[starting_row + 4][starting_column + 4] == "Black_king" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._board[starting_row + 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                    elif self._board[starting_row + 5][starting_column + 5] in black_list and \
-                            self._board[starting_row + 6][starting_column + 6] is not None:
-                        if self._board[starting_row + 5][starting_column + 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 5][starting_column + 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 5][starting_column + 5] = None
-                elif starting_row == 1 and starting_column == 2:
-                    if start == "White_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                elif starting_row == 1 and starting_column == 4:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                elif starting_row == 1 and starting_column == 6:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] in black_list and \
-                                self._board[starting_row + 6][starting_column - 6] is not None:
-                            if self._board[starting_row + 4][starting_column - 4] == "Black_king" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    elif self._board[starting_row + 5][starting_column - 5] in black_list and \
-                            self._board[starting_row + 6][starting_column - 6] is not None:
-                        if self._board[starting_row + 5][starting_column - 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 5][starting_column - 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 5][starting_column - 5] = None
-                elif starting_row == 0 and starting_column == 1:
-                    if start == "White_Triple_King":
-                        # Capture down-right double
-                        if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] is not None:
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                                self._board[starting_row + 5][starting_column + 5] in black_list and \
-                                self._board[starting_row + 6][starting_column + 6] is not None:
-                            if self._board[starting_row + 4][starting_column + 4] == "Black_king" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column + 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 4][starting_column + 4] = None
-                            self._board[starting_row + 5][starting_column + 5] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-right
-                    if self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                    elif self._board[starting_row + 4][starting_column + 4] in black_list and \
-                            self._board[starting_row + 5][starting_column + 5] is not None:
-                        if self._board[starting_row + 4][starting_column + 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column + 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column + 4] = None
-                    elif self._board[starting_row + 5][starting_column + 5] in black_list and \
-                            self._board[starting_row + 6][starting_column + 6] is not None:
-                        if self._board[starting_row + 5][starting_column + 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 5][starting_column + 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 5][starting_column + 5] = None
-                elif starting_row == 0 and starting_column == 3:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        # Capture down-right double
-                        elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                                self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] is not None:
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column + 1] = None
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                                self._board[starting_row + 3][starting_column + 3] in black_list and \
-                                self._board[starting_row + 4][starting_column + 4] is not None:
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column + 2] = None
-                            self._board[starting_row + 3][starting_column + 3] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                    elif self._board[starting_row + 2][starting_column + 2] in black_list and \
-                            self._board[starting_row + 3][starting_column + 3] is not None:
-                        if self._board[starting_row + 2][starting_column + 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column + 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column + 2] = None
-                    elif self._board[starting_row + 3][starting_column + 3] in black_list and \
-                            self._board[starting_row + 4][starting_column + 4] is not None:
-                        if self._board[starting_row + 3][starting_column + 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column + 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column + 3] = None
-                elif starting_row == 0 and starting_column == 5:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    # Capture down-right
-                    elif self._board[starting_row + 1][starting_column + 1] in black_list and \
-                            self._board[starting_row + 2][starting_column + 2] is not None:
-                        if self._board[starting_row + 1][starting_column + 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column + 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column + 1] = None
-                elif starting_row == 0 and starting_column == 7:
-                    if start == "White_Triple_King":
-                        # Capture down-left double
-                        if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                                self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] is not None:
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_king" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King" or \
-                                    self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 1][starting_column - 1] = None
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                                self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] is not None:
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_king" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King" or \
-                                    self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 2][starting_column - 2] = None
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                                self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] is not None:
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_king" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King" or \
-                                    self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 3][starting_column - 3] = None
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                                self._board[starting_row + 5][starting_column - 5] in black_list and \
-                                self._board[starting_row + 6][starting_column - 6] is not None:
-                            if self._board[starting_row + 4][starting_column - 4] == "Black_king" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King" or \
-                                    self._board[starting_row + 5][starting_column - 5] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 4][starting_column - 4] = None
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._players[player_name].add_captured_pieces()
-                        elif self._board[starting_row + 5][starting_column - 5] in black_list and \
-                                self._board[starting_row + 6][starting_column - 6] in black_list and \
-                                self._board[starting_row + 7][starting_column - 7] is not None:
-                            if self._board[starting_row + 5][starting_column - 5] == "Black_king" or \
-                                    self._board[starting_row + 6][starting_column - 6] == "Black_king":
-                                player_one.remove_king()
-                            if self._board[starting_row + 5][starting_column - 5] == "Black_Triple_King" or \
-                                    self._board[starting_row + 6][starting_column - 6] == "Black_Triple_King":
-                                player_one.remove_triple_king()
-                            self._board[starting_row + 5][starting_column - 5] = None
-                            self._board[starting_row + 6][starting_column - 6] = None
-                            self._players[player_name].add_captured_pieces()
-
-                    # Capture down-left
-                    if self._board[starting_row + 1][starting_column - 1] in black_list and \
-                            self._board[starting_row + 2][starting_column - 2] is not None:
-                        if self._board[starting_row + 1][starting_column - 1] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 1][starting_column - 1] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 1][starting_column - 1] = None
-                    elif self._board[starting_row + 2][starting_column - 2] in black_list and \
-                            self._board[starting_row + 3][starting_column - 3] is not None:
-                        if self._board[starting_row + 2][starting_column - 2] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 2][starting_column - 2] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 2][starting_column - 2] = None
-                    elif self._board[starting_row + 3][starting_column - 3] in black_list and \
-                            self._board[starting_row + 4][starting_column - 4] is not None:
-                        if self._board[starting_row + 3][starting_column - 3] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 3][starting_column - 3] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 3][starting_column - 3] = None
-                    elif self._board[starting_row + 4][starting_column - 4] in black_list and \
-                            self._board[starting_row + 5][starting_column - 5] is not None:
-                        if self._board[starting_row + 4][starting_column - 4] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 4][starting_column - 4] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 4][starting_column - 4] = None
-                    elif self._board[starting_row + 5][starting_column - 5] in black_list and \
-                            self._board[starting_row + 6][starting_column - 6] is not None:
-                        if self._board[starting_row + 5][starting_column - 5] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 5][starting_column - 5] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 5][starting_column - 5] = None
-                    elif self._board[starting_row + 6][starting_column - 6] in black_list and \
-                            self._board[starting_row + 7][starting_column - 7] is not None:
-                        if self._board[starting_row + 6][starting_column - 6] == "Black_king":
-                            player_one.remove_king()
-                        elif self._board[starting_row + 6][starting_column - 6] == "Black_Triple_King":
-                            player_one.remove_triple_king()
-                        self._board[starting_row + 6][starting_column - 6] = None
+            player.add_triple_king()
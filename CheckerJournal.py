@@ -0,0 +1,168 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program defines the "MoveJournal" class, an append-only log of the hops played in a game of
+#              "Checkers", and a streaming replayer that rebuilds a game from it. The journal starts with a header
+#              holding the players and a Position snapshot of the game when journaling started, followed by one
+#              16-bit word per hop:
+#
+#              bits 0 - 4 starting square index, bits 5 - 9 destination square index, bits 10 - 12 flags (CAPTURE,
+#              PROMOTION, CONTINUES)
+#
+#              A word with the UNDO flag records a call to unmake_move. Every word is written as soon as play_game
+#              returns, so a journal is complete up to the last hop even if the process dies. Replay trusts the
+#              journal: hops are applied straight to the board without generating or checking legal moves.
+
+import struct
+
+from CheckerGameLogic import Position, POSITION_BYTES
+from CheckersGame import Checkers
+
+# Hop flags
+CAPTURE, PROMOTION, CONTINUES, UNDO = 1, 2, 4, 8
+
+_DESTINATION_SHIFT = 5
+_FLAGS_SHIFT = 10
+
+# File layout: header, player count, then per player its color (0 for "Black", 1 for "White"), name length and
+# UTF-8 name, then the starting Position, then one little-endian 16-bit word per hop
+_HEADER = struct.Struct("<4sHB")
+_MAGIC = b"CKMJ"
+_VERSION = 1
+_PLAYER = struct.Struct("<BB")
+_WORD = struct.Struct("<H")
+_COLORS = ("Black", "White")
+
+# Words read from the file at a time while replaying
+READ_CHUNK_WORDS = 4096
+
+
+def encode_hop(start, destination, flags):
+    """Function that returns the 16-bit journal word of a hop."""
+    return start | destination << _DESTINATION_SHIFT | flags << _FLAGS_SHIFT
+
+
+def decode_hop(word):
+    """Function that returns the (starting square index, destination square index, flags) tuple of a journal word."""
+    return word & 31, word >> _DESTINATION_SHIFT & 31, word >> _FLAGS_SHIFT
+
+
+class MoveJournal:
+    """Represents an append-only journal of the hops of one game, written as they are played."""
+
+    def __init__(self, path, players, position):
+        """
+        Constructor method that takes three parameters:
+        path            = path of the journal file to create, replacing any file already there
+        players         = an iterable of the game's Player objects
+        position        = the Position snapshot of the game when journaling starts
+
+        The following private data members are initialized:
+
+        file            = the journal file, opened unbuffered so every word reaches the operating system when written
+        hops            = the count of words written after the header
+        """
+        self._file = open(path, "wb", buffering=0)
+        players = list(players)
+        header = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(players)))
+        for player in players:
+            name = player.get_name().encode()
+            header += _PLAYER.pack(_COLORS.index(player.get_checker_color()), len(name)) + name
+        header += position.to_bytes()
+        self._file.write(header)
+        self._hops = 0
+
+    def get_hop_count(self):
+        """Class method that returns the count of words written after the header."""
+        return self._hops
+
+    def append(self, start, destination, flags):
+        """
+        This class method takes three parameters:
+        start           = 0 - 31 index of the square the piece moved from
+        destination     = 0 - 31 index of the square the piece moved to
+        flags           = the hop's flags, CAPTURE, PROMOTION and CONTINUES OR-ed together
+
+        Appends the hop's word to the journal.
+        """
+        self._file.write(_WORD.pack(encode_hop(start, destination, flags)))
+        self._hops += 1
+
+    def append_undo(self):
+        """Class method that appends a word recording that the last hop was taken back."""
+        self._file.write(_WORD.pack(encode_hop(0, 0, UNDO)))
+        self._hops += 1
+
+    def close(self):
+        """Class method that closes the journal file."""
+        self._file.close()
+
+
+def apply_hop(game, start, destination, flags):
+    """
+    Function that takes four parameters:
+    game            = the Checkers object to play the hop in
+    start           = 0 - 31 index of the square the piece moves from
+    destination     = 0 - 31 index of the square the piece moves to
+    flags           = the hop's flags: with CAPTURE, enemy pieces between the two squares are captured, with PROMOTION
+                      the piece is upgraded if it lands on its promotion row, and with CONTINUES the same player keeps
+                      the turn
+
+    Plays the hop straight on the board without checking it is legal, keeping the Player data members, the move
+    history, the turn and the result up to date. Returns the move record.
+    """
+    return game._play_hop(start, destination, bool(flags & CAPTURE), bool(flags & PROMOTION), bool(flags & CONTINUES))
+
+
+def read_journal(file):
+    """
+    Function that takes one parameter:
+    file        = a journal file opened for binary reading
+
+    Reads the header and returns a (players, position, words) tuple: a list of (name, color) tuples, the starting
+    Position and a generator yielding the (starting square index, destination square index, flags) tuple of every
+    word. The words are read READ_CHUNK_WORDS at a time, so memory use does not grow with the journal. A trailing odd
+    byte from a write cut short is ignored.
+    """
+    magic, version, player_count = _HEADER.unpack(file.read(_HEADER.size))
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"not a version {_VERSION} move journal")
+    players = []
+    for _ in range(player_count):
+        color, length = _PLAYER.unpack(file.read(_PLAYER.size))
+        players.append((file.read(length).decode(), _COLORS[color]))
+    position = Position.from_bytes(file.read(POSITION_BYTES))
+
+    def words():
+        while True:
+            chunk = file.read(2 * READ_CHUNK_WORDS)
+            for (word,) in _WORD.iter_unpack(chunk[:len(chunk) & ~1]):
+                yield decode_hop(word)
+            if len(chunk) < 2 * READ_CHUNK_WORDS:
+                return
+
+    return players, position, words()
+
+
+def replay_journal(path):
+    """
+    Function that takes one parameter:
+    path        = path of a journal file written by MoveJournal
+
+    Returns a Checkers object rebuilt from the journal: its players created, its starting position loaded and every
+    hop applied in order. Hops are applied straight to the board, with the captured pieces read from the squares
+    between the hop's start and destination, so hops are not generated or checked. Player data members, the move
+    history and the result are kept up to date, so the game can be played on or taken back as usual.
+    """
+    with open(path, "rb") as file:
+        players, position, words = read_journal(file)
+        game = Checkers.from_snapshot(position)
+        for name, color in players:
+            game.create_player(name, color)
+
+        for start, destination, flags in words:
+            if flags & UNDO:
+                game.unmake_move()
+            else:
+                apply_hop(game, start, destination, flags)
+    return game
@@ -0,0 +1,253 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program defines the "MCTSEngine" class, a Monte Carlo tree search player for the "GameLogic"
+#              rules. The tree is walked with UCT, each hop being one edge, so a capture sequence is several edges
+#              with the same side to move. New leaves are scored by random playouts to the end of the game. Playouts
+#              run in batches across a thread or process pool: while a batch is being chosen, every node on a chosen
+#              path carries a virtual loss, which steers the rest of the batch onto other paths. Each playout starts
+#              from a Position snapshot, so only 25 bytes travel to a worker process.
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from CheckerGameLogic import GameLogic, OPPONENT, Position
+
+DEFAULT_PLAYOUTS = 2000
+EXPLORATION = 1.4
+VIRTUAL_LOSS = 1
+
+# With a pool, each batch hands every worker this many playouts, so the cost of a round trip to the pool is shared
+PLAYOUTS_PER_WORKER = 8
+
+# A playout still running after this many hops is scored as a draw
+MAX_PLAYOUT_HOPS = 200
+
+# Pool kinds
+THREADS, PROCESSES = "threads", "processes"
+
+
+def playout(position_bytes, seed, max_hops=MAX_PLAYOUT_HOPS):
+    """
+    Function that takes three parameters:
+    position_bytes  = the Position to play from, packed with Position.to_bytes
+    seed            = integer seed of the playout's random moves
+    max_hops        = hops after which the playout is scored as a draw
+
+    Plays random legal hops from the position until a side has no legal moves, and returns the string color of the
+    winner, or None for a draw. This is a module function so that process pool workers can run it.
+    """
+    game = GameLogic()
+    color = game.load_position(Position.from_bytes(position_bytes))
+    generator = random.Random(seed)
+    for _ in range(max_hops):
+        hops = list(game._generate_hops(color))
+        if not hops:
+            return OPPONENT[color]
+        hop = hops[generator.randrange(len(hops))]
+        game._make_hop(hop, promote=True)
+        if game._update_capture_state(color, hop) is False:
+            color = OPPONENT[color]
+    return None
+
+
+class Node:
+    """Represents one position of the search tree, reached by a hop from its parent."""
+
+    __slots__ = ("hop", "parent", "color", "children", "untried", "visits", "wins")
+
+    def __init__(self, hop, parent, color, untried):
+        """
+        Constructor method that takes four parameters:
+        hop         = the hop tuple leading to the node from its parent, None for the root
+        parent      = the parent Node, None for the root
+        color       = string color of the side to move at the node
+        untried     = list of the legal hops not yet expanded into children
+
+        The following data members are also initialized:
+
+        children    = list of the expanded child Nodes
+        visits      = the count of playouts through the node, including virtual losses in flight
+        wins        = playout points through the node for the side that made the hop into it, 1 for a win and 0.5
+                      for a draw
+        """
+        self.hop = hop
+        self.parent = parent
+        self.color = color
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MCTSEngine:
+    """Represents a Monte Carlo tree search over the moves of a GameLogic object."""
+
+    def __init__(self, game, workers=1, pool=PROCESSES, exploration=EXPLORATION, virtual_loss=VIRTUAL_LOSS,
+                 seed=None):
+        """
+        Constructor method that takes six parameters:
+        game            = the GameLogic (or Checkers) object to search. Its board is changed during search and
+                          restored before any method returns.
+        workers         = count of playouts run at once, defaulted to 1 which runs them in this thread
+        pool            = PROCESSES or THREADS, the kind of pool the playouts run on when workers is above 1
+        exploration     = the UCT exploration constant, defaulted to 1.4
+        virtual_loss    = visits counted as losses on every node of a path while its playout is in flight
+        seed            = integer seed of the playouts, or None for a random seed
+
+        The following private data members are also initialized:
+
+        executor        = the pool, created on the first search that needs it
+        generator       = the random.Random the playout seeds are drawn from
+        playouts        = the count of playouts of the last search
+        seconds         = the time taken by the last search
+        """
+        self._game = game
+        self._workers = max(1, workers)
+        self._pool = pool
+        self._exploration = exploration
+        self._virtual_loss = virtual_loss
+        self._executor = None
+        self._generator = random.Random(seed)
+        self._playouts = 0
+        self._seconds = 0.0
+
+    def get_playouts(self):
+        """Class method that returns the count of playouts of the last search."""
+        return self._playouts
+
+    def get_seconds(self):
+        """Class method that returns the time taken by the last search in seconds."""
+        return self._seconds
+
+    def get_playouts_per_second(self):
+        """Class method that returns the playout rate of the last search, 0.0 before the first search."""
+        if self._seconds == 0:
+            return 0.0
+        return self._playouts / self._seconds
+
+    def close(self):
+        """Class method that shuts down the engine's pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def search(self, color, playouts=DEFAULT_PLAYOUTS, time_limit=None):
+        """
+        This class method takes three parameters:
+        color       = string color of the side to move, either "Black" or "White"
+        playouts    = count of playouts to run, or None for no limit. A count below 1 runs one playout.
+        time_limit  = seconds the search may run for, or None for no limit. At least one batch of playouts is run.
+                      With neither limit set, DEFAULT_PLAYOUTS are run.
+
+        Grows a tree from the current position until the budget runs out and returns the most visited root hop as a
+        (starting square index, destination square index, captured mask) tuple, or None if the color has no legal
+        moves.
+        """
+        game = self._game
+        root = Node(None, None, color, list(game._generate_hops(color)))
+        if not root.untried:
+            return None
+        if len(root.untried) == 1:
+            self._playouts, self._seconds = 0, 0.0
+            return root.untried[0]
+
+        # The most visited root child is the answer, so at least one playout must expand one
+        if playouts is not None:
+            playouts = max(playouts, 1)
+        elif time_limit is None:
+            playouts = DEFAULT_PLAYOUTS
+
+        start = time.perf_counter()
+        stop_time = None if time_limit is None else start + time_limit
+        completed = 0
+        while playouts is None or completed < playouts:
+            batch = self._workers if self._workers == 1 else self._workers * PLAYOUTS_PER_WORKER
+            if playouts is not None:
+                batch = min(batch, playouts - completed)
+            leaves = [self._select(root) for _ in range(batch)]
+            for leaf, winner in zip(leaves, self._run_playouts(leaves)):
+                self._backpropagate(leaf, winner)
+            completed += batch
+            if stop_time is not None and time.perf_counter() >= stop_time:
+                break
+
+        self._playouts, self._seconds = completed, time.perf_counter() - start
+        return max(root.children, key=lambda child: child.visits).hop
+
+    def _select(self, root):
+        """
+        Class method that walks from the root to a node to play out from, choosing children by UCT and expanding one
+        untried hop on the way. Every node of the path gets a virtual loss. Returns a (node, Position bytes, winner)
+        tuple: winner is already known if the node has no legal moves, otherwise it is None and the playout decides.
+        """
+        game = self._game
+        node, made = root, 0
+        node.visits += self._virtual_loss
+        while not node.untried and node.children:
+            node = self._best_child(node)
+            game._make_hop(node.hop, promote=True)
+            game._update_capture_state(node.parent.color, node.hop)
+            made += 1
+            node.visits += self._virtual_loss
+
+        if node.untried:
+            hop = node.untried.pop(self._generator.randrange(len(node.untried)))
+            game._make_hop(hop, promote=True)
+            made += 1
+            color = node.color if game._update_capture_state(node.color, hop) is True else OPPONENT[node.color]
+            child = Node(hop, node, color, list(game._generate_hops(color)))
+            node.children.append(child)
+            node = child
+            node.visits += self._virtual_loss
+
+        # A node with no legal moves is a loss for its side to move, no playout is needed
+        terminal = OPPONENT[node.color] if not node.untried and not node.children else None
+        position = game.get_position(node.color).to_bytes()
+        for _ in range(made):
+            game._unmake_hop()
+        return node, position, terminal
+
+    def _best_child(self, node):
+        """Class method that returns the child of the node with the highest UCT score."""
+        log_visits = math.log(max(node.visits, 1))
+        exploration = self._exploration
+        best, best_score = None, -1.0
+        for child in node.children:
+            if child.visits == 0:
+                return child
+            score = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _run_playouts(self, leaves):
+        """Class method that returns the winner of a playout from every (node, position, terminal) leaf, in order."""
+        seeds = [self._generator.getrandbits(32) for _ in leaves]
+        pending = [(position, seed) for (_, position, terminal), seed in zip(leaves, seeds) if terminal is None]
+
+        if self._workers == 1 or len(pending) < 2:
+            results = iter([playout(position, seed) for position, seed in pending])
+        else:
+            if self._executor is None:
+                executor = ProcessPoolExecutor if self._pool == PROCESSES else ThreadPoolExecutor
+                self._executor = executor(max_workers=self._workers)
+            positions, seeds = zip(*pending)
+            results = self._executor.map(playout, positions, seeds, chunksize=PLAYOUTS_PER_WORKER)
+
+        return [terminal if terminal is not None else next(results) for _, _, terminal in leaves]
+
+    def _backpropagate(self, leaf, winner):
+        """
+        Class method that takes a (node, position, terminal) leaf and the winner of its playout, removes the virtual
+        loss from every node of the path and adds the playout's result.
+        """
+        node = leaf[0]
+        while node is not None:
+            node.visits += 1 - self._virtual_loss
+            if node.parent is not None:
+                mover = node.parent.color
+                node.wins += 1.0 if winner == mover else 0.5 if winner is None else 0.0
+            node = node.parent
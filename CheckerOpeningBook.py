@@ -0,0 +1,212 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program builds and reads an opening book for the "Checkers" class. Games, from self-play or
+#              imported, are replayed from the initial layout and every hop of their first plies is counted against
+#              the Zobrist hash of the position it was played in, together with the points the mover's side went on
+#              to score. The counts are written as a binary file of fixed-size records sorted by position hash, and the
+#              "OpeningBook" class finds the moves of a position by binary search over the file, read through mmap.
+#              A book move is chosen by the points it scored per game played, among the moves played often enough to
+#              trust that score. By default the book is built from searched self-play games, as the results of random
+#              games say little about the strength of a move.
+#              Run from the command line as: python CheckerOpeningBook.py OUTPUT GAMES [--plies P] [--processes N]
+#              [--search-nodes N]
+
+import argparse
+import mmap
+import struct
+
+from CheckerBitboard import PIECE_COLORS, square_location
+from CheckerGameLogic import GameLogic, OPPONENT, InvalidSquare
+from CheckerSelfPlay import run_self_play
+
+# Only the first plies of a game go into the book
+DEFAULT_BOOK_PLIES = 16
+
+# Moves played fewer times than this are left out of the book
+DEFAULT_MIN_COUNT = 2
+
+# Moves played fewer times than this are never chosen from the book, their points per game being too noisy
+DEFAULT_MIN_GAMES = 8
+
+# Search node budget per move of the self-play games a book is built from
+DEFAULT_BOOK_SEARCH_NODES = 500
+
+# File layout: header, then records of (position hash, starting square index, destination square index, times
+# played, points scored by the mover's side: 2 for a win and 1 for a draw), sorted by hash
+_HEADER = struct.Struct("<4sHI")
+_MAGIC = b"CKOB"
+_VERSION = 1
+_RECORD = struct.Struct("<QBBxxII")
+
+
+def book_entries(games, max_plies=DEFAULT_BOOK_PLIES):
+    """
+    Function that takes two parameters:
+    games       = an iterable of (moves, winner) tuples. moves is a sequence of (starting_square_location,
+                  destination_square_location) tuples, one per hop as passed to play_game, and winner is the string
+                  color of the winning side or None for a draw
+    max_plies   = count of hops of each game to count, defaulted to 16
+
+    Replays every game and returns a dictionary keyed by (position hash, starting square index, destination square
+    index) of [times played, points] lists. A game stops being counted at its first illegal hop.
+    """
+    entries = {}
+    for moves, winner in games:
+        game = GameLogic()
+        color = "Black"
+        for starting_square_location, destination_square_location in moves[:max_plies]:
+            try:
+                piece = game._piece_at(starting_square_location)
+                if piece is None or PIECE_COLORS[piece] != color:
+                    break
+                hop = game.analyse_move(starting_square_location, destination_square_location).get_hop()
+            except InvalidSquare:
+                break
+
+            key = (game._position_hash(color), hop[0], hop[1])
+            entry = entries.setdefault(key, [0, 0])
+            entry[0] += 1
+            entry[1] += 2 if winner == color else 1 if winner is None else 0
+
+            game._make_hop(hop, promote=True)
+            if game._update_capture_state(color, hop) is False:
+                color = OPPONENT[color]
+    return entries
+
+
+def write_opening_book(path, entries, min_count=DEFAULT_MIN_COUNT):
+    """
+    Function that takes three parameters:
+    path        = path of the file to write
+    entries     = a dictionary returned by book_entries
+    min_count   = moves played fewer times than this are left out, defaulted to 2
+
+    Writes the book file with its records sorted by position hash and returns the count of records written.
+    """
+    records = sorted((key, start, destination, count, points)
+                     for (key, start, destination), (count, points) in entries.items() if count >= min_count)
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, len(records)))
+        for record in records:
+            file.write(_RECORD.pack(*record))
+    return len(records)
+
+
+def self_play_games(games, processes=None, seed=0, search_nodes=DEFAULT_BOOK_SEARCH_NODES,
+                    max_plies=DEFAULT_BOOK_PLIES):
+    """
+    Function that takes five parameters, the first four as taken by run_self_play, except that search_nodes defaults
+    to DEFAULT_BOOK_SEARCH_NODES as the command line does, and max_plies, the count of hops each game needs to supply
+    to the book.
+
+    This function is a generator that plays self-play games and yields each as a (moves, winner) tuple for
+    book_entries.
+    """
+    for record in run_self_play(games, processes, seed=seed, search_nodes=search_nodes, record_hops=True):
+        yield [(square_location(start), square_location(destination))
+               for start, destination in record[5][:max_plies]], record[1]
+
+
+class OpeningBook:
+    """Represents an opening book file opened for probing."""
+
+    def __init__(self, path):
+        """
+        Constructor method that takes one parameter:
+        path            = path of a file written by write_opening_book
+
+        The following private data members are initialized:
+
+        file            = the open file object
+        records         = a read-only mmap of the whole file
+        count           = the count of records in the book
+        """
+        self._file = open(path, "rb")
+        self._records = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count = _HEADER.unpack_from(self._records, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {_VERSION} opening book file")
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        """Class method that closes the book's file."""
+        self._records.close()
+        self._file.close()
+
+    def probe(self, position_hash):
+        """
+        This class method takes one parameter:
+        position_hash   = 64-bit Zobrist hash of the position, as returned by Checkers.position_hash
+
+        Returns a list of the book moves of the position as (starting square index, destination square index, times
+        played, points) tuples, empty if the position is not in the book. The first record of the position is found
+        by binary search.
+        """
+        records, low, high = self._records, 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _RECORD.unpack_from(records, _HEADER.size + middle * _RECORD.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        while low < self._count:
+            key, start, destination, count, points = _RECORD.unpack_from(records, _HEADER.size + low * _RECORD.size)
+            if key != position_hash:
+                break
+            moves.append((start, destination, count, points))
+            low += 1
+        return moves
+
+    def choose_move(self, position_hash, generator=None, min_games=DEFAULT_MIN_GAMES):
+        """
+        This class method takes three parameters:
+        position_hash   = 64-bit Zobrist hash of the position
+        generator       = a random.Random used to pick between book moves, or None to always pick the best scoring
+        min_games       = moves played fewer times than this are not chosen, defaulted to 8
+
+        Returns a (starting square index, destination square index) tuple, or None if the position is not in the
+        book, or none of its moves was played at least min_games times. Moves are ranked by the points they scored
+        per game played, ties going to the most played. With a generator, each move is picked with a chance in
+        proportion to its points per game, and None is returned if no move scored any points.
+        """
+        moves = [entry for entry in self.probe(position_hash) if entry[2] >= min_games]
+        if not moves:
+            return None
+        if generator is None:
+            move = max(moves, key=lambda entry: (entry[3] / entry[2], entry[2]))
+        else:
+            weights = [entry[3] / entry[2] for entry in moves]
+            if sum(weights) == 0:
+                return None
+            move = generator.choices(moves, weights=weights)[0]
+        return move[0], move[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build an opening book from self-play games.")
+    parser.add_argument("output", help="path of the opening book file to write")
+    parser.add_argument("games", type=int, help="count of self-play games to play")
+    parser.add_argument("--plies", type=int, default=DEFAULT_BOOK_PLIES, help="hops of each game to count")
+    parser.add_argument("--min-count", type=int, default=DEFAULT_MIN_COUNT, help="least times a move must be played")
+    parser.add_argument("--processes", type=int, default=None, help="count of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the self-play batch")
+    parser.add_argument("--search-nodes", type=int, default=DEFAULT_BOOK_SEARCH_NODES,
+                        help="search node budget per move, 0 plays randomly")
+    arguments = parser.parse_args()
+
+    games = self_play_games(arguments.games, arguments.processes, arguments.seed, arguments.search_nodes,
+                            arguments.plies)
+    entries = book_entries(games, arguments.plies)
+    written = write_opening_book(arguments.output, entries, arguments.min_count)
+    print(f"Wrote {written} book moves to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
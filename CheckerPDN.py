@@ -0,0 +1,274 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program reads and writes games of "Checkers" in Portable Draughts Notation (PDN). The dark
+#              squares are numbered 1 to 32 as on a standard checkers board: square 1 is (7, 6) in the corner of
+#              "Black"'s side and square 32 is (0, 1) in the corner of "White"'s side, so "Black", who moves first,
+#              starts on squares 1 - 12. A move is written as the squares the piece passes through, joined by "-" for
+#              a move that captures nothing and by "x" for a capture sequence, e.g. "11-15" or "15x24x31". A result
+#              of "1-0" is a win for "Black" and "0-1" a win for "White".
+#
+#              Reading and writing are generators that hold one game at a time, so collections of any size are
+#              handled in constant memory. Games can be replayed through Checkers with every move checked, or with
+#              the checks skipped for speed.
+#              Run from the command line as: python CheckerPDN.py FILE [--no-validate]
+
+import argparse
+import re
+import time
+
+from CheckerBitboard import PIECE_COLORS, square_index, square_location
+from CheckerGameLogic import CAPTURED_PIECES, DESTINATION_SQUARE, MOVED_PIECE, START_SQUARE
+from CheckerJournal import CAPTURE, CONTINUES, PROMOTION, apply_hop
+from CheckersGame import Checkers
+
+# Results by winning color and back
+RESULTS = {"Black": "1-0", "White": "0-1", None: "1/2-1/2"}
+_WINNERS = {"1-0": "Black", "2-0": "Black", "0-1": "White", "0-2": "White", "1/2-1/2": None, "1-1": None}
+_RESULT_TOKENS = set(_WINNERS) | {"*"}
+
+# Tags written first, in this order
+SEVEN_TAGS = ("Event", "Site", "Date", "Round", "Black", "White", "Result")
+
+# Movetext lines are wrapped at this width
+LINE_WIDTH = 79
+
+_TAG = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+_TOKEN = re.compile(r'\{[^}]*\}|\{|;.*|\(|\)|[^\s(){};]+')
+_MOVE = re.compile(r'^(?:\d+\.+)?(\d+(?:[-x:]\d+)+)[!?]*$')
+_MOVE_NUMBER = re.compile(r'^\d+\.+$')
+
+
+def pdn_square(square_location):
+    """Function that returns the PDN square number, 1 - 32, of an (x, y) tuple of a dark square."""
+    return 32 - square_index(square_location[0], square_location[1])
+
+
+def pdn_location(number):
+    """Function that returns the (x, y) tuple of a PDN square number, 1 - 32."""
+    if not 1 <= number <= 32:
+        raise ValueError(f"{number} is not a PDN square number")
+    return square_location(32 - number)
+
+
+class PDNGame:
+    """Represents one game read from or written to a PDN file."""
+
+    __slots__ = ("_tags", "_moves", "_result")
+
+    def __init__(self, tags=None, moves=None, result="*"):
+        """
+        Constructor method that takes three parameters:
+        tags        = a dictionary of the game's tag pairs, defaulted to none
+        moves       = a list of moves, each a list of the PDN square numbers the piece passes through
+        result      = the result token, "1-0", "0-1", "1/2-1/2" or "*" for an unfinished game
+        """
+        self._tags = dict(tags) if tags else {}
+        self._moves = list(moves) if moves else []
+        self._result = result
+
+    def get_tags(self):
+        """Class method that returns the dictionary of tag pairs."""
+        return self._tags
+
+    def get_moves(self):
+        """Class method that returns the list of moves, each a list of PDN square numbers."""
+        return self._moves
+
+    def get_result(self):
+        """Class method that returns the result token."""
+        return self._result
+
+    def get_winner(self):
+        """Class method that returns the string color of the winner, None for a draw or an unfinished game."""
+        return _WINNERS.get(self._result)
+
+
+def read_pdn(file):
+    """
+    Function that takes one parameter:
+    file        = a text file, or any iterable of lines, holding PDN games
+
+    This function is a generator that yields a PDNGame for every game in the file, reading one line at a time.
+    Comments, variations, move numbers and move annotations are skipped. A game ends at its result token, or where
+    the tag pairs of the next game begin.
+    """
+    tags, moves = {}, []
+    in_comment, variation_depth = False, 0
+
+    for line in file:
+        if in_comment:
+            end = line.find("}")
+            if end < 0:
+                continue
+            in_comment, line = False, line[end + 1:]
+
+        if variation_depth == 0 and line.lstrip().startswith("["):
+            if moves:
+                yield PDNGame(tags, moves, tags.get("Result", "*"))
+                tags, moves = {}, []
+            for name, value in _TAG.findall(line):
+                tags[name] = value
+            continue
+
+        for token in _TOKEN.findall(line):
+            if token == "{":
+                in_comment = True
+                break
+            if token[0] in "{;":
+                if token[0] == ";":
+                    break
+                continue
+            if token == "(":
+                variation_depth += 1
+            elif token == ")":
+                variation_depth = max(variation_depth - 1, 0)
+            elif variation_depth > 0 or _MOVE_NUMBER.match(token):
+                continue
+            elif token in _RESULT_TOKENS:
+                yield PDNGame(tags, moves, token)
+                tags, moves = {}, []
+            else:
+                move = _MOVE.match(token)
+                if move is not None:
+                    moves.append([int(square) for square in re.split("[-x:]", move.group(1))])
+
+    if moves or tags:
+        yield PDNGame(tags, moves, tags.get("Result", "*"))
+
+
+def format_move(squares, capture):
+    """Function that returns the PDN text of a move from its list of square numbers and whether it captures."""
+    return ("x" if capture else "-").join(str(square) for square in squares)
+
+
+def write_pdn(file, games):
+    """
+    Function that takes two parameters:
+    file        = a text file opened for writing
+    games       = an iterable of PDNGame objects, or of (PDNGame, list of capture flags) tuples as made by
+                  game_to_pdn when the capture flags are known
+
+    Writes every game to the file as it is produced, the seven standard tags first, and returns the count of games
+    written. Without capture flags, a move of more than two squares is written as a capture and any other move with
+    "-".
+    """
+    count = 0
+    for game in games:
+        captures = None
+        if isinstance(game, tuple):
+            game, captures = game
+        tags = dict(game.get_tags())
+        tags["Result"] = game.get_result()
+        for name in SEVEN_TAGS:
+            if name in tags:
+                file.write(f'[{name} "{tags.pop(name)}"]\n')
+        for name, value in tags.items():
+            file.write(f'[{name} "{value}"]\n')
+
+        line = ""
+        for number, squares in enumerate(game.get_moves()):
+            capture = captures[number] if captures is not None else len(squares) > 2
+            token = format_move(squares, capture)
+            if number % 2 == 0:
+                token = f"{number // 2 + 1}. {token}"
+            if line and len(line) + 1 + len(token) > LINE_WIDTH:
+                file.write(line + "\n")
+                line = ""
+            line = f"{line} {token}" if line else token
+        result = game.get_result()
+        file.write((f"{line} {result}" if line else result) + "\n\n")
+        count += 1
+    return count
+
+
+def game_to_pdn(game, tags=None):
+    """
+    Function that takes two parameters:
+    game        = a Checkers object
+    tags        = a dictionary of extra tag pairs, defaulted to none
+
+    Returns a (PDNGame, list of capture flags) tuple of the game's move history, ready for write_pdn. The hops of a
+    capture sequence are joined into one move. Player names are written to the "Black" and "White" tags.
+    """
+    tags = dict(tags) if tags else {}
+    for player in game.get_players().values():
+        tags.setdefault(player.get_checker_color(), player.get_name())
+
+    moves, captures, previous_color = [], [], None
+    for record in game.get_move_history():
+        color = PIECE_COLORS[record[MOVED_PIECE]]
+        start, destination = 32 - record[START_SQUARE], 32 - record[DESTINATION_SQUARE]
+        if color == previous_color and moves and moves[-1][-1] == start and captures[-1]:
+            moves[-1].append(destination)
+        else:
+            moves.append([start, destination])
+            captures.append(bool(record[CAPTURED_PIECES]))
+        previous_color = color
+
+    result = RESULTS[game._winner] if game._game_won else "*"
+    return PDNGame(tags, moves, result), captures
+
+
+def replay_pdn_game(pdn_game, validate=True):
+    """
+    Function that takes two parameters:
+    pdn_game    = a PDNGame
+    validate    = if boolean True, every move is played through Checkers.play_sequence and an illegal move raises
+                  its exception. A capture written with only its first and last squares is expanded to the one
+                  capture sequence that fits. If False, the moves are played straight on the board without any
+                  checks, which needs every square of a capture sequence to be written.
+
+    Returns a Checkers object holding the game after its last move, with players named from the "Black" and "White"
+    tags.
+    """
+    game = Checkers()
+    black_name = pdn_game.get_tags().get("Black", "Black")
+    white_name = pdn_game.get_tags().get("White", "White")
+    if black_name == white_name:
+        black_name, white_name = "Black", "White"
+    game.create_player(black_name, "Black")
+    game.create_player(white_name, "White")
+    names = {"Black": black_name, "White": white_name}
+
+    for squares in pdn_game.get_moves():
+        if validate is False:
+            last = len(squares) - 2
+            for hop, (start, destination) in enumerate(zip(squares, squares[1:])):
+                apply_hop(game, 32 - start, 32 - destination, CAPTURE | PROMOTION | (CONTINUES if hop < last else 0))
+            continue
+
+        locations = [pdn_location(square) for square in squares]
+        if len(locations) == 2:
+            for sequence in game.capture_sequences(locations[0]):
+                if sequence[-1] == locations[1]:
+                    locations = sequence
+                    break
+        game.play_sequence(names[game.get_turn()], locations)
+    return game
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay every game of a PDN file.")
+    parser.add_argument("file", help="path of the PDN file to read")
+    parser.add_argument("--no-validate", action="store_true", help="play moves without checking they are legal")
+    arguments = parser.parse_args()
+
+    games = failed = hops = 0
+    start = time.perf_counter()
+    with open(arguments.file, encoding="utf-8", errors="replace") as file:
+        for pdn_game in read_pdn(file):
+            games += 1
+            try:
+                hops += len(replay_pdn_game(pdn_game, not arguments.no_validate).get_move_history())
+            except Exception as exception:
+                failed += 1
+                print(f"Game {games}: {type(exception).__name__} {exception}")
+    seconds = time.perf_counter() - start
+
+    print(f"Games: {games}, failed: {failed}, hops: {hops}")
+    print(f"Time: {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program counts the leaf nodes of the legal move tree ("perft") of a "GameLogic" position. It is
+#              both a correctness check for the move generator and a throughput benchmark for make and unmake. One
+#              level of the tree is one hop, the same unit as a play_game call, so a double capture takes two levels.
+#              A set of reference positions with known node counts covers pawn, king and triple king captures.
+#              Run from the command line as: python CheckerPerft.py DEPTH [--position NAME] [--divide] [--verify]
+
+import argparse
+import time
+
+from CheckerGameLogic import GameLogic, OPPONENT
+from CheckerTables import SQUARE_LOCATION
+
+# Diagram tokens, one per square separated by spaces, rows from 0 to 7
+DIAGRAM_PIECES = {".": None, "b": "Black", "bk": "Black_king", "bt": "Black_Triple_King",
+                  "w": "White", "wk": "White_king", "wt": "White_Triple_King"}
+
+# Reference positions: (diagram, color to move, {depth: leaf nodes})
+REFERENCE_POSITIONS = {
+    "initial": ((". w . w . w . w",
+                 "w . w . w . w .",
+                 ". w . w . w . w",
+                 ". . . . . . . .",
+                 ". . . . . . . .",
+                 "b . b . b . b .",
+                 ". b . b . b . b",
+                 "b . b . b . b ."),
+                "Black", {1: 7, 2: 49, 3: 302, 4: 1469, 5: 7361, 6: 36768}),
+    "flying_kings": ((". . . . . . . .",
+                      ". . . . w . . .",
+                      ". . . . . . . .",
+                      ". . bk . . . . .",
+                      ". . . . . . . .",
+                      "w . . . . . wk .",
+                      ". . . . . . . .",
+                      ". . . . . . . ."),
+                     "Black", {1: 1, 2: 5, 3: 10, 4: 42, 5: 137, 6: 563, 7: 1174}),
+    "triple_kings": ((". . . . . . . .",
+                      ". . . . . . . .",
+                      ". . . . . w . .",
+                      ". . . . w . . .",
+                      ". . . . . . . .",
+                      ". . b . . . . .",
+                      ". . . . . . . .",
+                      "bt . . . wt . . ."),
+                     "Black", {1: 4, 2: 6, 3: 12, 4: 32, 5: 76, 6: 220, 7: 575}),
+    "capture_chain": ((". . . . . . . .",
+                       ". . . . . . . .",
+                       ". w . w . . . .",
+                       ". . . . . . . .",
+                       ". w . w . . . .",
+                       "b . . . . . . .",
+                       ". . . . . . . .",
+                       ". . . . . . . ."),
+                      "Black", {1: 1, 2: 2, 3: 8, 4: 12, 5: 42, 6: 90, 7: 250}),
+    "promotion": ((". . . . . . . .",
+                   "b . b . . . . .",
+                   ". . . . . . . .",
+                   ". . . . . . . .",
+                   ". . . . . . . .",
+                   ". . . . . . . .",
+                   ". . . . . w . .",
+                   ". . . . wk . . ."),
+                  "Black", {1: 3, 2: 6, 3: 12, 4: 60, 5: 258, 6: 1125, 7: 3817}),
+}
+
+
+def parse_diagram(rows):
+    """
+    Function that takes one parameter:
+    rows        = 8 strings of 8 space separated DIAGRAM_PIECES tokens, row 0 first
+
+    Returns the board as a list of 8 lists of 8 string pieces or None, the format taken by GameLogic.load_board.
+    """
+    return [[DIAGRAM_PIECES[token] for token in row.split()] for row in rows]
+
+
+def load_reference_position(name):
+    """
+    Function that takes one parameter:
+    name        = key of a REFERENCE_POSITIONS entry
+
+    Returns a (GameLogic object, color to move) tuple set up with the reference position.
+    """
+    rows, color, _ = REFERENCE_POSITIONS[name]
+    game = GameLogic()
+    game.load_board(parse_diagram(rows))
+    return game, color
+
+
+def perft(game, color, depth):
+    """
+    Function that takes three parameters:
+    game        = a GameLogic object, restored to its starting position before returning
+    color       = string color of the side to move
+    depth       = count of hops to walk down the move tree
+
+    Returns the count of leaf nodes of the legal move tree at the given depth. While a piece must keep capturing,
+    the same color stays to move. A negative depth raises a ValueError.
+    """
+    if depth < 0:
+        raise ValueError(f"perft depth must be at least 0, got {depth}")
+    return _perft(game, color, depth)
+
+
+def _perft(game, color, depth):
+    """Function that counts the leaf nodes of perft, the depth already checked."""
+    if depth == 0:
+        return 1
+    if depth == 1:
+        return sum(1 for _ in game._generate_hops(color))
+
+    nodes = 0
+    for hop in list(game._generate_hops(color)):
+        game._make_hop(hop, promote=True)
+        if game._update_capture_state(color, hop) is True:
+            nodes += _perft(game, color, depth - 1)
+        else:
+            nodes += _perft(game, OPPONENT[color], depth - 1)
+        game._unmake_hop()
+    return nodes
+
+
+def divide(game, color, depth):
+    """
+    Function that takes three parameters:
+    game        = a GameLogic object, restored to its starting position before returning
+    color       = string color of the side to move
+    depth       = count of hops to walk down the move tree, at least 1
+
+    Returns a list of (starting_square_location, destination_square_location, leaf nodes) tuples, one per root move,
+    so a wrong total can be traced to the move whose subtree is wrong. A depth below 1 raises a ValueError.
+    """
+    if depth < 1:
+        raise ValueError(f"divide depth must be at least 1, got {depth}")
+    results = []
+    for hop in list(game._generate_hops(color)):
+        game._make_hop(hop, promote=True)
+        if game._update_capture_state(color, hop) is True:
+            nodes = _perft(game, color, depth - 1)
+        else:
+            nodes = _perft(game, OPPONENT[color], depth - 1)
+        game._unmake_hop()
+        results.append((SQUARE_LOCATION[hop[0]], SQUARE_LOCATION[hop[1]], nodes))
+    return results
+
+
+def timed_perft(game, color, depth):
+    """
+    Function that takes the same parameters as perft and returns a (leaf nodes, seconds, nodes per second) tuple.
+    """
+    start = time.perf_counter()
+    nodes = perft(game, color, depth)
+    seconds = time.perf_counter() - start
+    return nodes, seconds, nodes / seconds if seconds > 0 else 0.0
+
+
+def verify_reference_positions(max_depth=None):
+    """
+    Function that takes one parameter:
+    max_depth   = deepest depth to check, or None to check every depth listed
+
+    Runs perft on every reference position and returns a list of (name, depth, expected, found) tuples for every
+    count that does not match. An empty list means the move generator agrees with every reference count.
+    """
+    failures = []
+    for name, (_, _, counts) in REFERENCE_POSITIONS.items():
+        for depth, expected in sorted(counts.items()):
+            if max_depth is not None and depth > max_depth:
+                continue
+            game, color = load_reference_position(name)
+            found = perft(game, color, depth)
+            if found != expected:
+                failures.append((name, depth, expected, found))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count the leaf nodes of the legal move tree.")
+    parser.add_argument("depth", type=int, help="count of hops to walk down the move tree")
+    parser.add_argument("--position", default="initial", choices=sorted(REFERENCE_POSITIONS),
+                        help="reference position to start from")
+    parser.add_argument("--divide", action="store_true", help="print the leaf count of every root move")
+    parser.add_argument("--verify", action="store_true", help="check every reference position up to depth")
+    arguments = parser.parse_args()
+
+    if arguments.verify:
+        failures = verify_reference_positions(arguments.depth)
+        for name, depth, expected, found in failures:
+            print(f"{name} depth {depth}: expected {expected}, found {found}")
+        print("All reference counts match." if not failures else f"{len(failures)} counts do not match.")
+        return
+
+    game, color = load_reference_position(arguments.position)
+    if arguments.divide:
+        for start, destination, nodes in divide(game, color, arguments.depth):
+            print(f"{start} -> {destination}: {nodes}")
+
+    nodes, seconds, nodes_per_second = timed_perft(game, color, arguments.depth)
+    print(f"Nodes: {nodes}")
+    print(f"Time: {seconds:.3f}s")
+    print(f"Nodes per second: {nodes_per_second:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program defines the "SearchEngine" class, an alpha-beta game tree search for the "GameLogic"
+#              rules. The engine searches a game in place: every hop is made with GameLogic._make_hop and taken back
+#              with GameLogic._unmake_hop, so the game is never copied. Search uses negamax with iterative deepening,
+#              captures-first, killer and history move ordering, and stops when its time or node budget runs out.
+#              A capture sequence is searched one hop at a time: while the same piece must keep capturing, the same
+#              side stays to move and no search depth is used up. Results are cached in a TranspositionTable keyed by
+#              the position hash, so positions reached through different move orders are only searched once.
+#              Positions covered by an endgame Tablebase are scored from the table instead of being searched.
+
+import time
+
+from CheckerBitboard import COLOR_PIECES
+from CheckerGameLogic import KING_VALUE, OPPONENT, PAWN_VALUE, TRIPLE_KING_VALUE
+from CheckerTablebase import LOSS, WIN
+from CheckerTransposition import DEFAULT_SIZE_MB, EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+# Scores are in hundredths of a pawn
+WIN_SCORE = 100000
+
+# Bonus per row a pawn has advanced towards promotion
+ADVANCE_BONUS = 4
+
+# Rows of the 32 dark squares, square index // 4
+_SQUARE_ROW = tuple(index // 4 for index in range(32))
+
+MAX_DEPTH = 64
+KILLER_SLOTS = 2
+CHECK_INTERVAL = 1024
+
+
+class SearchEngine:
+    """Represents an alpha-beta search over the moves of a GameLogic object."""
+
+    def __init__(self, game, table_size_mb=DEFAULT_SIZE_MB, tablebase=None, table=None):
+        """
+        Constructor method that takes four parameters:
+        game            = the GameLogic (or Checkers) object to search. Its board is changed during search and
+                          restored before any method returns.
+        table_size_mb   = megabytes of memory for the transposition table, defaulted to 16
+        tablebase       = an endgame Tablebase probed for positions it covers, defaulted to None
+        table           = a TranspositionTable to search with, e.g. one owned by the game, defaulted to None. If None,
+                          a table of table_size_mb megabytes is allocated.
+
+        The following private data members are initialized:
+
+        table           = the TranspositionTable shared by every search of this engine
+
+        nodes           = the count of positions visited by the last search
+        depth           = the deepest fully completed iteration of the last search
+        score           = the score of the best move found by the last search, from the mover's point of view
+        killers         = per ply, the last quiet moves that caused a beta cutoff
+        history         = per (start, destination) square pair, a score raised every time that move causes a cutoff
+        stop_time       = the perf_counter time the search must stop at, or None
+        node_limit      = the count of nodes the search must stop at, or None
+        stopped         = boolean True once the time or node budget ran out
+        """
+        self._game = game
+        self._table = table if table is not None else TranspositionTable(table_size_mb)
+        self._tablebase = tablebase
+        self._nodes = 0
+        self._depth = 0
+        self._score = 0
+        self._killers = [[None] * KILLER_SLOTS for _ in range(MAX_DEPTH * 4)]
+        self._history = [[0] * 32 for _ in range(32)]
+        self._stop_time = None
+        self._node_limit = None
+        self._stopped = False
+
+    def get_nodes(self):
+        """Class method that returns the count of positions visited by the last search."""
+        return self._nodes
+
+    def get_depth(self):
+        """Class method that returns the deepest fully completed iteration of the last search."""
+        return self._depth
+
+    def get_score(self):
+        """Class method that returns the score of the best move of the last search."""
+        return self._score
+
+    def get_table(self):
+        """Class method that returns the engine's TranspositionTable, e.g. to read its hit rate."""
+        return self._table
+
+    def set_table(self, table):
+        """Class method that sets the TranspositionTable used by later searches."""
+        self._table = table
+
+    def set_tablebase(self, tablebase):
+        """Class method that sets the endgame Tablebase probed during search, or None to stop probing."""
+        self._tablebase = tablebase
+
+    def search(self, color, time_limit=None, max_depth=MAX_DEPTH, node_limit=None):
+        """
+        This class method takes four parameters:
+        color           = string color of the side to move, either "Black" or "White"
+        time_limit      = seconds the search may run for, or None for no limit
+        max_depth       = deepest iteration to search, counted in turns
+        node_limit      = count of positions the search may visit, or None for no limit
+
+        This method runs iterative deepening from depth 1 up to max_depth, stopping early when the time or node
+        budget runs out. The best hop of the deepest completed iteration is returned as a (starting square index,
+        destination square index, captured mask) tuple, or None if the color has no legal moves. The budget is not
+        checked until the first iteration has finished, so depth 1 is always completed, even past the budget.
+        """
+        game = self._game
+        root_hops = list(game._generate_hops(color))
+        if not root_hops:
+            return None
+
+        self._nodes, self._depth, self._score, self._stopped = 0, 0, 0, False
+        self._stop_time = None if time_limit is None else time.perf_counter() + time_limit
+        self._node_limit = node_limit
+        self._killers = [[None] * KILLER_SLOTS for _ in range(MAX_DEPTH * 4)]
+        self._history = [[0] * 32 for _ in range(32)]
+
+        best_hop = root_hops[0]
+        if len(root_hops) == 1:
+            return best_hop
+
+        for depth in range(1, max_depth + 1):
+            score, hop = self._search_root(color, root_hops, depth, best_hop)
+            if self._stopped and depth > 1:
+                break
+            best_hop, self._score, self._depth = hop, score, depth
+            if self._stopped or abs(score) >= WIN_SCORE - MAX_DEPTH * 4:
+                break
+        return best_hop
+
+    def _search_root(self, color, root_hops, depth, previous_best):
+        """
+        This class method searches every root hop to the given depth, the previous iteration's best hop first, and
+        returns a (score, hop) tuple for the best one.
+        """
+        game = self._game
+        alpha, beta = -WIN_SCORE - 1, WIN_SCORE + 1
+        best_score, best_hop = -WIN_SCORE - 1, previous_best
+        hops = [previous_best] + [hop for hop in self._order(root_hops, 0) if hop != previous_best]
+
+        for hop in hops:
+            game._make_hop(hop, promote=True)
+            if game._update_capture_state(color, hop) is True:
+                score = self._negamax(color, depth, alpha, beta, 1)
+            else:
+                score = -self._negamax(OPPONENT[color], depth - 1, -beta, -alpha, 1)
+            game._unmake_hop()
+            if self._stopped:
+                break
+            if score > best_score:
+                best_score, best_hop = score, hop
+            if score > alpha:
+                alpha = score
+        return best_score, best_hop
+
+    def _negamax(self, color, depth, alpha, beta, ply):
+        """
+        This class method returns the score of the position for the side to move, searched to the given depth with
+        an (alpha, beta) window.
+        """
+        self._nodes += 1
+        if self._nodes % CHECK_INTERVAL == 0:
+            self._check_budget()
+        if self._stopped:
+            return 0
+
+        game = self._game
+
+        # Endgame tablebase result, scored like a win or loss found by search
+        if self._tablebase is not None:
+            entry = self._tablebase.probe(game, color)
+            if entry is not None:
+                result, distance = entry
+                if result == WIN:
+                    return WIN_SCORE - ply - distance
+                if result == LOSS:
+                    return -WIN_SCORE + ply + distance
+                return 0
+
+        hops = list(game._generate_hops(color))
+
+        # No legal moves, the side to move has lost
+        if not hops:
+            return -WIN_SCORE + ply
+        if depth <= 0 and not game._capture_state:
+            return self.evaluate(color)
+
+        # Transposition table cutoff
+        key = game._position_hash(color)
+        entry = self._table.probe(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, flag, score, table_move = entry
+            if entry_depth >= depth:
+                score = _score_from_table(score, ply)
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND and score > alpha:
+                    alpha = score
+                elif flag == UPPER_BOUND and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        original_alpha = alpha
+        best_score, best_move = -WIN_SCORE - 1, None
+        for hop in self._order(hops, ply, table_move):
+            game._make_hop(hop, promote=True)
+            if game._update_capture_state(color, hop) is True:
+                score = self._negamax(color, depth, alpha, beta, ply + 1)
+            else:
+                score = -self._negamax(OPPONENT[color], depth - 1, -beta, -alpha, ply + 1)
+            game._unmake_hop()
+            if self._stopped:
+                return 0
+
+            if score > best_score:
+                best_score, best_move = score, (hop[0], hop[1])
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not hop[2]:
+                    self._store_cutoff(hop, ply, depth)
+                break
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._table.store(key, depth, flag, _score_to_table(best_score, ply), best_move)
+        return best_score
+
+    def _order(self, hops, ply, table_move=None):
+        """
+        This class method returns the hops sorted for search: the transposition table's best move first, then
+        captures (most pieces taken first), then the killer moves of this ply, then the remaining quiet moves by
+        history score.
+        """
+        if len(hops) < 2:
+            return hops
+        killers = self._killers[ply] if ply < len(self._killers) else ()
+        history = self._history
+
+        def key(hop):
+            if table_move is not None and hop[0] == table_move[0] and hop[1] == table_move[1]:
+                return 4000000
+            if hop[2]:
+                return 3000000 + hop[2].bit_count()
+            if (hop[0], hop[1]) in killers:
+                return 2000000
+            return history[hop[0]][hop[1]]
+
+        return sorted(hops, key=key, reverse=True)
+
+    def _store_cutoff(self, hop, ply, depth):
+        """Class method that records a quiet hop that caused a beta cutoff in the killer and history tables."""
+        move = (hop[0], hop[1])
+        if ply < len(self._killers):
+            killers = self._killers[ply]
+            if killers[0] != move:
+                killers[1], killers[0] = killers[0], move
+        self._history[hop[0]][hop[1]] += depth * depth
+
+    def _check_budget(self):
+        """
+        Class method that sets the stopped flag once the time or node budget has run out. The budget is only checked
+        once an iteration has completed, so the returned hop always comes from a full iteration.
+        """
+        if self._depth == 0:
+            return
+        if self._node_limit is not None and self._nodes >= self._node_limit:
+            self._stopped = True
+        elif self._stop_time is not None and time.perf_counter() >= self._stop_time:
+            self._stopped = True
+
+    def evaluate(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color to score the position for
+
+        Returns the static score of the board from the given color's point of view: material, plus a bonus for
+        every row a pawn has advanced towards promotion.
+        """
+        board = self._game._board
+        score = 0
+        for side, sign in ((color, 1), (OPPONENT[color], -1)):
+            pawn, king, triple_king = COLOR_PIECES[side]
+            pawns = board.get_mask(pawn)
+            material = (board.get_count(pawn) * PAWN_VALUE + board.get_count(king) * KING_VALUE +
+                        board.get_count(triple_king) * TRIPLE_KING_VALUE)
+
+            # Advancement, 'Black' pawns move towards row 0 and 'White' pawns towards row 7
+            advance = 0
+            while pawns:
+                bit = pawns & -pawns
+                pawns ^= bit
+                row = _SQUARE_ROW[bit.bit_length() - 1]
+                advance += 7 - row if side == "Black" else row
+            score += sign * (material + advance * ADVANCE_BONUS)
+        return score
+
+
+def _score_to_table(score, ply):
+    """Function that converts a win or loss score from distance-from-root to distance-from-node for storing."""
+    if score >= WIN_SCORE - MAX_DEPTH * 4:
+        return score + ply
+    if score <= -WIN_SCORE + MAX_DEPTH * 4:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    """Function that converts a stored win or loss score back to distance-from-root at the given ply."""
+    if score >= WIN_SCORE - MAX_DEPTH * 4:
+        return score - ply
+    if score <= -WIN_SCORE + MAX_DEPTH * 4:
+        return score + ply
+    return score
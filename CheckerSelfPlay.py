@@ -0,0 +1,154 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program plays batches of independent self-play games of checkers across a multiprocessing pool.
+#              Games are handed to the workers in chunks and each game is seeded from the batch seed and its own
+#              index, so a batch gives the same results whatever the worker count or scheduling order. Each finished
+#              game streams back as a compact record tuple:
+#
+#              (game index, winning color or None for a draw, hops played, pieces captured by "Black",
+#               pieces captured by "White")
+#
+#              Asked to record hops, a record gains a sixth field: a tuple of the (starting square index, destination
+#              square index) pair of every hop played, in order.
+#              Given an endgame tablebase, a game ends as soon as it reaches a position the table covers.
+#              Run from the command line as: python CheckerSelfPlay.py GAMES [--processes N] [--seed S]
+
+import argparse
+import multiprocessing
+import random
+import time
+from functools import partial
+
+from CheckerGameLogic import GameLogic, OPPONENT
+from CheckerSearch import SearchEngine
+from CheckerTablebase import LOSS, WIN, Tablebase
+
+# A game still running after this many hops is scored as a draw
+MAX_GAME_HOPS = 400
+DEFAULT_CHUNK_SIZE = 16
+
+# Transposition table size for each worker's search engine
+SELF_PLAY_TABLE_MB = 1
+
+# Searched games open with this many random hops so that games in a batch differ
+RANDOM_OPENING_HOPS = 4
+
+# Tablebases opened by this process, keyed by path, so each worker maps a file once
+_TABLEBASES = {}
+
+
+def _open_tablebase(path):
+    """Function that returns the Tablebase at path, opening it the first time this process asks for it."""
+    if path not in _TABLEBASES:
+        _TABLEBASES[path] = Tablebase(path)
+    return _TABLEBASES[path]
+
+
+def play_self_play_game(game_index, seed=0, max_hops=MAX_GAME_HOPS, search_nodes=0, tablebase_path=None,
+                        record_hops=False):
+    """
+    Function that takes six parameters:
+    game_index      = integer index of the game within its batch
+    seed            = integer seed of the batch, defaulted to 0
+    max_hops        = hops after which the game is scored as a draw
+    search_nodes    = if 0, both sides play random legal moves. Otherwise, after RANDOM_OPENING_HOPS random hops,
+                      both sides play the SearchEngine's best move found within this many nodes
+    tablebase_path  = path of an endgame tablebase file, or None
+    record_hops     = if boolean True, the hops played are added to the record, defaulted to False
+
+    Plays one game from the initial layout and returns its record tuple. A side with no legal moves, whether it has
+    no pieces left or every piece is blocked, loses. With a tablebase, a game reaching a position it covers ends
+    there with the table's result.
+    """
+    generator = random.Random(seed * 1000003 + game_index)
+    game = GameLogic()
+    tablebase = _open_tablebase(tablebase_path) if tablebase_path is not None else None
+    engine = SearchEngine(game, SELF_PLAY_TABLE_MB, tablebase) if search_nodes else None
+    color, hops_played = "Black", 0
+    captures = {"Black": 0, "White": 0}
+    played = []
+
+    def record(winner):
+        result = (game_index, winner, hops_played, captures["Black"], captures["White"])
+        return result + (tuple(played),) if record_hops else result
+
+    while hops_played < max_hops:
+        entry = tablebase.probe(game, color) if tablebase is not None else None
+        if entry is not None:
+            return record(color if entry[0] == WIN else OPPONENT[color] if entry[0] == LOSS else None)
+
+        hops = list(game._generate_hops(color))
+        if not hops:
+            return record(OPPONENT[color])
+
+        if engine is not None and hops_played >= RANDOM_OPENING_HOPS and len(hops) > 1:
+            hop = engine.search(color, node_limit=search_nodes)
+        else:
+            hop = generator.choice(hops)
+
+        game._make_hop(hop, promote=True)
+        captures[color] += hop[2].bit_count()
+        hops_played += 1
+        if record_hops:
+            played.append((hop[0], hop[1]))
+        if game._update_capture_state(color, hop) is False:
+            color = OPPONENT[color]
+
+    return record(None)
+
+
+def run_self_play(games, processes=None, chunk_size=DEFAULT_CHUNK_SIZE, seed=0, max_hops=MAX_GAME_HOPS,
+                  search_nodes=0, tablebase_path=None, record_hops=False):
+    """
+    Function that takes eight parameters:
+    games           = count of games to play
+    processes       = count of worker processes, defaulted to the machine's CPU count. 1 plays in this process
+    chunk_size      = count of games handed to a worker at a time
+    seed            = integer seed of the batch
+    max_hops        = hops after which a game is scored as a draw
+    search_nodes    = node budget per move for the SearchEngine, 0 for random play
+    tablebase_path  = path of an endgame tablebase file each worker opens to end games early, or None
+    record_hops     = if boolean True, every record carries the hops played
+
+    This function is a generator that yields the record tuple of every game as soon as it finishes, so records are
+    not kept in memory. Records arrive in completion order, not in game index order.
+    """
+    play = partial(play_self_play_game, seed=seed, max_hops=max_hops, search_nodes=search_nodes,
+                   tablebase_path=tablebase_path, record_hops=record_hops)
+    if processes == 1:
+        for game_index in range(games):
+            yield play(game_index)
+        return
+
+    with multiprocessing.Pool(processes) as pool:
+        yield from pool.imap_unordered(play, range(games), chunksize=chunk_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play a batch of self-play games.")
+    parser.add_argument("games", type=int, help="count of games to play")
+    parser.add_argument("--processes", type=int, default=None, help="count of worker processes")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="games per work chunk")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the batch")
+    parser.add_argument("--search-nodes", type=int, default=0, help="search node budget per move, 0 plays randomly")
+    parser.add_argument("--tablebase", default=None, help="endgame tablebase file used to end games early")
+    arguments = parser.parse_args()
+
+    results = {"Black": 0, "White": 0, None: 0}
+    total_hops = 0
+    start = time.perf_counter()
+    for _, winner, hops_played, _, _ in run_self_play(arguments.games, arguments.processes, arguments.chunk_size,
+                                                      arguments.seed, search_nodes=arguments.search_nodes,
+                                                      tablebase_path=arguments.tablebase):
+        results[winner] += 1
+        total_hops += hops_played
+    seconds = time.perf_counter() - start
+
+    print(f"Black wins: {results['Black']}, White wins: {results['White']}, Draws: {results[None]}")
+    print(f"Average length: {total_hops / max(arguments.games, 1):.1f} hops")
+    print(f"Games per second: {arguments.games / seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
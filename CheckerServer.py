@@ -0,0 +1,321 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program defines the "GameServer" class, an asyncio server hosting many games of "Checkers" at
+#              once in a single event loop. Clients connect over TCP or a Unix socket and exchange newline-delimited
+#              JSON messages, one request per line and one response line per request, in order. A request names an
+#              operation and the game session it applies to:
+#
+#              {"id": 1, "op": "play_game", "session": "3f2a...", "player_name": "Ann",
+#               "starting_square_location": [5, 0], "destination_square_location": [4, 1]}
+#
+#              and is answered with {"id": 1, "ok": true, "result": 0}, or with {"id": 1, "ok": false, "error":
+#              "OutOfTurn", "message": ""} if the call raised. Any client may use any session, so the two players of
+#              a game can be on different connections. Sessions that go unused for too long are evicted, and a
+#              connection is not read from while its responses are waiting to be sent, so a slow client cannot make
+#              the server buffer without limit.
+#              Run from the command line as: python CheckerServer.py [--host H] [--port P] [--unix PATH]
+
+import argparse
+import asyncio
+import json
+import secrets
+import time
+
+from CheckersGame import Checkers
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8162
+
+# Sessions unused for this many seconds are evicted, checked every EVICTION_INTERVAL seconds
+DEFAULT_IDLE_TIMEOUT = 600.0
+EVICTION_INTERVAL = 10.0
+
+DEFAULT_MAX_SESSIONS = 10000
+
+# Longest request line accepted, in bytes
+MAX_LINE_BYTES = 64 * 1024
+
+
+class RequestError(Exception):
+    """
+    This exception is raised within the GameServer object when a request is malformed, names an unknown operation
+    or session, or cannot be served. Used by the following method: handle_request
+    """
+    pass
+
+
+class Session:
+    """Represents one game hosted by the server."""
+
+    __slots__ = ("_game", "_last_used")
+
+    def __init__(self):
+        """
+        Constructor method that takes no parameters.
+
+        The following private data members are initialized:
+
+        game            = the Checkers object of the session
+        last_used       = the monotonic time of the session's latest request
+        """
+        self._game = Checkers()
+        self._last_used = time.monotonic()
+
+    def get_game(self):
+        """Class method that returns the Checkers object of the session and marks the session as used."""
+        self._last_used = time.monotonic()
+        return self._game
+
+    def get_last_used(self):
+        """Class method that returns the monotonic time of the session's latest request."""
+        return self._last_used
+
+
+def _location(message, field):
+    """Function that returns the message field as an (x, y) tuple, raising a RequestError if it is not one."""
+    value = message.get(field)
+    if not isinstance(value, (list, tuple)) or len(value) != 2 or not all(isinstance(item, int) for item in value):
+        raise RequestError(f"{field} must be a list of two integers")
+    return value[0], value[1]
+
+
+def _field(message, field):
+    """Function that returns the message field, raising a RequestError if it is missing."""
+    if field not in message:
+        raise RequestError(f"{field} is missing")
+    return message[field]
+
+
+class GameServer:
+    """Represents a server hosting many Checkers sessions in one asyncio event loop."""
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, max_sessions=DEFAULT_MAX_SESSIONS):
+        """
+        Constructor method that takes two parameters:
+        idle_timeout    = seconds a session may go unused before it is evicted, defaulted to 600
+        max_sessions    = count of sessions that may be open at once, defaulted to 10000
+
+        The following private data members are initialized:
+
+        sessions        = a dictionary of Session objects keyed by session id
+        connections     = the count of open client connections
+        requests        = the count of requests served
+        evicted         = the count of sessions evicted for going unused
+        """
+        self._idle_timeout = idle_timeout
+        self._max_sessions = max_sessions
+        self._sessions = {}
+        self._connections = 0
+        self._requests = 0
+        self._evicted = 0
+        self._operations = {
+            "new_game": self._new_game,
+            "close_game": self._close_game,
+            "create_player": self._create_player,
+            "play_game": self._play_game,
+            "play_sequence": self._play_sequence,
+            "get_checker_details": self._get_checker_details,
+            "legal_moves": self._legal_moves,
+            "game_winner": self._game_winner,
+            "print_board": self._print_board,
+            "stats": self._stats,
+        }
+
+    def get_session_count(self):
+        """Class method that returns the count of open sessions."""
+        return len(self._sessions)
+
+    def handle_request(self, message):
+        """
+        This class method takes one parameter:
+        message     = the decoded JSON request, a dictionary
+
+        Serves the request and returns the response dictionary. Exceptions raised by the Checkers call, and
+        RequestErrors for bad requests, are reported in the response rather than raised.
+        """
+        self._requests += 1
+        response = {"id": message.get("id")} if isinstance(message, dict) else {"id": None}
+        try:
+            if not isinstance(message, dict):
+                raise RequestError("request must be a JSON object")
+            if not isinstance(message.get("op"), str):
+                raise RequestError(f"op must be a string, got {message.get('op')!r}")
+            operation = self._operations.get(message["op"])
+            if operation is None:
+                raise RequestError(f"unknown op {message['op']!r}")
+            response["ok"], response["result"] = True, operation(message)
+        except Exception as exception:
+            response["ok"], response["error"], response["message"] = False, type(exception).__name__, str(exception)
+        return response
+
+    def evict_idle_sessions(self, now=None):
+        """
+        This class method takes one parameter:
+        now         = the monotonic time to measure idleness against, defaulted to the current time
+
+        Removes every session unused for longer than the idle timeout and returns the count removed.
+        """
+        if now is None:
+            now = time.monotonic()
+        idle = [session_id for session_id, session in self._sessions.items()
+                if now - session.get_last_used() > self._idle_timeout]
+        for session_id in idle:
+            del self._sessions[session_id]
+        self._evicted += len(idle)
+        return len(idle)
+
+    async def handle_connection(self, reader, writer):
+        """
+        This class method takes the asyncio stream reader and writer of a client connection and serves its requests
+        until the client disconnects. The next line is only read once the previous response has been drained to the
+        socket, which applies backpressure to clients that send faster than they read.
+        """
+        self._connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line is longer than the reader's limit, the rest of the stream cannot be framed
+                    writer.write(self._encode({"id": None, "ok": False, "error": "RequestError",
+                                               "message": f"request longer than {MAX_LINE_BYTES} bytes"}))
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except ValueError as exception:
+                    response = {"id": None, "ok": False, "error": "RequestError", "message": str(exception)}
+                else:
+                    response = self.handle_request(message)
+                writer.write(self._encode(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path=None):
+        """
+        This class method takes three parameters:
+        host        = address to listen on over TCP, defaulted to 127.0.0.1
+        port        = TCP port to listen on, defaulted to 8162
+        unix_path   = path of a Unix socket to listen on instead of TCP, or None
+
+        Serves clients and evicts idle sessions until the task is cancelled.
+        """
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(self.handle_connection, unix_path, limit=MAX_LINE_BYTES)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_LINE_BYTES)
+        async with server:
+            eviction = asyncio.create_task(self._evict_periodically())
+            try:
+                await server.serve_forever()
+            finally:
+                eviction.cancel()
+
+    async def _evict_periodically(self):
+        """Class method that evicts idle sessions every EVICTION_INTERVAL seconds."""
+        while True:
+            await asyncio.sleep(min(EVICTION_INTERVAL, self._idle_timeout))
+            self.evict_idle_sessions()
+
+    @staticmethod
+    def _encode(response):
+        """Static method that returns the response as one line of UTF-8 JSON."""
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    def _game(self, message):
+        """Class method that returns the Checkers object of the message's session."""
+        session_id = message.get("session")
+        session = self._sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            raise RequestError(f"unknown session {session_id!r}")
+        return session.get_game()
+
+    def _new_game(self, message):
+        """Class method that opens a new session and returns its id, evicting idle sessions if the server is full."""
+        if len(self._sessions) >= self._max_sessions:
+            self.evict_idle_sessions()
+            if len(self._sessions) >= self._max_sessions:
+                raise RequestError("server is full")
+        session_id = secrets.token_hex(8)
+        self._sessions[session_id] = Session()
+        return session_id
+
+    def _close_game(self, message):
+        """Class method that closes the message's session."""
+        self._game(message)
+        del self._sessions[message["session"]]
+        return None
+
+    def _create_player(self, message):
+        """Class method that creates a player in the message's session and returns its string form."""
+        player = self._game(message).create_player(_field(message, "player_name"), _field(message, "piece_color"))
+        return str(player)
+
+    def _play_game(self, message):
+        """Class method that plays one hop in the message's session and returns the result of play_game."""
+        return self._game(message).play_game(_field(message, "player_name"),
+                                             _location(message, "starting_square_location"),
+                                             _location(message, "destination_square_location"))
+
+    def _play_sequence(self, message):
+        """Class method that plays a whole move in the message's session and returns the result of play_sequence."""
+        squares = _field(message, "squares")
+        if not isinstance(squares, list):
+            raise RequestError("squares must be a list")
+        locations = [_location({"square": square}, "square") for square in squares]
+        return self._game(message).play_sequence(_field(message, "player_name"), locations)
+
+    def _get_checker_details(self, message):
+        """Class method that returns the piece on a square of the message's session."""
+        return self._game(message).get_checker_details(_location(message, "square_location"))
+
+    def _legal_moves(self, message):
+        """Class method that returns the legal moves of a player of the message's session."""
+        return self._game(message).legal_moves(_field(message, "player_name"))
+
+    def _game_winner(self, message):
+        """Class method that returns the result of game_winner for the message's session."""
+        return self._game(message).game_winner()
+
+    def _print_board(self, message):
+        """Class method that returns the board of the message's session as 8 lists of 8 string pieces or None."""
+        return self._game(message)._board.to_lists()
+
+    def _stats(self, message):
+        """Class method that returns the server's session, connection, request and eviction counts."""
+        return {"sessions": len(self._sessions), "connections": self._connections, "requests": self._requests,
+                "evicted": self._evicted}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Host checkers games over newline-delimited JSON.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="TCP port to listen on")
+    parser.add_argument("--unix", default=None, help="path of a Unix socket to listen on instead of TCP")
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                        help="seconds before an unused session is evicted")
+    parser.add_argument("--max-sessions", type=int, default=DEFAULT_MAX_SESSIONS, help="most sessions open at once")
+    arguments = parser.parse_args()
+
+    server = GameServer(arguments.idle_timeout, arguments.max_sessions)
+    try:
+        asyncio.run(server.serve(arguments.host, arguments.port, arguments.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program builds and probes an endgame tablebase for "GameLogic" positions where both sides have
+#              only kings and triple kings, up to a fixed count of pieces on the board. Every position is solved by
+#              retrograde analysis under this variant's rules (flying kings, triple king double captures and
+#              friendly jumps, mandatory captures), working back from the positions where the side to move has no
+#              legal move. A capture sequence counts as one move. Each position is stored as a 16-bit entry holding
+#              its result for the side to move (win, loss or draw) and its distance to the end of the game in moves.
+#              The entries sit in one flat file read through mmap, and the entry of a position is found by
+#              computing its index, so a probe costs the same whatever the size of the table.
+#              Run from the command line as: python CheckerTablebase.py OUTPUT [--pieces N]
+
+import argparse
+import mmap
+import struct
+import sys
+import time
+from array import array
+from itertools import combinations
+from math import comb
+
+from CheckerBitboard import BLACK_KING, BLACK_PAWN, BLACK_TRIPLE_KING, WHITE_KING, WHITE_PAWN, WHITE_TRIPLE_KING
+from CheckerGameLogic import GameLogic
+
+# Results, from the point of view of the side to move. A position that is never won or lost is a draw.
+DRAW, WIN, LOSS = 0, 1, 2
+
+# Entry layout: result in the top 2 bits, distance to the end of the game in moves in the low 14 bits
+_RESULT_SHIFT = 14
+MAX_DISTANCE = (1 << _RESULT_SHIFT) - 1
+
+# File layout: header, then one little-endian 16-bit entry per position index
+_HEADER = struct.Struct("<4sHHI")
+_MAGIC = b"CKTB"
+_VERSION = 1
+_ENTRY = struct.Struct("<H")
+
+DEFAULT_PIECES = 3
+
+# Piece types covered by the tablebase, the digit of each piece in a position index
+TABLE_PIECES = (BLACK_KING, BLACK_TRIPLE_KING, WHITE_KING, WHITE_TRIPLE_KING)
+
+
+def slice_size(pieces):
+    """Function that returns the count of position indexes with exactly the given count of pieces on the board."""
+    return comb(32, pieces) * 4 ** pieces * 2
+
+
+def _build_slice_offsets(max_pieces):
+    """Function that returns a list of the first position index of every piece count from 0 to max_pieces + 1."""
+    offsets = [0, 0]
+    for pieces in range(1, max_pieces + 1):
+        offsets.append(offsets[-1] + slice_size(pieces))
+    return offsets
+
+
+def position_index(masks, color, offsets):
+    """
+    Function that takes three parameters:
+    masks       = the (Black_king, Black_Triple_King, White_king, White_Triple_King) integer masks of the position
+    color       = string color of the side to move
+    offsets     = the slice offsets of the tablebase, see _build_slice_offsets
+
+    Returns the index of the position's entry, or None if the position has more pieces than the tablebase covers.
+    The squares are ranked with the combinatorial number system, then each piece adds its TABLE_PIECES digit and the
+    side to move adds the lowest bit.
+    """
+    black_kings, black_triple_kings, white_kings, white_triple_kings = masks
+    occupied = black_kings | black_triple_kings | white_kings | white_triple_kings
+    pieces = occupied.bit_count()
+    if pieces + 1 >= len(offsets) or pieces == 0:
+        return None
+
+    rank, code, place = 0, 0, 0
+    while occupied:
+        bit = occupied & -occupied
+        occupied ^= bit
+        rank += _BINOMIAL[bit.bit_length() - 1][place + 1]
+        if bit & black_kings:
+            digit = 0
+        elif bit & black_triple_kings:
+            digit = 1
+        elif bit & white_kings:
+            digit = 2
+        else:
+            digit = 3
+        code += digit << (2 * place)
+        place += 1
+    return offsets[pieces] + ((rank << (2 * pieces)) + code) * 2 + (color == "White")
+
+
+# Binomial coefficients C(n, k) for n up to 32, used by position_index
+_BINOMIAL = tuple(tuple(comb(n, k) for k in range(33)) for n in range(33))
+
+
+class Tablebase:
+    """Represents an endgame tablebase file opened for probing."""
+
+    def __init__(self, path):
+        """
+        Constructor method that takes one parameter:
+        path            = path of a file written by build_tablebase
+
+        The following private data members are initialized:
+
+        file            = the open file object
+        entries         = a read-only mmap of the whole file
+        max_pieces      = the largest count of pieces on the board covered by the table
+        offsets         = the first position index of every piece count
+        """
+        self._file = open(path, "rb")
+        self._entries = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_pieces, count = _HEADER.unpack_from(self._entries, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {_VERSION} tablebase file")
+        self._max_pieces = max_pieces
+        self._offsets = _build_slice_offsets(max_pieces)
+
+    def get_max_pieces(self):
+        """Class method that returns the largest count of pieces on the board covered by the table."""
+        return self._max_pieces
+
+    def close(self):
+        """Class method that closes the table's file."""
+        self._entries.close()
+        self._file.close()
+
+    def probe(self, game, color):
+        """
+        This class method takes two parameters:
+        game        = a GameLogic (or Checkers) object
+        color       = string color of the side to move
+
+        Returns a (result, distance) tuple for the side to move, result being WIN, LOSS or DRAW and distance the count
+        of moves to the end of the game with best play. None is returned if the position is not covered: a pawn is on
+        the board, there are more pieces than the table holds, or a piece is in the middle of a capture sequence.
+        """
+        board = game._board
+        if game._capture_state is True or board.get_mask(BLACK_PAWN) or board.get_mask(WHITE_PAWN):
+            return None
+        if board.get_color_count("Black") + board.get_color_count("White") > self._max_pieces:
+            return None
+
+        index = position_index([board.get_mask(piece) for piece in TABLE_PIECES], color, self._offsets)
+        if index is None:
+            return None
+        entry = _ENTRY.unpack_from(self._entries, _HEADER.size + 2 * index)[0]
+        return entry >> _RESULT_SHIFT, entry & MAX_DISTANCE
+
+
+def _successor_masks(game, color):
+    """
+    Function that takes two parameters:
+    game        = a GameLogic object holding the position, with no capture in progress
+    color       = string color of the side to move
+
+    This function is a generator that yields the TABLE_PIECES masks of the position after every legal move of the
+    color, a whole capture sequence counting as one move. Captures are mandatory, so quiet moves are only tried when
+    no piece can capture. The board is restored once the generator finishes.
+    """
+    board = game._board
+    captured = False
+    pieces = board.get_color_mask(color)
+    while pieces:
+        bit = pieces & -pieces
+        pieces ^= bit
+        for _ in game._generate_capture_sequences(color, bit.bit_length() - 1):
+            captured = True
+            yield [board.get_mask(piece) for piece in TABLE_PIECES]
+    if captured:
+        return
+
+    for hop in list(game._generate_quiet_moves(color)):
+        game._make_hop(hop, promote=True)
+        yield [board.get_mask(piece) for piece in TABLE_PIECES]
+        game._unmake_hop()
+
+
+def _solve_slice(game, table, offsets, pieces):
+    """
+    Function that takes four parameters:
+    game        = a GameLogic object used to generate moves, its board is overwritten
+    table       = array of entries, holding the solved entries of every smaller piece count
+    offsets     = the slice offsets of the table
+    pieces      = count of pieces on the board of the slice to solve
+
+    This function solves every position of the slice in place. Moves that capture lead into an already solved
+    slice and are read straight from the table. Moves within the slice are linked both ways, then results spread
+    backwards from the finished positions in order of distance: a position is won as soon as one move leads to a
+    lost position, and lost once every move leads to a won position.
+    """
+    offset, size = offsets[pieces], slice_size(pieces)
+    board = game._board
+    side_colors = ("Black", "White")
+
+    # Moves within the slice, as parallel arrays of the position moved from and the position moved to
+    sources = array("I")
+    successors = array("I")
+    # Moves within the slice still leading to an unknown result, plus one for a move to a drawn smaller position
+    open_moves = array("I", bytes(4 * size))
+    longest_win = array("H", bytes(2 * size))
+    results = bytearray(size)
+    distances = array("H", bytes(2 * size))
+    buckets = [[]]
+
+    def schedule(position, result, distance):
+        results[position], distances[position] = result, distance
+        while len(buckets) <= distance:
+            buckets.append([])
+        buckets[distance].append(position)
+
+    board.clear()
+    game._capture_state, game._capture_square = False, None
+    for squares in combinations(range(32), pieces):
+        for code in range(4 ** pieces):
+            masks = [0, 0, 0, 0]
+            for place, square in enumerate(squares):
+                masks[code >> (2 * place) & 3] |= 1 << square
+            for piece, mask in zip(TABLE_PIECES, masks):
+                board.set_mask(piece, mask)
+
+            for color in side_colors:
+                position = position_index(masks, color, offsets) - offset
+                opponent = "White" if color == "Black" else "Black"
+                shortest_loss, moves = None, 0
+                for successor_masks in _successor_masks(game, color):
+                    moves += 1
+                    successor = position_index(successor_masks, opponent, offsets)
+                    if successor >= offset:
+                        sources.append(position)
+                        successors.append(successor - offset)
+                        open_moves[position] += 1
+                        continue
+                    else:
+                        entry = table[successor]
+                        result, distance = entry >> _RESULT_SHIFT, entry & MAX_DISTANCE
+                    if result == LOSS:
+                        if shortest_loss is None or distance < shortest_loss:
+                            shortest_loss = distance
+                    elif result == WIN:
+                        longest_win[position] = max(longest_win[position], distance)
+                    else:
+                        open_moves[position] += 1
+
+                if moves == 0:
+                    schedule(position, LOSS, 0)
+                elif shortest_loss is not None:
+                    schedule(position, WIN, shortest_loss + 1)
+                elif open_moves[position] == 0:
+                    schedule(position, LOSS, longest_win[position] + 1)
+
+    # Link every move within the slice back from its successor
+    predecessor_start = array("I", bytes(4 * (size + 1)))
+    for successor in successors:
+        predecessor_start[successor + 1] += 1
+    for position in range(size):
+        predecessor_start[position + 1] += predecessor_start[position]
+    predecessors = array("I", bytes(4 * len(successors)))
+    fill = array("I", predecessor_start)
+    for position, successor in zip(sources, successors):
+        predecessors[fill[successor]] = position
+        fill[successor] += 1
+    del sources, successors, fill
+
+    # Spread results backwards in order of distance
+    done = bytearray(size)
+    distance = 0
+    while distance < len(buckets):
+        for position in buckets[distance]:
+            if done[position] or distances[position] != distance:
+                continue
+            done[position] = 1
+            won = results[position] == WIN
+            for edge in range(predecessor_start[position], predecessor_start[position + 1]):
+                predecessor = predecessors[edge]
+                if done[predecessor]:
+                    continue
+                if not won:
+                    if results[predecessor] != WIN or distances[predecessor] > distance + 1:
+                        schedule(predecessor, WIN, distance + 1)
+                elif results[predecessor] != WIN:
+                    open_moves[predecessor] -= 1
+                    if longest_win[predecessor] < distance:
+                        longest_win[predecessor] = distance
+                    if open_moves[predecessor] == 0:
+                        schedule(predecessor, LOSS, longest_win[predecessor] + 1)
+        buckets[distance] = None
+        distance += 1
+
+    for position in range(size):
+        if done[position]:
+            table[offset + position] = results[position] << _RESULT_SHIFT | min(distances[position], MAX_DISTANCE)
+
+
+def build_tablebase(path, max_pieces=DEFAULT_PIECES, progress=None):
+    """
+    Function that takes three parameters:
+    path        = path of the file to write
+    max_pieces  = largest count of pieces on the board to cover, defaulted to 3
+    progress    = function called with (piece count, seconds taken) after every slice is solved, or None
+
+    Solves every position of kings and triple kings with up to max_pieces pieces on the board, smallest piece count
+    first, and writes the table to path. Returns the count of entries written.
+    """
+    offsets = _build_slice_offsets(max_pieces)
+    table = array("H", bytes(2 * offsets[-1]))
+    game = GameLogic()
+    for pieces in range(1, max_pieces + 1):
+        start = time.perf_counter()
+        _solve_slice(game, table, offsets, pieces)
+        if progress is not None:
+            progress(pieces, time.perf_counter() - start)
+
+    if sys.byteorder == "big":
+        table.byteswap()
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(_MAGIC, _VERSION, max_pieces, len(table)))
+        table.tofile(file)
+    return len(table)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a king and triple king endgame tablebase.")
+    parser.add_argument("output", help="path of the tablebase file to write")
+    parser.add_argument("--pieces", type=int, default=DEFAULT_PIECES, help="largest count of pieces on the board")
+    arguments = parser.parse_args()
+
+    def report(pieces, seconds):
+        print(f"{pieces} pieces solved in {seconds:.1f}s")
+
+    entries = build_tablebase(arguments.output, arguments.pieces, report)
+    print(f"Wrote {entries} entries to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program builds the per-square lookup tables used by the "GameLogic" rule checks. Every table is
+#              built once, when the module is first imported, and is a tuple indexed by the 0 - 31 square index (see
+#              "CheckerBitboard"), so a rule check is a walk over a few precomputed bit masks rather than row and
+#              column arithmetic. Squares are held as single-bit masks, and rays are listed nearest square first.
+#
+#              Down the board (towards row 7) square indexes grow, so along a DOWN_LEFT or DOWN_RIGHT ray the
+#              nearest square of a mask is its lowest set bit, and along an UP_LEFT or UP_RIGHT ray its highest.
+
+from CheckerBitboard import (BLACK_KING, BLACK_PAWN, BLACK_TRIPLE_KING, CODE_NAMES, WHITE_KING, WHITE_PAWN,
+                             WHITE_TRIPLE_KING, square_index, square_location)
+
+# Diagonal directions as (row step, column step), in the order used by the ray tables
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+UP_LEFT, UP_RIGHT, DOWN_LEFT, DOWN_RIGHT = 0, 1, 2, 3
+
+# 'Black' pawns move up the board, 'White' pawns move down
+PAWN_DIRECTIONS = {"Black": (UP_LEFT, UP_RIGHT), "White": (DOWN_LEFT, DOWN_RIGHT)}
+
+
+def _build_diagonal_rays():
+    """
+    Function that takes no parameters and returns the diagonal ray table. The table holds one entry per dark square,
+    each entry being a tuple of four rays in DIRECTIONS order. A ray is a tuple of the single-bit masks of the squares
+    met walking away from the square in that direction, nearest first, stopping at the edge of the board.
+    """
+    rays = []
+    for index in range(32):
+        row, column = square_location(index)
+        square_rays = []
+        for row_step, column_step in DIRECTIONS:
+            ray = []
+            next_row, next_column = row + row_step, column + column_step
+            while 0 <= next_row <= 7 and 0 <= next_column <= 7:
+                ray.append(1 << square_index(next_row, next_column))
+                next_row, next_column = next_row + row_step, next_column + column_step
+            square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+def _build_between_masks():
+    """
+    Function that takes no parameters and returns a table indexed by [start][destination] of the mask of the squares
+    strictly between two squares on the same diagonal, 0 for squares that do not share a diagonal.
+    """
+    table = [[0] * 32 for _ in range(32)]
+    for start, rays in enumerate(DIAGONAL_RAYS):
+        for ray in rays:
+            between = 0
+            for bit in ray:
+                table[start][bit.bit_length() - 1] = between
+                between |= bit
+    return tuple(tuple(row) for row in table)
+
+
+DIAGONAL_RAYS = _build_diagonal_rays()
+
+# Every square of each ray as one mask, indexed by [square][direction]
+RAY_MASKS = tuple(tuple(sum(ray) for ray in rays) for rays in DIAGONAL_RAYS)
+
+# The square next to each square in each direction, 0 at the edge of the board, indexed by [square][direction]
+RAY_STEPS = tuple(tuple(ray[0] if ray else 0 for ray in rays) for rays in DIAGONAL_RAYS)
+
+# Landing squares of a triple king that captures the square and the one next to it in the same direction, that is
+# every square of the ray beyond the second of the two captured squares, indexed by [first captured square][direction]
+DOUBLE_JUMP_LANDINGS = tuple(tuple(sum(ray[1:]) for ray in rays) for rays in DIAGONAL_RAYS)
+
+# Pawn moves per color: steps are the forward neighbours of a square, jumps are (jumped square, landing square) pairs
+PAWN_STEPS = {color: tuple(tuple(rays[direction][0] for direction in directions if rays[direction])
+                           for rays in DIAGONAL_RAYS)
+              for color, directions in PAWN_DIRECTIONS.items()}
+PAWN_JUMPS = {color: tuple(tuple((rays[direction][0], rays[direction][1]) for direction in directions
+                                 if len(rays[direction]) > 1) for rays in DIAGONAL_RAYS)
+              for color, directions in PAWN_DIRECTIONS.items()}
+
+KING_STEPS = tuple(tuple(ray[0] for ray in rays if ray) for rays in DIAGONAL_RAYS)
+NEIGHBOUR_MASKS = tuple(sum(steps) for steps in KING_STEPS)
+FORWARD_NEIGHBOUR_MASKS = {color: tuple(sum(steps) for steps in table) for color, table in PAWN_STEPS.items()}
+
+BETWEEN_MASKS = _build_between_masks()
+
+# Promotion rows as square masks, and the piece promoted to on them, indexed by piece code. 'Black' pawns promote on
+# row 0 and 'Black' kings on row 7, 'White' the other way round. Triple kings never promote.
+ROW_MASKS = tuple(0xF << (4 * row) for row in range(8))
+PROMOTION_MASKS = tuple({BLACK_PAWN: ROW_MASKS[0], BLACK_KING: ROW_MASKS[7],
+                         WHITE_PAWN: ROW_MASKS[7], WHITE_KING: ROW_MASKS[0]}.get(code, 0)
+                        for code in range(len(CODE_NAMES)))
+PROMOTED_PIECES = tuple({BLACK_PAWN: BLACK_KING, BLACK_KING: BLACK_TRIPLE_KING,
+                         WHITE_PAWN: WHITE_KING, WHITE_KING: WHITE_TRIPLE_KING}.get(code)
+                        for code in range(len(CODE_NAMES)))
+
+# Square index and (x, y) tuple conversions, SQUARE_INDEX is indexed by [row][column] and holds None on light squares
+SQUARE_LOCATION = tuple(square_location(index) for index in range(32))
+SQUARE_INDEX = tuple(tuple(square_index(row, column) for column in range(8)) for row in range(8))
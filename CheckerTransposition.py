@@ -0,0 +1,145 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/16/2026
+# Description: This program defines the "TranspositionTable" class, a fixed-size cache of search results keyed by the
+#              64-bit Zobrist position hash. The table is allocated once as two flat arrays of 64-bit integers, one
+#              holding keys and one holding packed entries, so its memory use never grows during a search. Entries
+#              are grouped in buckets of two slots: the first slot keeps the deepest result seen for the bucket and
+#              the second slot is always replaced.
+
+from array import array
+
+# Entry bound flags
+EXACT, LOWER_BOUND, UPPER_BOUND = 1, 2, 3
+
+DEFAULT_SIZE_MB = 16
+
+# Each slot is one 8 byte key plus one 8 byte packed entry
+SLOT_BYTES = 16
+BUCKET_SLOTS = 2
+
+# Packed entry layout, lowest bits first: flag (2 bits), depth (7 bits), has move (1 bit), move start (5 bits),
+# move destination (5 bits), score offset by SCORE_OFFSET (24 bits)
+_DEPTH_SHIFT = 2
+_HAS_MOVE_SHIFT = 9
+_START_SHIFT = 10
+_DESTINATION_SHIFT = 15
+_SCORE_SHIFT = 20
+SCORE_OFFSET = 1 << 23
+MAX_DEPTH = 127
+
+
+class TranspositionTable:
+    """Represents a fixed-size table of search results keyed by position hash."""
+
+    def __init__(self, size_mb=DEFAULT_SIZE_MB):
+        """
+        Constructor method that takes one parameter:
+        size_mb         = megabytes of memory the table may use, defaulted to 16. The bucket count is rounded down to
+                          a power of two so a bucket is found by masking the hash.
+
+        The following private data members are initialized:
+
+        bucket_mask     = the hash bits used to pick a bucket
+        keys            = array of the full 64-bit hash stored in each slot, 0 for an empty slot
+        entries         = array of the packed entry stored in each slot
+        probes          = the count of probe calls
+        hits            = the count of probe calls that found an entry
+        stores          = the count of store calls that wrote an entry
+        """
+        buckets = max(1, int(size_mb * (1 << 20)) // (SLOT_BYTES * BUCKET_SLOTS))
+        buckets = 1 << (buckets.bit_length() - 1)
+        self._bucket_mask = buckets - 1
+        self._keys = array("Q", bytes(8 * buckets * BUCKET_SLOTS))
+        self._entries = array("Q", bytes(8 * buckets * BUCKET_SLOTS))
+        self._probes = 0
+        self._hits = 0
+        self._stores = 0
+
+    def get_size_mb(self):
+        """Class method that returns the memory used by the table's arrays in megabytes."""
+        return (len(self._keys) + len(self._entries)) * 8 / (1 << 20)
+
+    def get_slot_count(self):
+        """Class method that returns the number of entries the table can hold."""
+        return len(self._keys)
+
+    def get_probes(self):
+        """Class method that returns the count of probe calls."""
+        return self._probes
+
+    def get_hits(self):
+        """Class method that returns the count of probe calls that found an entry."""
+        return self._hits
+
+    def get_stores(self):
+        """Class method that returns the count of entries written."""
+        return self._stores
+
+    def get_hit_rate(self):
+        """Class method that returns the fraction of probe calls that found an entry, 0.0 if there were none."""
+        if self._probes == 0:
+            return 0.0
+        return self._hits / self._probes
+
+    def get_fill_rate(self):
+        """Class method that returns the fraction of slots holding an entry. This walks the whole table."""
+        return (len(self._keys) - self._keys.count(0)) / len(self._keys)
+
+    def clear(self):
+        """Class method that empties the table and resets its statistics without reallocating it."""
+        slots = len(self._keys)
+        self._keys[:] = array("Q", bytes(8 * slots))
+        self._entries[:] = array("Q", bytes(8 * slots))
+        self._probes = self._hits = self._stores = 0
+
+    def probe(self, key):
+        """
+        This class method takes one parameter:
+        key         = 64-bit position hash
+
+        Returns a (depth, flag, score, move) tuple for the position, or None if the table holds no entry for it.
+        move is a (starting square index, destination square index) tuple, or None if no best move was stored.
+        """
+        self._probes += 1
+        slot = (key & self._bucket_mask) * BUCKET_SLOTS
+        keys = self._keys
+        if keys[slot] != key:
+            slot += 1
+            if keys[slot] != key:
+                return None
+
+        self._hits += 1
+        entry = self._entries[slot]
+        move = None
+        if entry >> _HAS_MOVE_SHIFT & 1:
+            move = (entry >> _START_SHIFT & 31, entry >> _DESTINATION_SHIFT & 31)
+        return entry >> _DEPTH_SHIFT & MAX_DEPTH, entry & 3, (entry >> _SCORE_SHIFT) - SCORE_OFFSET, move
+
+    def store(self, key, depth, flag, score, move=None):
+        """
+        This class method takes five parameters:
+        key         = 64-bit position hash
+        depth       = the depth the position was searched to, clamped to 0 - 127
+        flag        = EXACT, LOWER_BOUND or UPPER_BOUND
+        score       = the search score
+        move        = the best (starting square index, destination square index) found, or None
+
+        This method writes the entry into the position's bucket. An entry at least as deep as the one in the first
+        slot (or for the same position) replaces it, and the entry it pushes out moves to the second slot. Any other
+        entry goes into the second slot, replacing whatever is there.
+        """
+        depth = min(max(depth, 0), MAX_DEPTH)
+        entry = flag | depth << _DEPTH_SHIFT | (score + SCORE_OFFSET) << _SCORE_SHIFT
+        if move is not None:
+            entry |= 1 << _HAS_MOVE_SHIFT | move[0] << _START_SHIFT | move[1] << _DESTINATION_SHIFT
+
+        slot = (key & self._bucket_mask) * BUCKET_SLOTS
+        keys, entries = self._keys, self._entries
+        if keys[slot] == key or keys[slot] == 0 or depth >= entries[slot] >> _DEPTH_SHIFT & MAX_DEPTH:
+            if keys[slot] != key and keys[slot] != 0:
+                keys[slot + 1], entries[slot + 1] = keys[slot], entries[slot]
+            keys[slot], entries[slot] = key, entry
+        else:
+            keys[slot + 1], entries[slot + 1] = key, entry
+        self._stores += 1
@@ -9,7 +9,17 @@
 #              The program assumes the player knows the rules of the game and will not intentionally attempt to break
 #              them.
 
-from CheckerGameLogic import GameLogic
+from CheckerBitboard import PIECE_COLORS, square_location
+from CheckerGameLogic import GameLogic, InvalidSquare, MOVED_PIECE, OPPONENT
+from CheckerMCTS import MCTSEngine
+from CheckerSearch import SearchEngine, MAX_DEPTH
+from CheckerTables import BETWEEN_MASKS
+from CheckerTablebase import WIN, LOSS
+from CheckerTransposition import DEFAULT_SIZE_MB, TranspositionTable
+
+
+# Search backends of best_move
+ALPHA_BETA, MCTS = "alpha_beta", "mcts"
 
 
 class OutOfTurn(Exception):
@@ -20,14 +30,6 @@ class OutOfTurn(Exception):
     pass
 
 
-class InvalidSquare(IndexError):
-    """
-     This exception is raised within the Checkers object when a player makes an illegal move.
-     Used by the following methods: play_game, get_checker_details
-    """
-    pass
-
-
 class InvalidPlayer(Exception):
     """
     This exception is raised within the Checkers object when a non-player attempts to make a move.
@@ -82,6 +84,10 @@ class Player:
         """Class method that adds to the captured_pieces data member."""
         self._captured_pieces += 1
 
+    def remove_captured_pieces(self):
+        """Class method that removes from the captured_pieces data member."""
+        self._captured_pieces -= 1
+
     def add_king(self):
         """Class method that adds to the kings data member."""
         self._kings += 1
@@ -106,27 +112,95 @@ class Player:
 class Checkers(GameLogic):
     """Represents the game checkers with two players."""
 
-    def __init__(self):
+    def __init__(self, table_size_mb=DEFAULT_SIZE_MB):
         """
-        Constructor method that takes no parameters.
+        Constructor method that takes one parameter:
+        table_size_mb   = megabytes of memory for the transposition table used by best_move, defaulted to 16
 
         This constructor inherits the following data members of the "GameLogic" class:
 
         capture_state   = if a piece can capture, this will be boolean True, otherwise defaulted to boolean False
         players         = initialized as an empty dictionary, stores player objects using the create_player method
-        board           = creates a list of lists that represents the board. The board can be printed out using the
-                          print_board method. 12 squares on the top have the string "White", on the bottom 12 squares
-                          have the string "Black". These are the pieces used by the player. The remaining spaces are
-                          element positions containing None.
+        board           = a Bitboard object that represents the board. The board can be printed out using the
+                          print_board method. 12 squares on the top hold "White" pieces, on the bottom 12 squares
+                          hold "Black" pieces. These are the pieces used by the player. The remaining squares are
+                          empty and read as None.
 
         In addition, the following private data members are initialized:
 
         turn            = the string turn of the current player, defaulted to "Black"
-        game_won        = if any player captures 12 pieces, the game is won. Defaults to boolean False
+        game_won        = if the player to move has no pieces left or every piece is blocked, the game is won.
+                          Defaults to boolean False
+        winner          = the string color of the winning player once the game is won, defaults to None
+        table_size_mb   = the size of the transposition table in megabytes
+        table           = the game's one TranspositionTable, allocated on the first alpha-beta best_move and kept
+                          between moves
+        search_engine   = the SearchEngine used by best_move, created on first use and searching with the game's table
+        mcts_engine     = the MCTSEngine used by best_move's MCTS backend, created on first use
+        last_backend    = the backend of the latest best_move search, read by get_search_stats
+        tablebase       = the endgame Tablebase used to end won endgames early and by best_move, defaults to None
+        opening_book    = the OpeningBook probed by book_move and best_move, defaults to None
+        journal         = the MoveJournal every hop is appended to, defaults to None
         """
         super().__init__()
         self._turn = "Black"
         self._game_won = False
+        self._winner = None
+        self._table_size_mb = table_size_mb
+        self._table = None
+        self._search_engine = None
+        self._mcts_engine = None
+        self._last_backend = None
+        self._tablebase = None
+        self._opening_book = None
+        self._journal = None
+
+    def set_journal(self, journal):
+        """
+        Class method that takes one parameter:
+        journal     = a MoveJournal, or None to stop journaling
+
+        Once set, every hop played by play_game and every call to unmake_move is appended to the journal.
+        """
+        self._journal = journal
+
+    def set_opening_book(self, opening_book):
+        """
+        Class method that takes one parameter:
+        opening_book    = an OpeningBook, or None to stop using one
+
+        Once set, best_move plays the book move of a position in the book instead of searching.
+        """
+        self._opening_book = opening_book
+
+    def get_table_size_mb(self):
+        """Class method that returns the size of the transposition table used by best_move in megabytes."""
+        return self._table_size_mb
+
+    def set_table_size_mb(self, table_size_mb):
+        """
+        Class method that takes one parameter:
+        table_size_mb   = megabytes of memory for the transposition table used by best_move
+
+        The game's table is replaced by an empty one of the new size, so the results it held are lost.
+        """
+        self._table_size_mb = table_size_mb
+        self._table = None
+        if self._search_engine is not None:
+            self._table = TranspositionTable(table_size_mb)
+            self._search_engine.set_table(self._table)
+
+    def set_tablebase(self, tablebase):
+        """
+        Class method that takes one parameter:
+        tablebase   = an endgame Tablebase, or None to stop using one
+
+        Once set, play_game ends the game as soon as the position is a win or loss in the tablebase and best_move plays
+        perfectly in the positions it covers.
+        """
+        self._tablebase = tablebase
+        if self._search_engine is not None:
+            self._search_engine.set_tablebase(tablebase)
 
     def create_player(self, player_name, piece_color):
         """
@@ -162,11 +236,16 @@ class Checkers(GameLogic):
 
         1. Check exception cases
         2. Check if the game is won
-        3. Call the method 'make_move' from parent class 'GameLogic' to move the piece
-        4. Call the method 'upgrade_piece' from parent class 'GameLogic' to upgrade a piece if possible
-        5. Call the method 'can_capture' from the parent class 'GameLogic' check if a capturing piece can capture again
-        6. Change turn if 'can_capture' is false, otherwise pass
-        7. Return the user's captured pieces.
+        3. Call the method 'analyse_move' from parent class 'GameLogic' to work out the move's captures and promotion
+           once, in a PlyAnalysis shared by the next steps
+        4. Call the method 'make_move' from parent class 'GameLogic' to move the piece
+        5. Call the method 'upgrade_piece' from parent class 'GameLogic' to upgrade a piece if possible
+        6. Check if a capturing piece can capture again from its destination
+        7. Change turn if the piece cannot capture again, otherwise pass
+        8. Call the method 'has_legal_move' from parent class 'GameLogic', the game is won if the player to move has
+           no legal move, or if a tablebase is set and shows the position is won or lost
+        9. Append the hop to the journal if one is set
+        10. Return the user's captured pieces.
 
 
         If the tuples in either starting_square_location or destination_square_location are outside the board,
@@ -181,7 +260,7 @@ class Checkers(GameLogic):
         # Define local variables
         starting_row, starting_column = starting_square_location[0], starting_square_location[1]
         destination_row, destination_column = destination_square_location[0], destination_square_location[1]
-        start = self.get_checker_details(starting_square_location)
+        start = self._piece_at(starting_square_location)
 
         # Exception cases
         if player_name not in self._players:
@@ -190,34 +269,27 @@ class Checkers(GameLogic):
         if starting_row > 7 or starting_column > 7 or destination_row > 7 or destination_column > 7:
             raise InvalidSquare
 
+        # Check if game is won
+        if self._game_won is True:
+            return self.game_winner()
+
         if self._players[player_name].get_checker_color() != self._turn:
             raise OutOfTurn
 
-        if start != self._players[player_name].get_checker_color():
-            if self._players[player_name].get_checker_color() == "Black" and \
-                    start != "Black" and start != "Black_king" and start != "Black_Triple_King":
-                raise InvalidSquare
-            if self._players[player_name].get_checker_color() == "White" and \
-                    start != "White" and start != "White_king" and start != "White_Triple_King":
-                raise InvalidSquare
+        if start is None or PIECE_COLORS[start] != self._players[player_name].get_checker_color():
+            raise InvalidSquare
 
-        # Check if game is won
-        if self._players[player_name].get_captured_pieces_count() == 12:
-            self._game_won = True
-            return self.game_winner()
+        # Analyse move
+        analysis = self.analyse_move(starting_square_location, destination_square_location)
 
         # Move piece
-        self.make_move(player_name, starting_square_location, destination_square_location)
+        self.make_move(player_name, starting_square_location, destination_square_location, analysis)
 
         # Upgrade piece if possible
-        self.upgrade_piece(player_name, starting_square_location, destination_square_location)
+        self.upgrade_piece(player_name, destination_square_location, analysis)
 
         # Check capture state
-        if self._capture_state is True:
-            if self.can_capture(destination_square_location) is True:
-                pass
-            else:
-                self._capture_state = False
+        analysis.set_continues_capture(self._update_capture_state(self._turn, analysis.get_hop()))
 
         # Change turn if piece cannot capture
         if self._turn == "Black" and self._capture_state is False:
@@ -225,25 +297,279 @@ class Checkers(GameLogic):
         elif self._turn == "White" and self._capture_state is False:
             self._turn = "Black"
 
+        # The game is won if the player to move has no pieces left or every piece is blocked
+        blocked = self._settle_result(self._turn)
+
+        # Or if the tablebase shows the endgame is won with best play
+        if blocked is False and self._tablebase is not None:
+            entry = self._tablebase.probe(self, self._turn)
+            if entry is not None and entry[0] == WIN:
+                self._game_won, self._winner = True, self._turn
+            elif entry is not None and entry[0] == LOSS:
+                self._game_won, self._winner = True, OPPONENT[self._turn]
+
+        # Journal the hop
+        if self._journal is not None:
+            hop = analysis.get_hop()
+            self._journal.append(hop[0], hop[1], (hop[2] != 0) | (analysis.get_promotion() is not None) << 1 |
+                                 (analysis.get_continues_capture() is True) << 2)
+
         return self._players[player_name].get_captured_pieces_count()
 
+    def _settle_result(self, color):
+        """
+        This class method takes one parameter:
+        color       = string color of the player to move, either "Black" or "White"
+
+        This method sets the game as won by the opponent if the color has no pieces left or every piece is blocked,
+        and as not won otherwise. Returns boolean True if the game is won.
+        """
+        self._game_won = self.has_legal_move(color) is False
+        self._winner = OPPONENT[color] if self._game_won is True else None
+        return self._game_won
+
+    def _play_hop(self, start, destination, capture, promote, continues):
+        """
+        This class method takes five parameters:
+        start           = 0 - 31 index of the square the piece moves from
+        destination     = 0 - 31 index of the square the piece moves to
+        capture         = if boolean True, enemy pieces between the two squares are captured
+        promote         = if boolean True, the piece is upgraded if it lands on its promotion row
+        continues       = if boolean True, the same player keeps the turn to carry on capturing
+
+        This method plays a recorded hop straight on the board without checking it is legal. The Player data members,
+        the move history, the turn and the result are kept up to date as in play_game, but the tablebase is not
+        probed and nothing is journaled. Returns the move record.
+        """
+        color = self._turn
+        captured = 0
+        if capture is True:
+            captured = BETWEEN_MASKS[start][destination] & self._board.get_color_mask(OPPONENT[color])
+        record = self._make_hop((start, destination, captured), promote=promote)
+        self._apply_counters(self._player_for_color(color), record, 1)
+        if continues is True:
+            self._capture_state, self._capture_square = True, destination
+        else:
+            self._capture_state, self._capture_square = False, None
+            self._turn = OPPONENT[color]
+        self._settle_result(self._turn)
+        return record
+
+    def snapshot(self):
+        """
+        This class method takes no parameters and returns a Position snapshot of the game: the pieces on the board,
+        the player whose turn it is and the square of a piece that must keep capturing. Player data members are not
+        part of the snapshot.
+        """
+        return self.get_position(self._turn)
+
+    @classmethod
+    def from_snapshot(cls, position):
+        """
+        Class method that takes one parameter:
+        position    = a Position object, as returned by snapshot
+
+        Returns a new Checkers object set up with the snapshot's position and turn. The game is won straight away if
+        the player to move has no legal move. Players are not part of the snapshot and must be added with
+        create_player.
+        """
+        game = cls()
+        game._turn = game.load_position(position)
+        game._settle_result(game._turn)
+        return game
+
+    def play_sequence(self, player_name, squares):
+        """
+        This class method takes two parameters:
+        player name     = string name of the player making the move, corresponding with the key-name in the players
+                          dictionary
+        squares         = a list of (x,y) tuples, the square the piece starts on followed by the square landed on by
+                          every hop, as returned by capture_sequences
+
+        This method plays a whole move in one call, a single step or every hop of a capture sequence, each hop checked
+        and applied as in play_game. The sequence is applied atomically: if any hop raises an exception, or the
+        sequence stops while the piece must keep capturing, every hop already played is reverted and the exception is
+        raised. An InvalidSquare Exception is raised for a sequence of fewer than two squares or one stopped early.
+
+        This method returns the count of captured pieces for the player making the move.
+        """
+        if len(squares) < 2:
+            raise InvalidSquare
+
+        history_length = len(self._move_history)
+        try:
+            for start, destination in zip(squares, squares[1:]):
+                result = self.play_game(player_name, start, destination)
+                # A game that was already won is reported without a move being played
+                if len(self._move_history) == history_length:
+                    return result
+            if self._capture_state is True:
+                raise InvalidSquare
+        except Exception:
+            while len(self._move_history) > history_length:
+                self.unmake_move()
+            raise
+        return result
+
+    def unmake_move(self):
+        """
+        This class method takes no parameters and reverts the most recent move, including its captures and the Player
+        data members it changed. The turn goes back to the color of the piece that moved and the game is no longer
+        won. The reverted move record is returned, or None if there is no move to revert.
+        """
+        record = super().unmake_move()
+        if record is not None:
+            self._turn = PIECE_COLORS[record[MOVED_PIECE]]
+            self._game_won = False
+            self._winner = None
+            if self._journal is not None:
+                self._journal.append_undo()
+        return record
+
+    def position_hash(self):
+        """
+        This class method takes no parameters and returns the 64-bit Zobrist hash of the current position: the pieces
+        on the board, the player whose turn it is and the square of a piece that must keep capturing. The hash is
+        kept up to date as moves are made, so this call costs the same no matter how many pieces are on the board.
+        """
+        return self._position_hash(self._turn)
+
+    def legal_moves(self, player_name):
+        """
+        This class method takes one parameter:
+        player_name     = string name of the player, corresponding with the key-name in the players dictionary
+
+        This method returns a list of every legal move for the player as (starting_square_location,
+        destination_square_location) tuples that can be passed straight to play_game. The list is empty if it is not
+        the player's turn or the game has been won. If a player_name is used that is not within the players data
+        member, an InvalidPlayer Exception is raised.
+        """
+        if player_name not in self._players:
+            raise InvalidPlayer
+
+        color = self._players[player_name].get_checker_color()
+        if color != self._turn or self._game_won is True:
+            return []
+
+        return list(self.generate_moves(color))
+
+    def book_move(self, player_name, generator=None):
+        """
+        This class method takes two parameters:
+        player_name     = string name of the player, corresponding with the key-name in the players dictionary
+        generator       = a random.Random used to vary the choice between book moves, or None for the best scoring
+
+        This method returns the opening book move for the player as a (starting_square_location,
+        destination_square_location) tuple that can be passed straight to play_game. None is returned if no opening
+        book is set, it is not the player's turn, the game has been won or the position is not in the book. Book moves
+        are ranked by the points they scored per game played, and moves played too few times are ignored (see
+        OpeningBook.choose_move). If a player_name is used that is not within the players data member, an
+        InvalidPlayer Exception is raised.
+        """
+        if player_name not in self._players:
+            raise InvalidPlayer
+
+        color = self._players[player_name].get_checker_color()
+        if self._opening_book is None or color != self._turn or self._game_won is True:
+            return None
+
+        move = self._opening_book.choose_move(self.position_hash(), generator)
+        if move is None:
+            return None
+
+        # Guard against a hash collision handing back a move that is not legal here
+        for start, destination, _ in self._generate_hops(color):
+            if start == move[0] and destination == move[1]:
+                return square_location(start), square_location(destination)
+        return None
+
+    def best_move(self, player_name, time_limit=1.0, max_depth=MAX_DEPTH, node_limit=None, backend=ALPHA_BETA):
+        """
+        This class method takes five parameters:
+        player_name     = string name of the player, corresponding with the key-name in the players dictionary
+        time_limit      = seconds the search may run for, defaulted to 1 second. None removes the limit
+        max_depth       = deepest iteration to search, counted in turns. Not used by the MCTS backend
+        node_limit      = count of positions the search may visit, or None for no limit. For the MCTS backend this is
+                          the count of playouts; with no time limit either, DEFAULT_PLAYOUTS are run
+        backend         = ALPHA_BETA for the SearchEngine, or MCTS for the MCTSEngine
+
+        This method runs a search for the player and returns the best move found as a
+        (starting_square_location, destination_square_location) tuple that can be passed straight to play_game. None
+        is returned if it is not the player's turn, the game has been won or the player has no legal moves. If an
+        opening book is set and holds the position, its best scoring move is returned without searching. If a
+        player_name is used that is not within the players data member, an InvalidPlayer Exception is raised.
+        """
+        if player_name not in self._players:
+            raise InvalidPlayer
+
+        color = self._players[player_name].get_checker_color()
+        if color != self._turn or self._game_won is True:
+            return None
+
+        move = self.book_move(player_name)
+        if move is not None:
+            return move
+
+        self._last_backend = backend
+        if backend == MCTS:
+            if self._mcts_engine is None:
+                self._mcts_engine = MCTSEngine(self)
+            hop = self._mcts_engine.search(color, node_limit, time_limit)
+        else:
+            if self._table is None:
+                self._table = TranspositionTable(self._table_size_mb)
+            if self._search_engine is None:
+                self._search_engine = SearchEngine(self, tablebase=self._tablebase, table=self._table)
+            hop = self._search_engine.search(color, time_limit, max_depth, node_limit)
+        if hop is None:
+            return None
+        return square_location(hop[0]), square_location(hop[1])
+
+    def set_mcts_engine(self, mcts_engine):
+        """
+        Class method that takes one parameter:
+        mcts_engine     = an MCTSEngine searching this game, e.g. one set up with a pool of workers
+
+        Sets the engine used by best_move's MCTS backend, closing the one it replaces.
+        """
+        if self._mcts_engine is not None and self._mcts_engine is not mcts_engine:
+            self._mcts_engine.close()
+        self._mcts_engine = mcts_engine
+
+    def get_search_stats(self):
+        """
+        Class method that takes no parameters and returns a dictionary describing the latest best_move search, empty
+        if there has been none. The alpha-beta backend reports its nodes, completed depth and score. The MCTS backend
+        reports its playouts, seconds and playouts per second.
+        """
+        if self._last_backend == MCTS and self._mcts_engine is not None:
+            engine = self._mcts_engine
+            return {"backend": MCTS, "playouts": engine.get_playouts(), "seconds": engine.get_seconds(),
+                    "playouts_per_second": engine.get_playouts_per_second()}
+        if self._last_backend == ALPHA_BETA and self._search_engine is not None:
+            engine = self._search_engine
+            return {"backend": ALPHA_BETA, "nodes": engine.get_nodes(), "depth": engine.get_depth(),
+                    "score": engine.get_score()}
+        return {}
+
     def print_board(self):
         """This class method takes no parameters and prints out the playing board."""
-        for rows in self._board:
+        for rows in self._board.to_lists():
             print(rows)
 
     def game_winner(self):
         """
         This class method takes no parameters and either returns a message stating the game has not ended if the
         class data member game_won is False or returns the name of the winning player if game_won is True. This method
-        is called during the execution of the play_game method if a player captures 12 pieces.
+        is called during the execution of the play_game method once the game is won: when the player to move has no
+        pieces left, has pieces but every one of them is blocked, or is in an endgame the tablebase shows as lost.
         """
         if self._game_won is False:
             return "Game has not ended."
         else:
             for players in self._players:
                 players_object = self._players[players]
-                if players_object.get_checker_color() == self._turn:
+                if players_object.get_checker_color() == self._winner:
                     return f"{players_object.get_name()} has won the game!"
 
     def print_rules(self):
@@ -259,7 +585,8 @@ class Checkers(GameLogic):
         print("Triple kings can do everything a king can, as well as jump friendly pieces to move faster and double "
               "capture.")
         print("If a piece can capture, it must capture. If a piece captures and can capture again, it must capture.")
-        print("The game ends when a player has captured all opposing pieces.")
+        print("The game ends when a player has captured all opposing pieces, or when the opposing pieces are all "
+              "blocked.")
         print("\n")
 
 
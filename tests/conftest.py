@@ -0,0 +1,54 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program holds the pytest fixtures shared by the test modules. The modules under test sit at the
+#              top of the repository rather than in a package, so the repository directory is put on sys.path first.
+
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CheckerPerft import REFERENCE_POSITIONS, parse_diagram  # noqa: E402
+from CheckersGame import Checkers  # noqa: E402
+
+
+@pytest.fixture
+def new_game():
+    """
+    Fixture that returns a function taking an optional REFERENCE_POSITIONS name. The function returns a Checkers
+    object with players named after their colors, set up with the initial layout or the named position.
+    """
+    def build(name=None):
+        game = Checkers()
+        game.create_player("Black", "Black")
+        game.create_player("White", "White")
+        if name is not None:
+            rows, color, _ = REFERENCE_POSITIONS[name]
+            game.load_board(parse_diagram(rows))
+            game._turn = color
+        return game
+
+    return build
+
+
+@pytest.fixture
+def play_random():
+    """
+    Fixture that returns a function taking a Checkers object, a seed and a count of hops. The function plays up to
+    that many seeded random legal hops through play_game, stopping early if the game is won, and returns the count
+    of hops played.
+    """
+    def play(game, seed, hops):
+        generator = random.Random(seed)
+        for played in range(hops):
+            if game._game_won is True:
+                return played
+            name = game.get_turn()
+            game.play_game(name, *generator.choice(sorted(game.legal_moves(name))))
+        return hops
+
+    return play
@@ -0,0 +1,92 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that "BatchBoard" batches convert to and from grids and games without losing a
+#              piece, and that its batch piece counts, material and mobility match counts made one square at a time.
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from CheckerBatch import GRID_CODES, BatchBoard  # noqa: E402
+from CheckerBitboard import square_location  # noqa: E402
+
+_DARK_SQUARES = [square_location(index) for index in range(32)]
+
+
+def _random_grids(seed, count):
+    """Function that returns a (count, 8, 8) int8 array of random GRID_CODES, every code appearing on dark squares."""
+    generator = random.Random(seed)
+    grids = np.zeros((count, 8, 8), dtype=np.int8)
+    for grid in grids:
+        for row, column in generator.sample(_DARK_SQUARES, generator.randint(0, 24)):
+            grid[row, column] = generator.choice(GRID_CODES)
+    return grids
+
+
+def _reference_mobility(grid):
+    """
+    Function that returns the (black, white) mobility of one grid as "BatchBoard.mobility" approximates it, counted a
+    piece and a direction at a time: a step onto an empty square, or a jump over an adjacent enemy onto an empty
+    square. Pawns only go forwards, up the grid for "Black" and down it for "White".
+    """
+    counts = {1: 0, -1: 0}
+    for row, column in _DARK_SQUARES:
+        code = int(grid[row, column])
+        if code == 0:
+            continue
+        sign = 1 if code > 0 else -1
+        row_steps = (-sign,) if abs(code) == 1 else (-1, 1)
+        for row_step in row_steps:
+            for column_step in (-1, 1):
+                near = (row + row_step, column + column_step)
+                far = (row + 2 * row_step, column + 2 * column_step)
+                if not (0 <= near[0] <= 7 and 0 <= near[1] <= 7):
+                    continue
+                if grid[near] == 0:
+                    counts[sign] += 1
+                elif grid[near] * sign < 0 and 0 <= far[0] <= 7 and 0 <= far[1] <= 7 and grid[far] == 0:
+                    counts[sign] += 1
+    return counts[1], counts[-1]
+
+
+def test_grid_round_trip():
+    grids = _random_grids(1, 200)
+    batch = BatchBoard.from_grid(grids)
+    assert len(batch) == 200
+    assert batch.to_grid().dtype == np.int8
+    assert np.array_equal(batch.to_grid(), grids)
+    assert np.array_equal(BatchBoard.from_grid(batch.to_grid()).get_bitboards(), batch.get_bitboards())
+
+
+def test_games_round_trip(new_game, play_random):
+    games = []
+    for seed in range(8):
+        game = new_game("triple_kings" if seed % 2 else None)
+        play_random(game, seed, 30)
+        games.append(game)
+
+    batch = BatchBoard.from_games(games)
+    counts = batch.piece_counts()
+    material = batch.material()
+    for position, game in enumerate(games):
+        copy = batch.to_game(position)
+        assert all(copy.get_checker_details(location) == game.get_checker_details(location)
+                   for location in _DARK_SQUARES)
+        assert tuple(counts[position, :3]) == game.get_piece_counts("Black")
+        assert tuple(counts[position, 3:]) == game.get_piece_counts("White")
+        assert material[position] == game.get_material("Black") - game.get_material("White")
+
+
+def test_initial_mobility(new_game):
+    black, white = BatchBoard.from_games([new_game()]).mobility()
+    assert (black[0], white[0]) == (7, 7)
+
+
+def test_mobility_matches_square_counts():
+    grids = _random_grids(2, 300)
+    black, white = BatchBoard.from_grid(grids).mobility()
+    for position, grid in enumerate(grids):
+        assert (black[position], white[position]) == _reference_mobility(grid)
@@ -0,0 +1,54 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks when compare_results reports a regression: only for a benchmark slower than its
+#              baseline by more than both the threshold and the noise of the repeats, and never for a benchmark the
+#              baseline does not have.
+
+from CheckerBenchmark import DEFAULT_THRESHOLD, NOISE_STDEVS, compare_results, format_comparison, run_benchmarks
+
+
+def _results(**benchmarks):
+    """Function that returns results as run_benchmarks does, from keyword (best_ns, stdev_ns) tuples."""
+    return {"benchmarks": {name: {"best_ns": best, "mean_ns": best, "stdev_ns": stdev}
+                           for name, (best, stdev) in benchmarks.items()}}
+
+
+def test_slowdown_within_noise_is_not_a_regression():
+    # 50% slower, past the threshold, but by less than NOISE_STDEVS standard deviations of the noisier run
+    baseline = _results(make_move=(100.0, 2.0))
+    results = _results(make_move=(150.0, 50.0 / NOISE_STDEVS + 1.0))
+    entry = compare_results(results, baseline)["make_move"]
+    assert entry["ratio"] == 1.5 > 1 + DEFAULT_THRESHOLD
+    assert entry["regression"] is False
+
+
+def test_slowdown_past_threshold_and_noise_is_a_regression():
+    baseline = _results(make_move=(100.0, 2.0), play_game=(1000.0, 5.0))
+    results = _results(make_move=(150.0, 3.0), play_game=(1200.0, 5.0))
+    comparison = compare_results(results, baseline)
+    assert comparison["make_move"] == {"baseline_ns": 100.0, "best_ns": 150.0, "ratio": 1.5, "regression": True}
+
+    # 20% slower is well past the noise but within the default threshold, and past a tighter one
+    assert comparison["play_game"]["regression"] is False
+    assert compare_results(results, baseline, threshold=0.1)["play_game"]["regression"] is True
+
+    lines = format_comparison(comparison)
+    assert lines[1].startswith("make_move") and lines[1].endswith("REGRESSION")
+    assert not lines[2].endswith("REGRESSION")
+
+
+def test_benchmark_missing_from_baseline_is_skipped():
+    baseline = _results(make_move=(100.0, 1.0))
+    results = _results(make_move=(101.0, 1.0), can_capture=(10000.0, 1.0))
+    assert list(compare_results(results, baseline)) == ["make_move"]
+    assert compare_results(results, {}) == {}
+
+
+def test_results_compare_against_themselves():
+    results = run_benchmarks(["get_checker_details"], 2)
+    entry = results["benchmarks"]["get_checker_details"]
+    assert entry["best_ns"] <= entry["mean_ns"]
+    assert compare_results(results, results) == {
+        "get_checker_details": {"baseline_ns": entry["best_ns"], "best_ns": entry["best_ns"], "ratio": 1.0,
+                                "regression": False}}
@@ -0,0 +1,88 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that a game rebuilt from its move journal matches the game that wrote it, with
+#              taken back moves, a journal started from a loaded position and a journal cut short mid-word.
+
+import random
+
+import pytest
+
+from CheckerJournal import MoveJournal, read_journal, replay_journal
+
+
+def _state(game):
+    """Function that returns the parts of a game a journal replay must rebuild, as a tuple that can be compared."""
+    players = tuple((player.get_name(), player.get_checker_color(), player.get_captured_pieces_count(),
+                     player.get_king_count(), player.get_triple_king_count())
+                    for player in game.get_players().values())
+    return (game.snapshot(), game.position_hash(), game.get_turn(), game._game_won, game._winner, players,
+            list(game.get_move_history()))
+
+
+@pytest.mark.parametrize("start", [None, "triple_kings", "capture_chain", "promotion"])
+@pytest.mark.parametrize("seed", range(3))
+def test_replay_matches_played_game(tmp_path, new_game, start, seed):
+    game = new_game(start)
+    path = tmp_path / "game.journal"
+    journal = MoveJournal(str(path), game.get_players().values(), game.snapshot())
+    game.set_journal(journal)
+
+    generator = random.Random(seed)
+    for _ in range(120):
+        if game._game_won is True:
+            break
+        name = game.get_turn()
+        game.play_game(name, *generator.choice(sorted(game.legal_moves(name))))
+        if generator.random() < 0.1:
+            game.unmake_move()
+    journal.close()
+
+    replayed = replay_journal(str(path))
+    assert _state(replayed) == _state(game)
+
+
+def test_replay_stops_at_last_whole_word(tmp_path, new_game, play_random):
+    game = new_game()
+    path = tmp_path / "game.journal"
+    journal = MoveJournal(str(path), game.get_players().values(), game.snapshot())
+    game.set_journal(journal)
+    play_random(game, 7, 30)
+    journal.close()
+    with open(path, "ab") as file:
+        file.write(b"\x01")
+
+    assert _state(replay_journal(str(path))) == _state(game)
+    with open(path, "rb") as file:
+        players, position, words = read_journal(file)
+        assert players == [("Black", "Black"), ("White", "White")]
+        assert position == new_game().snapshot()
+        assert len(list(words)) == journal.get_hop_count() == 30
+
+
+def test_journal_header_is_checked(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        replay_journal(str(path))
+
+
+def test_replay_settles_a_blocked_win(tmp_path, new_game):
+    game = new_game()
+    board = [[None] * 8 for _ in range(8)]
+    board[6][1] = "White"
+    board[7][0], board[5][2], board[6][3] = "Black", "Black", "Black_king"
+    game.load_board(board)
+    path = tmp_path / "game.journal"
+    journal = MoveJournal(str(path), game.get_players().values(), game.snapshot())
+    game.set_journal(journal)
+    game.play_game("Black", (6, 3), (7, 2))
+    assert game.game_winner() == "Black has won the game!"
+    journal.close()
+
+    replayed = replay_journal(str(path))
+    assert _state(replayed) == _state(game)
+
+    # Taking the blocking move back ends the win, in the replay as in the game
+    replayed.unmake_move()
+    assert replayed.game_winner() == "Game has not ended."
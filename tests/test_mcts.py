@@ -0,0 +1,40 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks the edges of the MCTS search budgets: the smallest budget still runs one playout
+#              and returns a legal hop, and a search given no budget at all runs DEFAULT_PLAYOUTS rather than forever.
+
+import pytest
+
+import CheckerMCTS
+from CheckerMCTS import MCTSEngine
+from CheckersGame import MCTS
+
+
+def _legal(game):
+    """Function that returns the set of (start, destination) index pairs of the legal hops of the side to move."""
+    return {(start, destination) for start, destination, _ in game._generate_hops(game.get_turn())}
+
+
+@pytest.mark.parametrize("playouts", [0, -3, 1])
+def test_mcts_runs_at_least_one_playout(new_game, playouts):
+    game = new_game()
+    engine = MCTSEngine(game, seed=1)
+    hop = engine.search(game.get_turn(), playouts)
+    assert hop[:2] in _legal(game)
+    assert engine.get_playouts() == 1
+
+
+def test_mcts_without_budgets_runs_default_playouts(new_game, monkeypatch):
+    monkeypatch.setattr(CheckerMCTS, "DEFAULT_PLAYOUTS", 30)
+    game = new_game()
+    before = game.snapshot()
+    engine = MCTSEngine(game, seed=2)
+    hop = engine.search(game.get_turn(), None, None)
+    assert hop[:2] in _legal(game)
+    assert engine.get_playouts() == 30
+    assert game.snapshot() == before
+
+    # best_move leaves the budget to the engine
+    assert game.best_move("Black", None, backend=MCTS) in game.legal_moves("Black")
+    assert game.get_search_stats()["playouts"] == 30
@@ -0,0 +1,124 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that play_game and unmake_move are exact inverses, restoring the board, its
+#              incrementally kept hash and piece counts, the turn and the Player data members, and that play_game and
+#              play_sequence raise the documented exceptions without changing the game.
+
+import random
+
+import pytest
+
+from CheckerGameLogic import InvalidSquare
+from CheckersGame import Checkers, InvalidPlayer, OutOfTurn
+
+
+def _state(game):
+    """Function that returns everything unmake_move must restore, as a tuple that can be compared."""
+    players = tuple((player.get_name(), player.get_captured_pieces_count(), player.get_king_count(),
+                     player.get_triple_king_count()) for player in game.get_players().values())
+    return (game.snapshot(), game.position_hash(), game.get_turn(), game.get_piece_counts("Black"),
+            game.get_piece_counts("White"), players, len(game.get_move_history()))
+
+
+@pytest.mark.parametrize("start", [None, "flying_kings", "triple_kings", "capture_chain", "promotion"])
+@pytest.mark.parametrize("seed", range(4))
+def test_unmake_move_restores_every_hop(new_game, start, seed):
+    game = new_game(start)
+    generator = random.Random(seed)
+    states = []
+    while len(states) < 150 and game._game_won is False:
+        states.append(_state(game))
+        name = game.get_turn()
+        game.play_game(name, *generator.choice(sorted(game.legal_moves(name))))
+
+        # The incrementally kept hash and counts agree with a game built from scratch
+        rebuilt = Checkers.from_snapshot(game.snapshot())
+        assert rebuilt.position_hash() == game.position_hash()
+        for color in ("Black", "White"):
+            assert rebuilt.get_piece_counts(color) == game.get_piece_counts(color)
+
+    while states:
+        game.unmake_move()
+        assert _state(game) == states.pop()
+    assert game.unmake_move() is None
+
+
+def test_promotion_counters_round_trip(new_game):
+    game = new_game("promotion")
+    player = game.get_players()["Black"]
+    game.play_game("Black", (1, 0), (0, 1))
+    assert game.get_checker_details((0, 1)) == "Black_king"
+    assert player.get_king_count() == 1
+    game.unmake_move()
+    assert game.get_checker_details((1, 0)) == "Black"
+    assert player.get_king_count() == 0
+
+
+def test_play_game_exceptions_leave_game_unchanged(new_game):
+    game = new_game()
+    before = _state(game)
+    cases = [(InvalidPlayer, "Nobody", (5, 0), (4, 1)),
+             (InvalidSquare, "Black", (8, 1), (4, 1)),
+             (InvalidSquare, "Black", (5, 0), (4, 9)),
+             (OutOfTurn, "White", (2, 1), (3, 0)),
+             (InvalidSquare, "Black", (2, 1), (3, 0)),
+             (InvalidSquare, "Black", (4, 1), (3, 0)),
+             (InvalidSquare, "Black", (5, 0), (3, 2)),
+             (InvalidSquare, "Black", (5, 0), (6, 1))]
+    for exception, name, start, destination in cases:
+        with pytest.raises(exception):
+            game.play_game(name, start, destination)
+        assert _state(game) == before
+
+
+def test_capture_is_mandatory(new_game):
+    game = new_game("capture_chain")
+    with pytest.raises(InvalidSquare):
+        game.play_game("Black", (5, 0), (4, 1))
+    assert game.legal_moves("Black") == [((5, 0), (3, 2))]
+
+
+def test_play_sequence_reverts_a_sequence_stopped_early(new_game):
+    game = new_game("capture_chain")
+    before = _state(game)
+    sequence = max(game.capture_sequences((5, 0)), key=len)
+    assert len(sequence) > 2
+    with pytest.raises(InvalidSquare):
+        game.play_sequence("Black", sequence[:2])
+    assert _state(game) == before
+
+    game.play_sequence("Black", sequence)
+    assert game.get_turn() == "White"
+    assert game.get_players()["Black"].get_captured_pieces_count() == len(sequence) - 1
+
+
+def test_move_after_game_won_returns_winner(new_game):
+    game = new_game()
+    board = [[None] * 8 for _ in range(8)]
+    board[5][2], board[4][1] = "Black", "White"
+    game.load_board(board)
+    game.play_game("Black", (5, 2), (3, 0))
+    assert game.game_winner() == "Black has won the game!"
+    before = _state(game)
+    assert game.play_game("White", (0, 1), (1, 0)) == game.game_winner()
+    assert _state(game) == before
+
+
+def test_blocking_the_last_move_wins(new_game):
+    game = new_game()
+    board = [[None] * 8 for _ in range(8)]
+    board[6][1] = "White"
+    board[7][0], board[5][2], board[6][3] = "Black", "Black", "Black_king"
+    game.load_board(board)
+    before = _state(game)
+
+    # The king fills the last empty square in front of the "White" pawn, which still stands on the board
+    game.play_game("Black", (6, 3), (7, 2))
+    assert game.get_checker_details((6, 1)) == "White"
+    assert game.has_legal_move("White") is False
+    assert game.game_winner() == "Black has won the game!"
+
+    game.unmake_move()
+    assert _state(game) == before
+    assert game.game_winner() == "Game has not ended."
@@ -0,0 +1,57 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that an opening book ranks its moves by score per game among the moves played
+#              often enough, and that books built from self-play search by default rather than playing randomly.
+
+import random
+
+import CheckerOpeningBook
+from CheckerOpeningBook import (DEFAULT_BOOK_SEARCH_NODES, OpeningBook, book_entries, self_play_games,
+                                write_opening_book)
+from CheckerTables import SQUARE_LOCATION
+
+
+def _locations(move):
+    """Function that returns a (start, destination) tuple of square indices as a tuple of (row, column) tuples."""
+    return SQUARE_LOCATION[move[0]], SQUARE_LOCATION[move[1]]
+
+
+def test_book_ranks_by_score_per_game(tmp_path, new_game):
+    popular, strong, rare = ((5, 0), (4, 1)), ((5, 2), (4, 3)), ((5, 4), (4, 5))
+    games = [([popular], "White")] * 12 + [([popular], "Black")] * 2 + [([strong], "Black")] * 8 + \
+        [([rare], "Black")] * 3
+    path = tmp_path / "book.bin"
+    write_opening_book(str(path), book_entries(games))
+    book = OpeningBook(str(path))
+    try:
+        game = new_game()
+        game.set_opening_book(book)
+        position_hash = game.position_hash()
+        assert len(book.probe(position_hash)) == 3
+
+        assert _locations(book.choose_move(position_hash)) == strong
+        assert game.book_move("Black") == strong
+        assert _locations(book.choose_move(position_hash, min_games=10)) == popular
+        assert book.choose_move(position_hash, min_games=100) is None
+
+        # Equal points per game go to the most played move
+        assert _locations(book.choose_move(position_hash, min_games=1)) == strong
+
+        generator = random.Random(5)
+        chosen = {book.choose_move(position_hash, generator) for _ in range(50)}
+        assert {_locations(move) for move in chosen} == {popular, strong}
+    finally:
+        book.close()
+
+
+def test_self_play_games_search_by_default(monkeypatch):
+    calls = []
+
+    def run_self_play(games, processes, **options):
+        calls.append(options)
+        return iter(())
+
+    monkeypatch.setattr(CheckerOpeningBook, "run_self_play", run_self_play)
+    assert list(self_play_games(4)) == []
+    assert calls[0]["search_nodes"] == DEFAULT_BOOK_SEARCH_NODES > 0
@@ -0,0 +1,65 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that games written as PDN read back to the same moves, tags and result, and
+#              replay, checked or unchecked, to the same position as the game that was written.
+
+import io
+
+import pytest
+
+from CheckerPDN import game_to_pdn, pdn_location, pdn_square, read_pdn, replay_pdn_game, write_pdn
+
+
+def _state(game):
+    """Function that returns the parts of a game a PDN replay must rebuild, as a tuple that can be compared."""
+    return game.snapshot(), game.get_turn(), game._game_won, game._winner
+
+
+def test_square_numbers_round_trip():
+    for number in range(1, 33):
+        assert pdn_square(pdn_location(number)) == number
+    assert pdn_location(1) == (7, 6)
+    assert pdn_location(32) == (0, 1)
+    with pytest.raises(ValueError):
+        pdn_location(33)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_written_games_read_and_replay(new_game, play_random, seed):
+    games = []
+    for offset in range(3):
+        game = new_game()
+        play_random(game, seed * 10 + offset, 400)
+        games.append(game)
+
+    file = io.StringIO()
+    tags = {"Event": "Test", "Round": "1"}
+    assert write_pdn(file, (game_to_pdn(game, tags) for game in games)) == len(games)
+    file.seek(0)
+    read = list(read_pdn(file))
+    assert len(read) == len(games)
+
+    for game, pdn_game in zip(games, read):
+        written, _ = game_to_pdn(game, tags)
+        assert pdn_game.get_moves() == written.get_moves()
+        assert pdn_game.get_result() == written.get_result()
+        assert pdn_game.get_tags()["Event"] == "Test"
+        assert pdn_game.get_winner() == game._winner
+        assert _state(replay_pdn_game(pdn_game)) == _state(game)
+        assert _state(replay_pdn_game(pdn_game, validate=False)) == _state(game)
+
+
+def test_reads_comments_variations_and_short_captures():
+    text = ('[Event "Example"]\n[Black "Ann"]\n[White "Bob"]\n'
+            '1. 11-15 {opening} 22-18 (1... 23-19) 2. 15x22 ; to end of line\n'
+            '25x18 *\n')
+    pdn_game, = read_pdn(io.StringIO(text))
+    assert pdn_game.get_moves() == [[11, 15], [22, 18], [15, 22], [25, 18]]
+    assert pdn_game.get_result() == "*"
+
+    game = replay_pdn_game(pdn_game)
+    assert sorted(game.get_players()) == ["Ann", "Bob"]
+    assert game.get_turn() == "Black"
+    assert game.get_piece_counts("Black") == (11, 0, 0)
+    assert game.get_piece_counts("White") == (11, 0, 0)
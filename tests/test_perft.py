@@ -0,0 +1,168 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks the move generator's node counts against references that do not come from it.
+#              The initial layout is checked against the published English draughts perft counts, which this variant
+#              shares for as long as no piece has been promoted. The variant positions are checked against a slow
+#              reference generator written straight from the rules on a dictionary of squares, sharing no code or
+#              tables with "GameLogic".
+
+import pytest
+
+from CheckerBitboard import square_location
+from CheckerPerft import REFERENCE_POSITIONS, divide, load_reference_position, parse_diagram, perft
+
+# Published English draughts perft counts of the initial layout, a whole capture sequence counting as one move
+PUBLISHED_MOVE_COUNTS = {1: 7, 2: 49, 3: 302, 4: 1469, 5: 7361, 6: 36768, 7: 179740}
+
+# No capture sequence of more than one hop can be played within 6 plies, so hop counts match up to there
+PUBLISHED_HOP_DEPTH = 6
+
+_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+_FORWARD = {"Black": -1, "White": 1}
+_PROMOTIONS = {("Black", "pawn"): (0, "king"), ("Black", "king"): (7, "triple"),
+               ("White", "pawn"): (7, "king"), ("White", "king"): (0, "triple")}
+
+
+def _reference_board(rows):
+    """Function that returns a diagram as a dictionary of (row, column) to (color, rank) for every occupied square."""
+    ranks = {"": "pawn", "_king": "king", "_Triple_King": "triple"}
+    board = {}
+    for row, pieces in enumerate(parse_diagram(rows)):
+        for column, piece in enumerate(pieces):
+            if piece is not None:
+                color = piece[:5]
+                board[(row, column)] = (color, ranks[piece[5:]])
+    return board
+
+
+def _on_board(location):
+    """Function that returns boolean True if a (row, column) tuple is on the board."""
+    return 0 <= location[0] <= 7 and 0 <= location[1] <= 7
+
+
+def _reference_hops(board, color, capture_from=None):
+    """
+    Function that returns the legal hops of the color as (start, destination, captured squares) tuples, read from the
+    rules: pawns step and capture one square forwards, kings step one square any way and capture the first piece on a
+    diagonal if it is an enemy, landing on any empty square behind it, triple kings also capture two adjacent enemies
+    at once and jump a friendly piece. Captures are mandatory, and during a sequence only capture_from may capture.
+    """
+    captures, quiet = [], []
+    for start, (piece_color, rank) in board.items():
+        if piece_color != color or capture_from not in (None, start):
+            continue
+        directions = ((_FORWARD[color], -1), (_FORWARD[color], 1)) if rank == "pawn" else _DIRECTIONS
+        for row_step, column_step in directions:
+            ray = []
+            location = (start[0] + row_step, start[1] + column_step)
+            while _on_board(location):
+                ray.append(location)
+                location = (location[0] + row_step, location[1] + column_step)
+            if ray and ray[0] not in board:
+                quiet.append((start, ray[0], ()))
+
+            if rank == "pawn":
+                if len(ray) > 1 and ray[0] in board and board[ray[0]][0] != color and ray[1] not in board:
+                    captures.append((start, ray[1], (ray[0],)))
+                continue
+
+            # The first piece along the diagonal, and what may be jumped with it
+            occupied = [distance for distance, location in enumerate(ray) if location in board]
+            if not occupied:
+                continue
+            first = occupied[0]
+            friendly = board[ray[first]][0] == color
+            if friendly and rank != "triple":
+                continue
+            jumped = (ray[first],)
+            if not friendly and rank == "triple" and first + 1 < len(ray) and ray[first + 1] in board \
+                    and board[ray[first + 1]][0] != color:
+                jumped += (ray[first + 1],)
+            for location in ray[first + len(jumped):]:
+                if location in board:
+                    break
+                if friendly:
+                    quiet.append((start, location, ()))
+                else:
+                    captures.append((start, location, jumped))
+    if capture_from is not None:
+        return captures
+    return captures or quiet
+
+
+def _reference_perft(board, color, depth, capture_from=None):
+    """Function that counts the leaf nodes of the reference move tree, one level per hop like perft."""
+    if depth == 0:
+        return 1
+    nodes = 0
+    for start, destination, jumped in _reference_hops(board, color, capture_from):
+        color_moved, rank = board[start]
+        child = {location: piece for location, piece in board.items() if location != start and location not in jumped}
+        row, new_rank = _PROMOTIONS.get((color_moved, rank), (None, rank))
+        child[destination] = (color_moved, new_rank if destination[0] == row else rank)
+        if jumped and _reference_hops(child, color, destination):
+            nodes += _reference_perft(child, color, depth - 1, destination)
+        else:
+            nodes += _reference_perft(child, "White" if color == "Black" else "Black", depth - 1)
+    return nodes
+
+
+def _move_perft(game, depth):
+    """Function that counts the leaf nodes of a Checkers game's move tree, a whole capture sequence being one move."""
+    name = game.get_turn()
+    moves = []
+    for index in range(32):
+        location = square_location(index)
+        piece = game.get_checker_details(location)
+        if piece is not None and piece.startswith(name):
+            moves.extend(game.capture_sequences(location))
+    moves = moves or [list(move) for move in game.legal_moves(name)]
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        history_length = len(game.get_move_history())
+        game.play_sequence(name, move)
+        nodes += _move_perft(game, depth - 1)
+        while len(game.get_move_history()) > history_length:
+            game.unmake_move()
+    return nodes
+
+
+@pytest.mark.parametrize("depth", sorted(PUBLISHED_MOVE_COUNTS))
+def test_initial_move_counts_match_published(new_game, depth):
+    assert _move_perft(new_game(), depth) == PUBLISHED_MOVE_COUNTS[depth]
+
+
+@pytest.mark.parametrize("depth", range(1, PUBLISHED_HOP_DEPTH + 1))
+def test_initial_hop_counts_match_published(depth):
+    game, color = load_reference_position("initial")
+    assert perft(game, color, depth) == PUBLISHED_MOVE_COUNTS[depth]
+
+
+@pytest.mark.parametrize("name", sorted(REFERENCE_POSITIONS))
+def test_reference_counts_match_rules(name):
+    rows, color, counts = REFERENCE_POSITIONS[name]
+    board = _reference_board(rows)
+    game, _ = load_reference_position(name)
+    for depth, expected in sorted(counts.items()):
+        assert _reference_perft(board, color, depth) == expected, depth
+        assert perft(game, color, depth) == expected, depth
+
+
+def test_divide_sums_to_perft():
+    game, color = load_reference_position("triple_kings")
+    results = divide(game, color, 4)
+    assert sum(nodes for _, _, nodes in results) == perft(game, color, 4)
+    assert len(results) == perft(game, color, 1)
+
+
+def test_depth_is_validated():
+    game, color = load_reference_position("initial")
+    assert perft(game, color, 0) == 1
+    with pytest.raises(ValueError):
+        perft(game, color, -1)
+    with pytest.raises(ValueError):
+        divide(game, color, 0)
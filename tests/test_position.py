@@ -0,0 +1,76 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that Position snapshots survive bytes, pickle and copy round trips unchanged, stay
+#              immutable, and load back into a game that plays on exactly like the original.
+
+import copy
+import pickle
+
+import pytest
+
+from CheckerGameLogic import POSITION_BYTES, Position
+from CheckersGame import Checkers
+
+
+@pytest.fixture
+def positions(new_game, play_random):
+    """Fixture that returns snapshots of games in progress, including one taken in the middle of a capture."""
+    snapshots = [new_game().snapshot()]
+    for name in ("flying_kings", "triple_kings", "promotion"):
+        game = new_game(name)
+        play_random(game, 3, 12)
+        snapshots.append(game.snapshot())
+
+    game = new_game("capture_chain")
+    sequence = max(game.capture_sequences((5, 0)), key=len)
+    game.play_game("Black", sequence[0], sequence[1])
+    snapshots.append(game.snapshot())
+    return snapshots
+
+
+def test_capture_square_is_kept(positions):
+    assert positions[-1].get_capture_square() is not None
+    assert positions[-1].get_turn() == "Black"
+
+
+def test_bytes_round_trip(positions):
+    for position in positions:
+        data = position.to_bytes()
+        assert len(data) == POSITION_BYTES
+        assert Position.from_bytes(data) == position
+
+
+def test_pickle_and_copy_round_trip(positions):
+    for position in positions:
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(position, protocol))
+            assert restored == position
+            assert hash(restored) == hash(position)
+            assert restored.get_masks() == position.get_masks()
+            assert restored.get_capture_square() == position.get_capture_square()
+        assert copy.copy(position) == position
+        assert copy.deepcopy({"position": position})["position"] == position
+
+
+def test_positions_are_immutable(positions):
+    with pytest.raises(AttributeError):
+        positions[0]._packed = 0
+    assert len({positions[0], Position.from_bytes(positions[0].to_bytes())}) == 1
+
+
+def test_snapshot_loads_into_an_equal_game(positions, new_game, play_random):
+    for position in positions:
+        game = Checkers.from_snapshot(position)
+        assert game.snapshot() == position
+        assert game.get_turn() == position.get_turn()
+
+    original = new_game()
+    play_random(original, 11, 20)
+    restored = Checkers.from_snapshot(pickle.loads(pickle.dumps(original.snapshot())))
+    restored.create_player("Black", "Black")
+    restored.create_player("White", "White")
+    assert restored.position_hash() == original.position_hash()
+    play_random(original, 12, 20)
+    play_random(restored, 12, 20)
+    assert restored.snapshot() == original.snapshot()
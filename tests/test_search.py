@@ -0,0 +1,41 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks the "SearchEngine" budgets: even the smallest time or node budget completes the
+#              first iteration and returns a legal move, a search leaves the board as it found it, and a forced
+#              capture is played.
+
+import pytest
+
+from CheckerSearch import SearchEngine
+
+
+def _legal(game):
+    """Function that returns the set of (start, destination) index pairs of the legal hops of the side to move."""
+    return {(start, destination) for start, destination, _ in game._generate_hops(game.get_turn())}
+
+
+@pytest.mark.parametrize("node_limit, time_limit", [(1, None), (None, 0.0), (0, 0.0)])
+def test_smallest_budget_completes_depth_one(new_game, node_limit, time_limit):
+    game = new_game("triple_kings")
+    engine = SearchEngine(game, 1)
+    hop = engine.search(game.get_turn(), time_limit, node_limit=node_limit)
+    assert hop[:2] in _legal(game)
+    assert engine.get_depth() >= 1
+
+
+def test_search_restores_the_board(new_game):
+    game = new_game()
+    before = (game.snapshot(), game.position_hash(), len(game.get_move_history()))
+    engine = SearchEngine(game, 1)
+    hop = engine.search("Black", None, 4)
+    assert engine.get_depth() == 4
+    assert engine.get_nodes() > 0
+    assert hop[:2] in _legal(game)
+    assert (game.snapshot(), game.position_hash(), len(game.get_move_history())) == before
+
+
+def test_best_move_plays_a_forced_capture(new_game):
+    game = new_game("capture_chain")
+    assert game.best_move("Black", None, 3) == ((5, 0), (3, 2))
+    assert game.best_move("White") is None
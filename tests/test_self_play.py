@@ -0,0 +1,41 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks that a self-play batch is decided by its seed alone: the same seed gives the same
+#              records whatever the worker count or chunk size, whether games are played randomly or searched.
+
+import pytest
+
+from CheckerSelfPlay import play_self_play_game, run_self_play
+
+
+def _batch(games, processes, chunk_size, seed, search_nodes=0, max_hops=120):
+    """Function that returns the records of a self-play batch with hops, sorted by game index."""
+    return sorted(run_self_play(games, processes, chunk_size, seed=seed, max_hops=max_hops, search_nodes=search_nodes,
+                                record_hops=True))
+
+
+@pytest.mark.parametrize("games, search_nodes, max_hops", [(8, 0, 120), (2, 50, 24)])
+def test_records_do_not_depend_on_process_count(games, search_nodes, max_hops):
+    single = _batch(games, 1, 1, 7, search_nodes, max_hops)
+    assert [record[0] for record in single] == list(range(games))
+    assert _batch(games, 2, 1, 7, search_nodes, max_hops) == single
+    assert _batch(games, 2, 2, 7, search_nodes, max_hops) == single
+
+
+def test_records_follow_the_seed():
+    first = _batch(6, 1, 1, 1)
+    assert _batch(6, 1, 1, 1) == first
+    assert _batch(6, 1, 1, 2) != first
+    assert play_self_play_game(4, seed=1, max_hops=120, record_hops=True) == first[4]
+
+
+def test_record_fields():
+    game_index, winner, hops_played, black_captures, white_captures, hops = \
+        play_self_play_game(0, seed=5, max_hops=60, record_hops=True)
+    assert game_index == 0
+    assert winner in ("Black", "White", None)
+    assert hops_played == len(hops) <= 60
+    assert 0 <= black_captures <= 12 and 0 <= white_captures <= 12
+    assert play_self_play_game(0, seed=5, max_hops=60) == (game_index, winner, hops_played, black_captures,
+                                                           white_captures)
@@ -0,0 +1,161 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks the "GameServer" newline-delimited JSON protocol: requests round trip over a real
+#              socket in order, malformed lines are answered with errors without dropping the connection, idle
+#              sessions are evicted, and a connection is not read from while its last response is still draining.
+
+import asyncio
+import json
+import time
+
+from CheckerServer import MAX_LINE_BYTES, GameServer
+
+
+class _Writer:
+    """Represents a stand-in for an asyncio stream writer whose drain waits until the test releases it."""
+
+    def __init__(self, released=True):
+        self.lines = []
+        self.drains = 0
+        self.closed = False
+        self.release = asyncio.Event()
+        if released:
+            self.release.set()
+
+    def write(self, data):
+        self.lines.extend(json.loads(line) for line in data.splitlines())
+
+    async def drain(self):
+        self.drains += 1
+        await self.release.wait()
+
+    def close(self):
+        self.closed = True
+
+    async def wait_closed(self):
+        pass
+
+
+def _reader(data, limit=MAX_LINE_BYTES):
+    """Function that returns an asyncio stream reader that reads the bytes data and then the end of the stream."""
+    reader = asyncio.StreamReader(limit=limit)
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+def _lines(*messages):
+    """Function that returns the messages encoded as newline-delimited JSON, passing bytes messages through as is."""
+    return b"".join(message if isinstance(message, bytes) else json.dumps(message).encode() + b"\n"
+                    for message in messages)
+
+
+def test_requests_round_trip_over_a_socket():
+    async def run():
+        server = GameServer()
+        listener = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0, limit=MAX_LINE_BYTES)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(_lines({"id": 1, "op": "new_game"}))
+            session = json.loads(await reader.readline())["result"]
+
+            # Several requests in one write are answered one line each, in order
+            writer.write(_lines({"id": 2, "op": "create_player", "session": session, "player_name": "Ann",
+                                 "piece_color": "Black"},
+                                {"id": 3, "op": "create_player", "session": session, "player_name": "Bob",
+                                 "piece_color": "White"},
+                                {"id": 4, "op": "play_game", "session": session, "player_name": "Ann",
+                                 "starting_square_location": [5, 0], "destination_square_location": [4, 1]},
+                                {"id": 5, "op": "get_checker_details", "session": session, "square_location": [4, 1]},
+                                {"id": 6, "op": "play_game", "session": session, "player_name": "Ann",
+                                 "starting_square_location": [5, 2], "destination_square_location": [4, 3]},
+                                {"id": 7, "op": "stats"}))
+            responses = [json.loads(await reader.readline()) for _ in range(6)]
+            writer.close()
+            await writer.wait_closed()
+
+        assert [response["id"] for response in responses] == [2, 3, 4, 5, 6, 7]
+        assert [response["ok"] for response in responses] == [True, True, True, True, False, True]
+        assert responses[2]["result"] == 0
+        assert responses[3]["result"] == "Black"
+        assert responses[4]["error"] == "OutOfTurn"
+        assert responses[5]["result"]["sessions"] == 1 and responses[5]["result"]["requests"] == 7
+
+    asyncio.run(run())
+
+
+def test_malformed_lines_are_answered_and_the_connection_kept():
+    async def run():
+        server = GameServer()
+        writer = _Writer()
+        data = _lines(b"{not json\n", b"\n", [1, 2], {"id": 1, "op": ["new_game"]}, {"id": 2, "op": "fly"},
+                      {"id": 3, "op": "game_winner", "session": {"a": 1}},
+                      {"id": 4, "op": "get_checker_details", "session": "none", "square_location": [0, 1]},
+                      {"id": 5, "op": "new_game"})
+        await server.handle_connection(_reader(data), writer)
+        return writer
+
+    writer = asyncio.run(run())
+    assert [response["error"] for response in writer.lines[:-1]] == ["RequestError"] * 6
+    assert [response["id"] for response in writer.lines] == [None, None, 1, 2, 3, 4, 5]
+    assert writer.lines[-1]["ok"] is True
+    assert writer.closed is True
+
+
+def test_over_long_line_ends_the_connection():
+    async def run():
+        writer = _Writer()
+        data = b'{"op": "' + b"x" * 200 + b'"}\n' + _lines({"op": "new_game"})
+        await GameServer().handle_connection(_reader(data, limit=64), writer)
+        return writer
+
+    writer = asyncio.run(run())
+    assert len(writer.lines) == 1
+    assert writer.lines[0]["error"] == "RequestError"
+    assert writer.closed is True
+
+
+def test_idle_sessions_are_evicted():
+    server = GameServer(idle_timeout=60.0, max_sessions=2)
+    first = server.handle_request({"op": "new_game"})["result"]
+    server.handle_request({"op": "new_game"})
+    assert server.handle_request({"op": "new_game"})["message"] == "server is full"
+
+    # Using a session keeps it, the sessions past the timeout go
+    assert server.evict_idle_sessions(time.monotonic() + 30.0) == 0
+    server._sessions[first]._last_used += 45.0
+    assert server.evict_idle_sessions(time.monotonic() + 90.0) == 1
+    assert server.get_session_count() == 1
+    assert server.handle_request({"op": "game_winner", "session": first})["ok"] is True
+
+    # A full server evicts idle sessions before refusing a new game
+    server.handle_request({"op": "new_game"})
+    for session in server._sessions.values():
+        session._last_used -= 120.0
+    assert server.handle_request({"op": "new_game"})["ok"] is True
+    assert server.get_session_count() == 1
+    assert server.handle_request({"op": "stats"})["result"]["evicted"] == 3
+
+
+def test_no_line_is_read_while_a_response_is_draining():
+    async def run():
+        server = GameServer()
+        writer = _Writer(released=False)
+        data = _lines(*({"id": number, "op": "stats"} for number in range(5)))
+        connection = asyncio.create_task(server.handle_connection(_reader(data), writer))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        # The first response waits on the socket, so the lines after it stay unread
+        assert len(writer.lines) == 1 and writer.drains == 1
+        assert server.handle_request({"op": "stats"})["result"]["requests"] == 2
+
+        writer.release.set()
+        await connection
+        return writer
+
+    writer = asyncio.run(run())
+    assert [response["id"] for response in writer.lines] == [0, 1, 2, 3, 4]
+    assert writer.drains == 5
@@ -0,0 +1,88 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks an endgame tablebase against the positions one move on. Every probed result must
+#              follow from the results of its successors, found through the public Checkers move methods with a
+#              capture sequence counting as one move: a win if some move leaves the opponent lost, a loss if every
+#              move leaves the opponent winning (or there is no move at all) and otherwise a draw.
+
+import random
+
+import pytest
+
+from CheckerBitboard import PIECES, square_location
+from CheckerGameLogic import Position
+from CheckerTablebase import DRAW, LOSS, TABLE_PIECES, WIN, Tablebase, build_tablebase
+from CheckersGame import Checkers
+
+TABLE_SIZE = 2
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory):
+    """Fixture that builds a small tablebase once for the module and returns it opened for probing."""
+    path = tmp_path_factory.mktemp("tablebase") / "table.bin"
+    build_tablebase(str(path), TABLE_SIZE)
+    table = Tablebase(str(path))
+    yield table
+    table.close()
+
+
+def _game(pieces, color):
+    """Function that returns a Checkers object holding the {square index: piece code} pieces with color to move."""
+    masks = [0] * len(PIECES)
+    for index, piece in pieces.items():
+        masks[PIECES.index(piece)] |= 1 << index
+    game = Checkers.from_snapshot(Position(masks, color))
+    game.create_player("Black", "Black")
+    game.create_player("White", "White")
+    return game
+
+
+def _successor_results(game, tablebase):
+    """Function that returns the tablebase entry of the position after every legal move, for the opponent."""
+    name = game.get_turn()
+    moves = []
+    for index in range(32):
+        location = square_location(index)
+        piece = game.get_checker_details(location)
+        if piece is not None and piece.startswith(name):
+            moves.extend(game.capture_sequences(location))
+    moves = moves or [list(move) for move in game.legal_moves(name)]
+
+    results = []
+    for move in moves:
+        game.play_sequence(name, move)
+        results.append(tablebase.probe(game, game.get_turn()))
+        while game.get_move_history():
+            game.unmake_move()
+    return results
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_probes_follow_from_successors(tablebase, seed):
+    generator = random.Random(seed)
+    for _ in range(100):
+        squares = generator.sample(range(32), generator.randint(1, TABLE_SIZE))
+        pieces = {index: generator.choice(TABLE_PIECES) for index in squares}
+        for color in ("Black", "White"):
+            game = _game(pieces, color)
+            result, distance = tablebase.probe(game, color)
+            successors = _successor_results(game, tablebase)
+            assert None not in successors
+            losses = [entry[1] for entry in successors if entry[0] == LOSS]
+            wins = [entry[1] for entry in successors if entry[0] == WIN]
+            if not successors:
+                assert (result, distance) == (LOSS, 0)
+            elif losses:
+                assert (result, distance) == (WIN, min(losses) + 1)
+            elif len(wins) == len(successors):
+                assert (result, distance) == (LOSS, max(wins) + 1)
+            else:
+                assert result == DRAW
+
+
+def test_positions_outside_the_table_are_not_covered(tablebase, new_game):
+    game = new_game()
+    assert tablebase.probe(game, "Black") is None
+    assert tablebase.get_max_pieces() == TABLE_SIZE
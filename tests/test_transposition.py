@@ -0,0 +1,98 @@
+# Author: Kevin Braman
+# GitHub username: kevinbraman92
+# Date: 10/17/2026
+# Description: This program checks the "TranspositionTable" bucket replacement scheme, its entry packing and its
+#              statistics, and that best_move searches with one table per game that set_table_size_mb resizes.
+
+import pytest
+
+from CheckerTransposition import EXACT, LOWER_BOUND, UPPER_BOUND, TranspositionTable
+
+# Keys that differ only above the bucket bits all land in the one bucket of a table too small for a second
+A, B, C, D = 1 << 40, 2 << 40, 3 << 40, 4 << 40
+
+
+@pytest.fixture
+def table():
+    """Fixture that returns a table of a single bucket, so every key competes for the same two slots."""
+    table = TranspositionTable(0)
+    assert table.get_slot_count() == 2
+    return table
+
+
+def test_entries_round_trip(table):
+    table.store(A, 9, LOWER_BOUND, -1234, (31, 0))
+    table.store(B, 200, UPPER_BOUND, 56, None)
+    assert table.probe(A) == (9, LOWER_BOUND, -1234, (31, 0))
+    assert table.probe(B) == (127, UPPER_BOUND, 56, None)
+    assert table.probe(C) is None
+
+
+def test_first_slot_prefers_depth_second_slot_always_replaced(table):
+    table.store(A, 5, EXACT, 1)
+    table.store(B, 3, EXACT, 2)
+    assert table.probe(A)[0] == 5 and table.probe(B)[0] == 3
+
+    # Shallower than the first slot: replaces whatever is in the second slot
+    table.store(C, 2, EXACT, 3)
+    assert table.probe(A)[0] == 5
+    assert table.probe(B) is None
+    assert table.probe(C)[0] == 2
+
+    # At least as deep as the first slot: takes it and pushes the old entry into the second slot
+    table.store(D, 5, EXACT, 4)
+    assert table.probe(D)[0] == 5
+    assert table.probe(A)[0] == 5
+    assert table.probe(C) is None
+
+    # The same position always overwrites its own entry, even with a shallower search
+    table.store(D, 1, UPPER_BOUND, 5)
+    assert table.probe(D) == (1, UPPER_BOUND, 5, None)
+    assert table.probe(A)[0] == 5
+
+
+def test_statistics_and_clear(table):
+    assert table.get_hit_rate() == 0.0
+    table.store(A, 1, EXACT, 0)
+    table.probe(A)
+    table.probe(B)
+    table.probe(A)
+    assert (table.get_probes(), table.get_hits(), table.get_stores()) == (3, 2, 1)
+    assert table.get_hit_rate() == pytest.approx(2 / 3)
+    assert table.get_fill_rate() == 0.5
+
+    table.clear()
+    assert (table.get_probes(), table.get_hits(), table.get_stores()) == (0, 0, 0)
+    assert table.probe(A) is None
+    assert table.get_fill_rate() == 0.0
+
+
+def test_size_is_rounded_down_to_whole_buckets():
+    assert TranspositionTable(1).get_size_mb() == 1
+    assert TranspositionTable(3).get_size_mb() == 2
+
+
+def test_best_move_shares_one_resizable_table(new_game):
+    game = new_game()
+    assert game.get_table_size_mb() == 16
+    game.set_table_size_mb(1)
+    game.best_move("Black", None, 3)
+    table = game._search_engine.get_table()
+    assert table.get_size_mb() == 1
+    assert table.get_stores() > 0
+
+    # The next search, by either side, reuses the same table and finds what the last one stored
+    game.play_game("Black", *game.best_move("Black", None, 3))
+    probes, hits = table.get_probes(), table.get_hits()
+    game.best_move("White", None, 3)
+    assert game._search_engine.get_table() is table
+    assert table.get_hits() > hits and table.get_probes() > probes
+
+    # Resizing swaps in an empty table of the new size for the same engine
+    engine = game._search_engine
+    game.set_table_size_mb(2)
+    assert game.get_table_size_mb() == 2
+    assert game._search_engine is engine
+    assert engine.get_table() is not table
+    assert engine.get_table().get_size_mb() == 2
+    assert engine.get_table().get_stores() == 0